@@ -0,0 +1,7 @@
+"""
+Benchmarks for the search test suite
+
+Each module exposes ``run(...) -> dict`` and a ``main()`` command-line entry point:
+
+    python -m benchmarks.bench_transcription_search --videos 5000
+"""
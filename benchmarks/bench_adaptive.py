@@ -0,0 +1,146 @@
+"""
+Adaptive page_limit benchmark
+
+Runs two workloads against the stand-in and compares static page sizes (5, 10
+and 50) with ``search_helpers.AdaptivePager``:
+
+- ``interactive``: each search reads its first 3 results
+- ``bulk``: each search reads its first 200 results
+
+Page latency has a fixed part (``LatencyModel.synthetic``) and a part that grows
+with the page (bodies paced to ``--transfer-rate``), like the live API. The
+adaptive pager first runs ``--warmup`` searches of the workload to tune itself.
+Reports time per search, time to the first result and requests per search.
+"""
+
+import itertools
+import time
+from typing import Dict, Optional, Sequence
+
+from search_helpers import AdaptivePager
+from standin import STANDIN_INDEX_MARENGO_27, LatencyModel, StandinServer
+
+from .common import base_parser, percentiles, write_results
+
+PARAMS = {
+    "index_id": STANDIN_INDEX_MARENGO_27,
+    "query_text": "water",
+    "search_options": ["visual", "audio"],
+}
+
+WORKLOADS = {"interactive": 3, "bulk": 200}
+
+STATIC_PAGE_LIMITS = (5, 10, 50)
+
+
+def _search(server, search, wanted: int):
+    """Consume ``wanted`` results; return (seconds, seconds to first, requests)."""
+    before = server.request_counts["search"] + server.request_counts["search_page"]
+    start = time.perf_counter()
+    first = None
+    for _ in itertools.islice(search(), wanted):
+        if first is None:
+            first = time.perf_counter() - start
+    elapsed = time.perf_counter() - start
+    requests = (
+        server.request_counts["search"] + server.request_counts["search_page"] - before
+    )
+    return elapsed, first or elapsed, requests
+
+
+def _measure(server, search, wanted: int, repeat: int) -> dict:
+    totals, firsts, requests = [], [], 0
+    for _ in range(repeat):
+        total, first, sent = _search(server, search, wanted)
+        totals.append(total)
+        firsts.append(first)
+        requests += sent
+    return {
+        "time_per_search": percentiles(totals),
+        "time_to_first_result": percentiles(firsts),
+        "requests_per_search": round(requests / max(repeat, 1), 2),
+    }
+
+
+def run(
+    repeat: int = 10,
+    warmup: int = 10,
+    median_s: float = 0.01,
+    transfer_rate: float = 200_000,
+    seed: int = 0,
+    workloads: Optional[Dict[str, int]] = None,
+    page_limits: Sequence[int] = STATIC_PAGE_LIMITS,
+) -> dict:
+    server = StandinServer.with_default_indexes(
+        seed=seed,
+        latency_model=LatencyModel.synthetic(
+            median_s=median_s, sigma=0.1, tail_fraction=0.0, seed=seed
+        ),
+        transfer_rate=transfer_rate,
+    )
+    client = server.make_client()
+
+    results = {}
+    for workload, wanted in (workloads or WORKLOADS).items():
+        cases = {}
+        for page_limit in page_limits:
+            cases[f"static_{page_limit}"] = _measure(
+                server,
+                lambda: client.search.query(page_limit=page_limit, **PARAMS),
+                wanted,
+                repeat,
+            )
+        pager = AdaptivePager(client)
+        for _ in range(warmup):
+            _search(server, lambda: pager.query(**PARAMS), wanted)
+        cases["adaptive"] = _measure(
+            server, lambda: pager.query(**PARAMS), wanted, repeat
+        )
+        cases["adaptive"]["page_limit"] = pager.tuner.page_limit
+        cases["adaptive"]["decisions"] = [
+            decision._asdict() for decision in pager.tuner.decisions
+        ]
+        results[workload] = {"wanted": wanted, "cases": cases}
+    return {
+        "median_s": median_s,
+        "transfer_rate": transfer_rate,
+        "workloads": results,
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--warmup", type=int, default=10, help="Searches the adaptive pager tunes on"
+    )
+    parser.add_argument(
+        "--median", type=float, default=0.01, help="Median fixed page latency (s)"
+    )
+    parser.add_argument(
+        "--transfer-rate", type=float, default=200_000, help="Body bytes per second"
+    )
+    args = parser.parse_args()
+
+    results = run(
+        repeat=min(args.repeat, 20),
+        warmup=args.warmup,
+        median_s=args.median,
+        transfer_rate=args.transfer_rate,
+        seed=args.seed,
+    )
+    for workload, data in results["workloads"].items():
+        print(f"{workload} ({data['wanted']} results per search)")
+        for name, stats in data["cases"].items():
+            label = name
+            if name == "adaptive":
+                label = f"adaptive ({stats['page_limit']})"
+            print(
+                f"  {label:14s} search p50={stats['time_per_search']['p50_ms']:.1f} ms  "
+                f"first result p50={stats['time_to_first_result']['p50_ms']:.1f} ms  "
+                f"{stats['requests_per_search']} requests"
+            )
+    print("Results written to", write_results("adaptive", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+SDK client-overhead microbenchmark
+
+Points the ``TwelveLabs`` client at the in-process stand-in (no network, no
+injected latency) and measures the client-side cost of ``search.query`` calls and
+of ``next_page`` requests, i.e. everything except the stand-in's own handler time:
+request building, multipart encoding, JSON decoding, pydantic model construction
+and pager bookkeeping.
+
+JSON decoding and model construction are also timed in isolation on captured
+response bodies; the remainder is attributed to request building, the httpx
+transport and pager bookkeeping. Memory is measured with tracemalloc: CPython
+has no allocation counter, so "allocations" are reported as the peak traced
+memory during a call and the blocks still held by the returned page.
+"""
+
+import json
+import time
+import tracemalloc
+from typing import List
+
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+from .common import (
+    TimedServer,
+    base_parser,
+    client_seconds,
+    percentiles,
+    write_results,
+)
+
+CASES = {
+    "clips_limit10": {
+        "query_text": "water",
+        "search_options": ["visual", "audio"],
+        "page_limit": 10,
+    },
+    "videos_limit50_metadata": {
+        "query_text": "water",
+        "search_options": ["visual", "audio"],
+        "group_by": "video",
+        "page_limit": 50,
+        "include_user_metadata": True,
+    },
+}
+
+
+def _decode_and_model_seconds(body: bytes, repeat: int):
+    from twelvelabs.core.pydantic_utilities import parse_obj_as
+    from twelvelabs.types.search_results import SearchResults
+
+    decode, model = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decoded = json.loads(body)
+        middle = time.perf_counter()
+        parse_obj_as(type_=SearchResults, object_=decoded)
+        end = time.perf_counter()
+        decode.append(middle - start)
+        model.append(end - middle)
+    return decode, model
+
+
+def _memory_per_call(func, repeat: int) -> dict:
+    peaks: List[int] = []
+    retained: List[int] = []
+    retained_blocks: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            before = tracemalloc.take_snapshot()
+            base, _ = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            result = func()
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            diff = after.compare_to(before, "filename")
+            peaks.append(peak - base)
+            retained.append(current - base)
+            retained_blocks.append(sum(stat.count_diff for stat in diff))
+            del result
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_kib_per_call": round(sum(peaks) / len(peaks) / 1024, 1),
+        "retained_kib_per_call": round(sum(retained) / len(retained) / 1024, 1),
+        "retained_blocks_per_call": round(sum(retained_blocks) / len(retained_blocks)),
+    }
+
+
+def _run_case(client, timed: TimedServer, params: dict, repeat: int) -> dict:
+    def query():
+        return client.search.query(index_id=STANDIN_INDEX_MARENGO_30, **params)
+
+    for _ in range(3):
+        query()
+
+    call_total, call_client, page_total, page_client = [], [], [], []
+    items = 0
+    cpu_start = time.process_time()
+    server_start = timed.seconds
+    for _ in range(repeat):
+        pager, total, client_only = client_seconds(timed, query)
+        call_total.append(total)
+        call_client.append(client_only)
+        items += len(pager.items or [])
+        if pager.has_next:
+            page, total, client_only = client_seconds(timed, pager.next_page)
+            page_total.append(total)
+            page_client.append(client_only)
+            items += len(page.items or [])
+    cpu_client = (time.process_time() - cpu_start) - (timed.seconds - server_start)
+    requests = len(call_total) + len(page_total)
+
+    timed.bodies.clear()
+    query().next_page()
+    decode, model = _decode_and_model_seconds(timed.bodies["POST"], repeat)
+
+    mean_client = sum(call_client) / len(call_client)
+    mean_decode = sum(decode) / len(decode)
+    mean_model = sum(model) / len(model)
+    return {
+        "items_per_page": round(items / requests, 1),
+        "response_kib": round(len(timed.bodies["POST"]) / 1024, 1),
+        "call_total": percentiles(call_total),
+        "call_client": percentiles(call_client),
+        "page_client": percentiles(page_client),
+        "breakdown_ms_per_call": {
+            "json_decode": round(mean_decode * 1000, 4),
+            "model_construction": round(mean_model * 1000, 4),
+            "request_transport_pager": round(
+                max(mean_client - mean_decode - mean_model, 0.0) * 1000, 4
+            ),
+        },
+        "client_requests_per_core_second": round(requests / max(cpu_client, 1e-9), 1),
+        "memory": _memory_per_call(query, min(repeat, 20)),
+    }
+
+
+def run(repeat: int = 200, videos: int = 500, seed: int = 0) -> dict:
+    server = StandinServer.with_default_indexes(num_videos=videos, seed=seed)
+    timed = TimedServer(server)
+    client = server.make_client()
+    return {
+        "videos": videos,
+        "cases": {
+            name: _run_case(client, timed, params, repeat)
+            for name, params in CASES.items()
+        },
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=500, help="Videos per index")
+    args = parser.parse_args()
+
+    results = run(repeat=args.repeat, videos=args.videos, seed=args.seed)
+    for name, stats in results["cases"].items():
+        breakdown = stats["breakdown_ms_per_call"]
+        print(
+            f"{name}: client p50={stats['call_client']['p50_ms']:.3f} ms/call, "
+            f"{stats['page_client']['p50_ms']:.3f} ms/page, "
+            f"{stats['client_requests_per_core_second']:.0f} req/s per core"
+        )
+        print(
+            f"  decode={breakdown['json_decode']:.3f} ms  "
+            f"models={breakdown['model_construction']:.3f} ms  "
+            f"request/transport/pager={breakdown['request_transport_pager']:.3f} ms  "
+            f"peak={stats['memory']['peak_kib_per_call']} KiB  "
+            f"retained blocks={stats['memory']['retained_blocks_per_call']}"
+        )
+    print(
+        "Results written to", write_results("client_overhead", results, args.output_dir)
+    )
+
+
+if __name__ == "__main__":
+    main()
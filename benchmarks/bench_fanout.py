@@ -0,0 +1,132 @@
+"""
+Fan-out search benchmark
+
+Searches several stand-in indexes with a heavy-tailed synthetic latency model
+(``LatencyModel.synthetic``) and compares the time to the merged top-k of:
+
+- ``sequential``: ``client.search.query`` on one index after the other, each
+  index's results read until k items (or its last page), then sorted by rank
+- ``fanout``: ``search_helpers.query_many`` with ``k``, first pages requested
+  concurrently and later pages only when the k-way merge reaches them
+
+Reports latency percentiles and the requests each approach sent.
+"""
+
+import itertools
+import time
+
+from search_helpers import by_rank, query_many
+from standin import (
+    MARENGO_27,
+    MARENGO_30,
+    LatencyModel,
+    SearchIndex,
+    StandinServer,
+    build_corpus,
+)
+
+from .common import base_parser, percentiles, write_results
+
+PARAMS = {"query_text": "water swimming", "search_options": ["visual", "audio"]}
+
+
+def _server(indexes: int, videos: int, median_s: float, seed: int) -> StandinServer:
+    models = itertools.cycle((MARENGO_27, MARENGO_30))
+    return StandinServer(
+        [
+            SearchIndex(
+                f"standin-fanout-{i}", next(models), build_corpus(videos, seed=seed + i)
+            )
+            for i in range(indexes)
+        ],
+        latency_model=LatencyModel.synthetic(median_s=median_s, seed=seed),
+    )
+
+
+def _sequential(client, index_ids, k: int, page_limit: int):
+    ranked = []
+    for index_id in index_ids:
+        pager = client.search.query(index_id=index_id, page_limit=page_limit, **PARAMS)
+        for position, item in enumerate(itertools.islice(pager, k), 1):
+            ranked.append((by_rank(item, position), index_id, item))
+    ranked.sort(key=lambda entry: entry[:2])
+    return ranked[:k]
+
+
+def _fanout(client, index_ids, k: int, page_limit: int):
+    return query_many(client, index_ids, k=k, page_limit=page_limit, **PARAMS).top()
+
+
+def run(
+    repeat: int = 30,
+    indexes: int = 4,
+    k: int = 20,
+    page_limit: int = 10,
+    median_s: float = 0.02,
+    videos: int = 200,
+    seed: int = 0,
+) -> dict:
+    server = _server(indexes, videos, median_s, seed)
+    client = server.make_client()
+    index_ids = list(server.indexes)
+
+    cases = {}
+    for name, func in (("sequential", _sequential), ("fanout", _fanout)):
+        before = sum(server.request_counts.values())
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(client, index_ids, k, page_limit)
+            samples.append(time.perf_counter() - start)
+        requests = sum(server.request_counts.values()) - before
+        cases[name] = {
+            "latency": percentiles(samples),
+            "requests_per_search": round(requests / max(repeat, 1), 2),
+        }
+    return {
+        "indexes": indexes,
+        "k": k,
+        "page_limit": page_limit,
+        "median_s": median_s,
+        "speedup_p50": round(
+            cases["sequential"]["latency"]["p50_ms"]
+            / max(cases["fanout"]["latency"]["p50_ms"], 1e-9),
+            2,
+        ),
+        "cases": cases,
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--indexes", type=int, default=4, help="Indexes to search")
+    parser.add_argument("-k", type=int, default=20, help="Results wanted")
+    parser.add_argument("--page-limit", type=int, default=10, help="page_limit")
+    parser.add_argument(
+        "--median", type=float, default=0.02, help="Median request latency (s)"
+    )
+    args = parser.parse_args()
+
+    results = run(
+        repeat=min(args.repeat, 50),
+        indexes=args.indexes,
+        k=args.k,
+        page_limit=args.page_limit,
+        median_s=args.median,
+        seed=args.seed,
+    )
+    print(
+        f"{results['indexes']} indexes, top {results['k']}, page_limit {results['page_limit']}"
+    )
+    for name, stats in results["cases"].items():
+        latency = stats["latency"]
+        print(
+            f"{name:10s} p50={latency['p50_ms']:.1f} ms  p99={latency['p99_ms']:.1f} ms  "
+            f"{stats['requests_per_search']} requests/search"
+        )
+    print(f"fan-out speedup (p50): {results['speedup_p50']}x")
+    print("Results written to", write_results("fanout", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Raw-response fast path benchmark
+
+Compares consuming ``group_by="video"`` pages through the default SDK path
+(``client.search.query`` + pydantic models) with ``search_helpers.query_fast``
+rows, columns and on-demand models, against the zero-latency in-process stand-in.
+"""
+
+import time
+
+from search_helpers import query_fast
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+from .common import base_parser, percentiles, write_results
+
+PARAMS = {
+    "index_id": STANDIN_INDEX_MARENGO_30,
+    "query_text": "water swimming",
+    "search_options": ["visual", "audio"],
+    "group_by": "video",
+    "page_limit": 50,
+    "include_user_metadata": True,
+}
+
+
+def _sdk_rows(client, pages):
+    rows = []
+    for page in client.search.query(**PARAMS).iter_pages():
+        for item in page.items:
+            for clip in item.clips or []:
+                rows.append((clip.video_id, clip.start, clip.end, clip.rank))
+        pages -= 1
+        if not pages:
+            break
+    return rows
+
+
+def _fast(client, pages, consume):
+    out = []
+    for page in query_fast(client, **PARAMS).iter_pages():
+        out.append(consume(page))
+        pages -= 1
+        if not pages:
+            break
+    return out
+
+
+def run(repeat: int = 30, videos: int = 1000, pages: int = 3, seed: int = 0) -> dict:
+    server = StandinServer.with_default_indexes(
+        num_videos=videos, seed=seed, candidate_k=4000
+    )
+    client = server.make_client()
+    clips = len(_sdk_rows(client, pages))
+
+    variants = {
+        "sdk_models": lambda: _sdk_rows(client, pages),
+        "fast_rows": lambda: _fast(client, pages, lambda page: page.rows()),
+        "fast_columns": lambda: _fast(client, pages, lambda page: page.columns()),
+        "fast_models_on_demand": lambda: _fast(
+            client, pages, lambda page: page.items()
+        ),
+    }
+    cases = {}
+    for name, func in variants.items():
+        func()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) / pages)
+        stats = percentiles(samples)
+        stats["clips_per_second"] = round(clips / pages / (stats["mean_ms"] / 1000), 1)
+        cases[name] = stats
+
+    baseline = cases["sdk_models"]["mean_ms"]
+    for stats in cases.values():
+        stats["speedup_vs_sdk"] = round(baseline / stats["mean_ms"], 2)
+    return {
+        "videos": videos,
+        "pages": pages,
+        "clips_per_page": clips / pages,
+        "cases": cases,
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1000, help="Videos per index")
+    parser.add_argument("--pages", type=int, default=3, help="Pages consumed per query")
+    args = parser.parse_args()
+
+    results = run(
+        repeat=min(args.repeat, 50),
+        videos=args.videos,
+        pages=args.pages,
+        seed=args.seed,
+    )
+    print(f"{results['clips_per_page']:.0f} clips per page")
+    for name, stats in results["cases"].items():
+        print(
+            f"{name:22s} {stats['mean_ms']:.3f} ms/page  "
+            f"{stats['clips_per_second']:.0f} clips/s  x{stats['speedup_vs_sdk']}"
+        )
+    print("Results written to", write_results("fast_path", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
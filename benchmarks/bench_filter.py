@@ -0,0 +1,94 @@
+"""
+Metadata filter benchmark
+
+Compares evaluating filters with compiled predicates over per-field secondary
+indexes against a per-video linear scan, and measures filtered search latency
+in the local stand-in.
+"""
+
+import json
+
+from standin import MARENGO_30, STANDIN_INDEX_MARENGO_30, build_corpus
+from standin.filters import FilterCache, MetadataIndex
+from standin.index import SearchIndex
+
+from .common import base_parser, percentiles, time_calls, write_results
+
+FILTERS = [
+    '{"category": "nature"}',
+    '{"category": "nature", "type": "video"}',
+    '{"status": "active", "needs_review": true}',
+    '{"views": {"gte": 10000, "lt": 20000}}',
+    '{"duration": {"gte": 200}, "category": "city"}',
+]
+
+
+def _linear_scan(videos, text):
+    """Reference evaluation: parse the filter and test every video."""
+    conditions = json.loads(text)
+    matched = []
+    for video in videos:
+        ok = True
+        for field, expected in conditions.items():
+            actual = video.get(field, video["user_metadata"].get(field))
+            if isinstance(expected, dict):
+                ok = isinstance(actual, (int, float)) and all(
+                    (op != "gte" or actual >= bound) and (op != "lt" or actual < bound)
+                    for op, bound in expected.items()
+                )
+            else:
+                ok = actual == expected and type(actual) is type(expected)
+            if not ok:
+                break
+        matched.append(ok)
+    return matched
+
+
+def run(videos: int = 20000, repeat: int = 200, seed: int = 0) -> dict:
+    corpus = build_corpus(num_videos=videos, seed=seed, transcripts=False)
+    metadata = MetadataIndex(corpus.videos)
+    cache = FilterCache()
+    per_filter = repeat // len(FILTERS) or 1
+
+    cases = {}
+    for name, evaluate in (
+        ("linear_scan", lambda text: _linear_scan(corpus.videos, text)),
+        ("secondary_index", lambda text: metadata.evaluate(cache.compile(text))),
+    ):
+        samples = []
+        for text in FILTERS:
+            samples.extend(time_calls(lambda: evaluate(text), per_filter))
+        cases[name] = percentiles(samples)
+
+    index = SearchIndex(STANDIN_INDEX_MARENGO_30, MARENGO_30, corpus)
+    query = corpus.embedder.embed_text("water")
+    for name, text in (("search_unfiltered", None), ("search_filtered", FILTERS[1])):
+        cases[name] = percentiles(
+            time_calls(
+                lambda: index.search(
+                    query,
+                    ["visual", "audio"],
+                    allowed=index.clip_mask(cache.compile(text)) if text else None,
+                ),
+                repeat,
+            )
+        )
+
+    return {"videos": videos, "clips": len(corpus), "cases": cases}
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--videos", type=int, default=20000, help="Videos in the corpus"
+    )
+    args = parser.parse_args()
+
+    results = run(videos=args.videos, repeat=args.repeat, seed=args.seed)
+    for name, stats in results["cases"].items():
+        print(f"{name:18s} p50={stats['p50_ms']:.3f} ms  p99={stats['p99_ms']:.3f} ms")
+    print("Results written to", write_results("filter", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
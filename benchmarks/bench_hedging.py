@@ -0,0 +1,114 @@
+"""
+Hedged request benchmark
+
+Sends ``search.query`` and one ``next_page()`` per search to a stand-in with a
+heavy-tailed synthetic latency model (log-normal body plus a Pareto tail, see
+``LatencyModel.synthetic``). Runs the same searches without hedging and with
+``search_helpers.hedge`` at a few percentile/budget settings, and reports the
+latency percentiles of each call and the extra requests hedging cost.
+"""
+
+import time
+from typing import Optional, Sequence, Tuple
+
+from search_helpers import HedgeBudget, hedge
+from standin import STANDIN_INDEX_MARENGO_27, LatencyModel, StandinServer
+
+from .common import base_parser, percentiles, write_results
+
+PARAMS = {
+    "index_id": STANDIN_INDEX_MARENGO_27,
+    "query_text": "water",
+    "search_options": ["visual", "audio"],
+    "page_limit": 10,
+}
+
+# (name, percentile, budget ratio); None disables hedging
+SETTINGS: Sequence[Tuple[str, Optional[float], float]] = (
+    ("off", None, 0.0),
+    ("p95_budget5", 95.0, 0.05),
+    ("p90_budget10", 90.0, 0.10),
+)
+
+
+def run(
+    repeat: int = 500,
+    median_s: float = 0.01,
+    tail_fraction: float = 0.02,
+    videos: int = 100,
+    seed: int = 0,
+    settings: Sequence[Tuple[str, Optional[float], float]] = SETTINGS,
+) -> dict:
+    cases = {}
+    for name, percentile, ratio in settings:
+        server = StandinServer.with_default_indexes(
+            num_videos=videos,
+            seed=seed,
+            latency_model=LatencyModel.synthetic(
+                median_s=median_s, tail_fraction=tail_fraction, seed=seed
+            ),
+        )
+        client = server.make_client()
+        transport = None
+        if percentile is not None:
+            transport = hedge(
+                client, percentile=percentile, budget=HedgeBudget(ratio=ratio)
+            )
+
+        queries, pages = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pager = client.search.query(**PARAMS)
+            queries.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            pager.next_page()
+            pages.append(time.perf_counter() - start)
+
+        sent = server.request_counts["search"] + server.request_counts["search_page"]
+        cases[name] = {
+            "percentile": percentile,
+            "budget_ratio": ratio,
+            "query": percentiles(queries),
+            "next_page": percentiles(pages),
+            "hedged": transport.hedged if transport else 0,
+            "hedge_wins": transport.hedge_wins if transport else 0,
+            "extra_load": round(sent / (2 * repeat) - 1, 4),
+        }
+
+    baseline = cases[settings[0][0]]["query"]["p99_ms"]
+    for case in cases.values():
+        case["p99_improvement"] = round(
+            1 - case["query"]["p99_ms"] / max(baseline, 1e-9), 4
+        )
+    return {"median_s": median_s, "tail_fraction": tail_fraction, "cases": cases}
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--median", type=float, default=0.01, help="Median request latency (s)"
+    )
+    parser.add_argument(
+        "--tail-fraction", type=float, default=0.02, help="Share of tail latencies"
+    )
+    args = parser.parse_args()
+
+    results = run(
+        repeat=args.repeat,
+        median_s=args.median,
+        tail_fraction=args.tail_fraction,
+        seed=args.seed,
+    )
+    for name, stats in results["cases"].items():
+        print(
+            f"{name:13s} query p50={stats['query']['p50_ms']:.1f} ms  "
+            f"p99={stats['query']['p99_ms']:.1f} ms  "
+            f"next_page p99={stats['next_page']['p99_ms']:.1f} ms  "
+            f"hedged={stats['hedged']} (won {stats['hedge_wins']})  "
+            f"extra load={stats['extra_load']:.1%}"
+        )
+    print("Results written to", write_results("hedging", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Lazy user_metadata benchmark
+
+Captures one ``group_by="video"`` page from the stand-in with
+``include_user_metadata`` off and on (large metadata per video) and measures,
+per page, the time to turn the body into Python objects and the memory the
+decoded page keeps alive (tracemalloc):
+
+- ``sdk``: ``json.loads`` plus ``SearchResults`` models, as ``client.search.query``
+- ``fast``: ``search_helpers`` raw decode (orjson when installed), metadata decoded
+- ``lazy``: metadata kept as raw bytes (``LazyMetadata``), never accessed
+- ``lazy_access_one``: lazy page, then one item's metadata is read
+- ``projected``: only the ``--fields`` metadata fields decoded
+"""
+
+import json
+import tracemalloc
+
+from search_helpers import decode_page
+from search_helpers.raw import loads, post_search
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+from .common import base_parser, percentiles, time_calls, write_results
+
+PARAMS = {
+    "index_id": STANDIN_INDEX_MARENGO_30,
+    "query_text": "water swimming",
+    "search_options": ["visual", "audio"],
+    "group_by": "video",
+    "page_limit": 50,
+}
+
+FIELDS = ("category", "views")
+
+
+def _sdk(body: bytes):
+    from twelvelabs.core.pydantic_utilities import parse_obj_as
+    from twelvelabs.types.search_results import SearchResults
+
+    return parse_obj_as(type_=SearchResults, object_=json.loads(body))
+
+
+def _lazy_access_one(body: bytes):
+    page = decode_page(body)
+    page["data"][0]["user_metadata"].get("category")
+    return page
+
+
+def _retained_kib(func) -> float:
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        page = func()
+        current, _ = tracemalloc.get_traced_memory()
+        del page
+        return round((current - base) / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def run(
+    repeat: int = 200,
+    videos: int = 300,
+    metadata_size: int = 4000,
+    fields=FIELDS,
+    seed: int = 0,
+) -> dict:
+    server = StandinServer.with_default_indexes(
+        num_videos=videos, seed=seed, metadata_size=metadata_size
+    )
+    client = server.make_client()
+    bodies = {
+        "off": post_search(client, PARAMS).content,
+        "on": post_search(client, dict(PARAMS, include_user_metadata=True)).content,
+    }
+    decoders = {
+        "sdk": _sdk,
+        "fast": loads,
+        "lazy": decode_page,
+        "lazy_access_one": _lazy_access_one,
+        "projected": lambda body: decode_page(body, fields),
+    }
+
+    cases = {}
+    for metadata, body in bodies.items():
+        for name, decode in decoders.items():
+            if metadata == "off" and name not in ("sdk", "fast"):
+                continue
+
+            def call():
+                return decode(body)
+
+            cases[f"{name}_metadata_{metadata}"] = {
+                "decode": percentiles(time_calls(call, repeat)),
+                "retained_kib": _retained_kib(call),
+            }
+    return {
+        "page_kib": {name: round(len(body) / 1024, 1) for name, body in bodies.items()},
+        "items_per_page": len(loads(bodies["on"])["data"]),
+        "metadata_size": metadata_size,
+        "fields": list(fields),
+        "cases": cases,
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=300, help="Videos per index")
+    parser.add_argument(
+        "--metadata-size", type=int, default=4000, help="User metadata bytes per video"
+    )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        default=list(FIELDS),
+        help="Metadata fields decoded by the projected case",
+    )
+    args = parser.parse_args()
+
+    results = run(
+        repeat=args.repeat,
+        videos=args.videos,
+        metadata_size=args.metadata_size,
+        fields=args.fields,
+        seed=args.seed,
+    )
+    print(
+        f"{results['items_per_page']} items per page, "
+        f"{results['page_kib']['on']} KiB with metadata, "
+        f"{results['page_kib']['off']} KiB without"
+    )
+    for name, stats in results["cases"].items():
+        print(
+            f"{name:28s} decode p50={stats['decode']['p50_ms']:.3f} ms  "
+            f"retained={stats['retained_kib']} KiB"
+        )
+    print(
+        "Results written to", write_results("lazy_metadata", results, args.output_dir)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Startup benchmark: SDK import, client construction and pytest collection
+
+Everything is measured in fresh interpreters, since startup cost only shows up
+once per process (the cold start of a short-lived search worker):
+
+- ``import twelvelabs`` wall time, and its ``-X importtime`` self time grouped
+  into the SDK's generated types, SDK core, other SDK packages, pydantic,
+  httpx and the rest, plus the slowest modules
+- ``TwelveLabs(...)`` construction (first and steady-state), and the first
+  ``search.query`` against the stand-in versus later ones
+- ``pytest --collect-only`` over the suite, eager and with ``--lazy-imports``,
+  for the whole suite and for a ``-m marengo30`` run
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from .bench_trend import import_seconds
+from .common import base_parser, percentiles, write_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (group, module name prefixes); the first match wins
+GROUPS = (
+    ("twelvelabs types", ("twelvelabs.types",)),
+    ("twelvelabs core", ("twelvelabs.core",)),
+    ("twelvelabs other", ("twelvelabs",)),
+    (
+        "pydantic",
+        (
+            "pydantic",
+            "pydantic_core",
+            "annotated_types",
+            "typing_extensions",
+            "typing_inspection",
+        ),
+    ),
+    (
+        "httpx",
+        ("httpx", "httpcore", "h11", "h2", "anyio", "sniffio", "certifi", "idna"),
+    ),
+)
+
+CLIENT_SNIPPET = """
+import json, statistics, time
+start = time.perf_counter()
+from twelvelabs import TwelveLabs
+imported = time.perf_counter()
+TwelveLabs(api_key="bench")
+first = time.perf_counter()
+steady = []
+for _ in range(20):
+    start_one = time.perf_counter()
+    TwelveLabs(api_key="bench")
+    steady.append(time.perf_counter() - start_one)
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+client = StandinServer.with_default_indexes(num_videos=100).make_client()
+params = dict(index_id=STANDIN_INDEX_MARENGO_30, query_text="water",
+              search_options=["visual", "audio"], page_limit=10)
+queries = []
+for _ in range(11):
+    start_one = time.perf_counter()
+    client.search.query(**params)
+    queries.append(time.perf_counter() - start_one)
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "construct_first_ms": (first - imported) * 1000,
+    "construct_steady_ms": statistics.median(steady) * 1000,
+    "query_first_ms": queries[0] * 1000,
+    "query_steady_ms": statistics.median(queries[1:]) * 1000,
+}))
+"""
+
+COLLECTION_CASES = {
+    "eager_all": [],
+    "lazy_all": ["--lazy-imports"],
+    "eager_marengo30": ["-m", "marengo30"],
+    "lazy_marengo30": ["-m", "marengo30", "--lazy-imports"],
+}
+
+
+def group_of(module: str) -> str:
+    for group, prefixes in GROUPS:
+        if any(module == p or module.startswith(p + ".") for p in prefixes):
+            return group
+    return "stdlib/other"
+
+
+def _importtime(code: str) -> Dict[str, int]:
+    """Module -> self import time in microseconds, from ``-X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # header line
+        modules[fields[2].strip()] = int(fields[0])
+    return modules
+
+
+def import_breakdown(repeat: int = 5, top: int = 10) -> dict:
+    """Median ``-X importtime`` self time of ``import twelvelabs`` per group and module.
+
+    Modules the bare interpreter already imports at startup are left out.
+    """
+    baseline = set(_importtime("pass"))
+    runs: List[Dict[str, int]] = []
+    for _ in range(repeat + 1):
+        modules = _importtime("import twelvelabs")
+        runs.append({m: t for m, t in modules.items() if m not in baseline})
+    runs = runs[1:]  # the first run also writes bytecode caches
+
+    per_module = {
+        module: statistics.median(run.get(module, 0) for run in runs)
+        for module in runs[0]
+    }
+    groups: Dict[str, float] = {}
+    for module, micros in per_module.items():
+        group = group_of(module)
+        groups[group] = groups.get(group, 0.0) + micros
+    slowest = sorted(per_module.items(), key=lambda e: e[1], reverse=True)[:top]
+    return {
+        "modules": len(per_module),
+        "total_ms": round(sum(per_module.values()) / 1000, 2),
+        "groups_ms": {
+            group: round(micros / 1000, 2)
+            for group, micros in sorted(groups.items(), key=lambda e: -e[1])
+        },
+        "slowest_modules_ms": [
+            {"module": module, "self_ms": round(micros / 1000, 2)}
+            for module, micros in slowest
+        ],
+    }
+
+
+def client_startup(repeat: int = 5) -> dict:
+    """Client construction and first-query cost, median over fresh interpreters."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", CLIENT_SNIPPET],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        key: round(statistics.median(run[key] for run in runs), 3) for key in runs[0]
+    }
+
+
+def collection_seconds(args: List[str], repeat: int = 3) -> List[float]:
+    """Wall time of ``pytest --collect-only`` over tests/ with extra ``args``."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "--collect-only",
+                "-q",
+                "-p",
+                "no:cacheprovider",
+                *args,
+                "tests",
+            ],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+        )
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(repeat: int = 5, collection_repeat: int = 3) -> dict:
+    return {
+        "import_twelvelabs": percentiles(import_seconds(repeat)),
+        "import_breakdown": import_breakdown(repeat),
+        "client": client_startup(repeat),
+        "collection": {
+            name: percentiles(collection_seconds(args, collection_repeat))
+            for name, args in COLLECTION_CASES.items()
+        },
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.set_defaults(repeat=5)
+    parser.add_argument(
+        "--collection-repeat",
+        type=int,
+        default=3,
+        help="pytest --collect-only runs per case",
+    )
+    args = parser.parse_args()
+
+    results = run(repeat=args.repeat, collection_repeat=args.collection_repeat)
+    print(f"import twelvelabs    p50 {results['import_twelvelabs']['p50_ms']:.1f} ms")
+    for group, ms in results["import_breakdown"]["groups_ms"].items():
+        print(f"  {group:18s} {ms:8.1f} ms")
+    for key, ms in results["client"].items():
+        print(f"{key:20s} {ms:8.2f} ms")
+    for name, summary in results["collection"].items():
+        print(f"collect {name:16s} p50 {summary['p50_ms']:.0f} ms")
+    print(
+        "Results written to", write_results("bench_startup", results, args.output_dir)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Streaming decode benchmark
+
+Compares the buffered SDK path (``client.search.query``) with
+``search_helpers.query_streaming`` on large ``group_by="video"`` pages with
+user metadata, served by the stand-in at a paced transfer rate so that the body
+arrives over time. Reports time-to-first-item, time to the whole page and
+tracemalloc peak memory while each item is consumed and discarded. The peak
+includes the in-process stand-in rendering the page, which is the same for
+both paths.
+"""
+
+import time
+import tracemalloc
+
+from search_helpers.raw import post_search
+from search_helpers.streaming import query_streaming
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+from .common import base_parser, percentiles, write_results
+
+PARAMS = {
+    "index_id": STANDIN_INDEX_MARENGO_30,
+    "query_text": "water swimming",
+    "search_options": ["visual", "audio"],
+    "group_by": "video",
+    "page_limit": 50,
+    "include_user_metadata": True,
+}
+
+
+def _buffered(client):
+    start = time.perf_counter()
+    items = iter(client.search.query(**PARAMS).items)
+    next(items)
+    first = time.perf_counter() - start
+    for _ in items:
+        pass
+    return first, time.perf_counter() - start
+
+
+def _streaming(client):
+    start = time.perf_counter()
+    items = next(query_streaming(client, **PARAMS).iter_pages())
+    next(items)
+    first = time.perf_counter() - start
+    for _ in items:
+        pass
+    return first, time.perf_counter() - start
+
+
+def _peak_kib(func, client) -> float:
+    tracemalloc.start()
+    try:
+        func(client)
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def run(
+    repeat: int = 10,
+    videos: int = 1000,
+    metadata_size: int = 4000,
+    transfer_rate: float = 4_000_000,
+    seed: int = 0,
+) -> dict:
+    server = StandinServer.with_default_indexes(
+        num_videos=videos,
+        seed=seed,
+        metadata_size=metadata_size,
+        candidate_k=4000,
+        transfer_rate=transfer_rate,
+    )
+    client = server.make_client()
+    body = post_search(client, PARAMS).content
+
+    cases = {}
+    for name, func in (("buffered", _buffered), ("streaming", _streaming)):
+        func(client)
+        firsts, totals = [], []
+        for _ in range(repeat):
+            first, total = func(client)
+            firsts.append(first)
+            totals.append(total)
+        cases[name] = {
+            "time_to_first_item": percentiles(firsts),
+            "time_to_page": percentiles(totals),
+            "peak_kib": _peak_kib(func, client),
+        }
+    return {
+        "page_kib": round(len(body) / 1024, 1),
+        "transfer_rate": transfer_rate,
+        "cases": cases,
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1000, help="Videos per index")
+    parser.add_argument(
+        "--metadata-size", type=int, default=4000, help="User metadata bytes per video"
+    )
+    parser.add_argument(
+        "--transfer-rate", type=float, default=4_000_000, help="Body bytes per second"
+    )
+    args = parser.parse_args()
+
+    results = run(
+        repeat=min(args.repeat, 20),
+        videos=args.videos,
+        metadata_size=args.metadata_size,
+        transfer_rate=args.transfer_rate,
+        seed=args.seed,
+    )
+    print(f"{results['page_kib']} KiB per page")
+    for name, stats in results["cases"].items():
+        print(
+            f"{name:10s} first item p50={stats['time_to_first_item']['p50_ms']:.1f} ms  "
+            f"page p50={stats['time_to_page']['p50_ms']:.1f} ms  "
+            f"peak={stats['peak_kib']} KiB"
+        )
+    print("Results written to", write_results("streaming", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
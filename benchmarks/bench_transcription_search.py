@@ -0,0 +1,99 @@
+"""
+Transcription search throughput benchmark
+
+Measures lexical (BM25 inverted index) and semantic (vector) transcription search
+in the local stand-in: index build time, per-query latency and queries per second,
+both for the engines alone and end to end through the SDK client.
+"""
+
+import time
+
+from standin import MARENGO_30, STANDIN_INDEX_MARENGO_30, StandinServer, build_corpus
+from standin.index import SearchIndex
+
+from .common import base_parser, percentiles, time_calls, write_results
+
+QUERIES = ["hello", "swimming", "kitchen family", "team record", '"with hello"']
+
+
+def _throughput(samples):
+    total = sum(samples)
+    return round(len(samples) / total, 1) if total else 0.0
+
+
+def run(videos: int = 2000, repeat: int = 200, seed: int = 0) -> dict:
+    corpus = build_corpus(num_videos=videos, seed=seed)
+
+    start = time.perf_counter()
+    index = SearchIndex(STANDIN_INDEX_MARENGO_30, MARENGO_30, corpus)
+    build_seconds = time.perf_counter() - start
+
+    cases = {}
+    for mode in ("lexical", "semantic"):
+        samples = []
+        for query in QUERIES:
+            vector = corpus.embedder.embed_text(query)
+            samples.extend(
+                time_calls(
+                    lambda: index.search(
+                        vector,
+                        ["transcription"],
+                        query_text=query,
+                        transcription_options=(mode,),
+                    ),
+                    repeat // len(QUERIES) or 1,
+                )
+            )
+        cases[f"engine_{mode}"] = {
+            **percentiles(samples),
+            "queries_per_second": _throughput(samples),
+        }
+
+    server = StandinServer()
+    server.add_index(index)
+    client = server.make_client()
+    for mode in ("lexical", "semantic"):
+        samples = time_calls(
+            lambda: list(
+                client.search.query(
+                    index_id=STANDIN_INDEX_MARENGO_30,
+                    query_text="hello",
+                    search_options=["transcription"],
+                    transcription_options=[mode],
+                    page_limit=50,
+                ).items
+            ),
+            repeat,
+        )
+        cases[f"client_{mode}"] = {
+            **percentiles(samples),
+            "queries_per_second": _throughput(samples),
+        }
+
+    return {
+        "clips": len(corpus),
+        "terms": len(index.lexical.postings),
+        "index_build_seconds": round(build_seconds, 3),
+        "cases": cases,
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=2000, help="Videos in the corpus")
+    args = parser.parse_args()
+
+    results = run(videos=args.videos, repeat=args.repeat, seed=args.seed)
+    for name, stats in results["cases"].items():
+        print(
+            f"{name:18s} p50={stats['p50_ms']:.3f} ms  p99={stats['p99_ms']:.3f} ms  "
+            f"{stats['queries_per_second']:.0f} q/s"
+        )
+    print(
+        "Results written to",
+        write_results("transcription_search", results, args.output_dir),
+    )
+
+
+if __name__ == "__main__":
+    main()
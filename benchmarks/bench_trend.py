@@ -0,0 +1,165 @@
+"""
+Trend snapshot benchmark
+
+One small, fixed workload per stand-in index whose results are appended to the
+dashboard's benchmark history (see ``benchmarks/dashboard.py``). Per index it
+records:
+
+- wall time per page while draining ``--pages`` pages (``search.query`` and
+  ``next_page``)
+- pages per second over those drains
+- client-side overhead per ``search.query`` call (wall time minus the
+  stand-in handler time)
+- tracemalloc peak memory per drain
+
+plus the time to ``import twelvelabs`` in a fresh interpreter. CI runs it once
+per Python version in the test matrix.
+"""
+
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from standin import STANDIN_INDEX_MARENGO_27, STANDIN_INDEX_MARENGO_30, StandinServer
+
+from .common import (
+    TimedServer,
+    base_parser,
+    client_seconds,
+    drain,
+    percentiles,
+    write_results,
+)
+
+INDEXES = {
+    "marengo2.7": STANDIN_INDEX_MARENGO_27,
+    "marengo3.0": STANDIN_INDEX_MARENGO_30,
+}
+
+PARAMS = {
+    "query_text": "water",
+    "search_options": ["visual", "audio"],
+    "page_limit": 10,
+}
+
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import twelvelabs; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_seconds(repeat: int = 5) -> List[float]:
+    """Time ``import twelvelabs`` in ``repeat`` fresh interpreters."""
+    samples = []
+    for _ in range(repeat + 1):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return samples[1:]  # the first run also compiles/caches bytecode
+
+
+def _index_snapshot(client, timed: TimedServer, index_id: str, repeat, pages):
+    for _ in range(3):
+        drain(client, pages, index_id=index_id, **PARAMS)
+
+    page_seconds: List[float] = []
+    overhead: List[float] = []
+    drained = 0
+    drain_seconds = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        pager, total, client_only = client_seconds(
+            timed, lambda: client.search.query(index_id=index_id, **PARAMS)
+        )
+        page_seconds.append(total)
+        overhead.append(client_only)
+        drained += 1
+        for _ in range(pages - 1):
+            if not pager.has_next:
+                break
+            start = time.perf_counter()
+            pager = pager.next_page()
+            page_seconds.append(time.perf_counter() - start)
+            drained += 1
+        drain_seconds += time.perf_counter() - started
+
+    peaks: List[float] = []
+    tracemalloc.start()
+    try:
+        for _ in range(3):
+            base, _ = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            drain(client, pages, index_id=index_id, **PARAMS)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append((peak - base) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "page_latency": percentiles(page_seconds),
+        "pages_per_sec": round(drained / drain_seconds, 2),
+        "client_overhead": percentiles(overhead),
+        "peak_kib": round(min(peaks), 1),
+    }
+
+
+def run(
+    repeat: int = 30,
+    pages: int = 5,
+    videos: int = 500,
+    seed: int = 0,
+    import_repeat: int = 5,
+) -> dict:
+    server = StandinServer.with_default_indexes(num_videos=videos, seed=seed)
+    timed = TimedServer(server)
+    client = server.make_client()
+    return {
+        "settings": {"repeat": repeat, "pages": pages, "videos": videos},
+        "startup": {"import_twelvelabs": percentiles(import_seconds(import_repeat))},
+        "indexes": {
+            label: _index_snapshot(client, timed, index_id, repeat, pages)
+            for label, index_id in INDEXES.items()
+        },
+    }
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.set_defaults(repeat=30)
+    parser.add_argument("--pages", type=int, default=5, help="Pages per drain")
+    parser.add_argument("--videos", type=int, default=500, help="Videos per index")
+    parser.add_argument(
+        "--import-repeat", type=int, default=5, help="Fresh interpreters timed"
+    )
+    args = parser.parse_args()
+
+    results = run(
+        repeat=args.repeat,
+        pages=args.pages,
+        videos=args.videos,
+        seed=args.seed,
+        import_repeat=args.import_repeat,
+    )
+    print(
+        f"import twelvelabs p50 {results['startup']['import_twelvelabs']['p50_ms']:.1f} ms"
+    )
+    for label, entry in results["indexes"].items():
+        print(
+            f"{label:11s} page p95 {entry['page_latency']['p95_ms']:.2f} ms  "
+            f"{entry['pages_per_sec']:.0f} pages/s  "
+            f"overhead p50 {entry['client_overhead']['p50_ms']:.2f} ms  "
+            f"peak {entry['peak_kib']:.0f} KiB"
+        )
+    print("Results written to", write_results("bench_trend", results, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
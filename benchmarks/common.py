@@ -0,0 +1,124 @@
+"""
+Shared helpers for benchmarks
+
+Timing, percentile summaries, stand-in server timing and JSON result files under
+``bench-results/``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+RESULTS_DIR = "bench-results"
+
+
+def percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    """Summarize samples (seconds) as mean/p50/p95/p99/max in milliseconds."""
+    values = np.asarray(samples, dtype=np.float64) * 1000.0
+    if values.size == 0:
+        return {"count": 0}
+    return {
+        "count": int(values.size),
+        "mean_ms": round(float(values.mean()), 4),
+        "p50_ms": round(float(np.percentile(values, 50)), 4),
+        "p95_ms": round(float(np.percentile(values, 95)), 4),
+        "p99_ms": round(float(np.percentile(values, 99)), 4),
+        "max_ms": round(float(values.max()), 4),
+    }
+
+
+def time_calls(func: Callable[[], object], repeat: int, warmup: int = 3) -> List[float]:
+    """Call ``func`` ``warmup + repeat`` times and return the last ``repeat`` durations."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+class TimedServer:
+    """Records the wall time and the response bodies of the stand-in handler.
+
+    Wraps ``server.handle`` in place, so every client made from ``server`` is timed.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.handle = server.handle
+        self.seconds = 0.0
+        self.bodies: Dict[str, bytes] = {}
+        server.handle = self
+
+    def __call__(self, method, path, params, content_type, body):
+        start = time.perf_counter()
+        response = self.handle(method, path, params, content_type, body)
+        self.seconds += time.perf_counter() - start
+        self.bodies.setdefault(method, response[2])
+        return response
+
+
+def client_seconds(timed: TimedServer, func: Callable[[], object]):
+    """Run func and return (result, total seconds, seconds spent outside the server)."""
+    server_before = timed.seconds
+    start = time.perf_counter()
+    result = func()
+    total = time.perf_counter() - start
+    return result, total, total - (timed.seconds - server_before)
+
+
+def drain(client, pages: int, **params) -> list:
+    """Fetch up to ``pages`` pages of ``client.search.query(**params)`` and keep them."""
+    kept = []
+    for page in client.search.query(**params).iter_pages():
+        kept.append(page)
+        if len(kept) >= pages:
+            break
+    return kept
+
+
+def environment() -> dict:
+    """Describe the interpreter and SDK the benchmark ran on."""
+    try:
+        from importlib.metadata import version
+
+        sdk_version = version("twelvelabs")
+    except Exception:
+        sdk_version = "unknown"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": sys.platform,
+        "twelvelabs": sdk_version,
+    }
+
+
+def write_results(name: str, results: dict, output_dir: str = RESULTS_DIR) -> str:
+    """Write ``results`` (plus environment info) to ``<output_dir>/<name>.json``."""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{name}.json")
+    payload = {"benchmark": name, "environment": environment(), **results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def base_parser(description: str) -> argparse.ArgumentParser:
+    """Argument parser with the options every benchmark accepts."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="Timed iterations per case"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument(
+        "--output-dir", default=RESULTS_DIR, help="Directory for the JSON results"
+    )
+    return parser
@@ -0,0 +1,300 @@
+"""
+Benchmark history and trend charts for the CI dashboard
+
+Appends the ``bench_trend`` results of one CI run (one file per Python version)
+to a JSON history and renders the history as static HTML with inline SVG
+charts: per-index page latency percentiles, pages per second, client overhead
+per call and peak memory, one line per Python version. A table compares the
+latest run with the previous one and with the oldest run kept, so slow creep
+over many commits stays visible even when each step is small.
+
+    python -m benchmarks.dashboard --history public/trends/history.json \\
+        --snapshots 'bench/*/bench_trend.json' --commit "$GITHUB_SHA" \\
+        --html public/trends/index.html
+"""
+
+import argparse
+import glob
+import html
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (key, title, unit, higher is better)
+METRICS: Sequence[Tuple[str, str, str, bool]] = (
+    ("page_latency.p50_ms", "Page latency p50", "ms", False),
+    ("page_latency.p95_ms", "Page latency p95", "ms", False),
+    ("page_latency.p99_ms", "Page latency p99", "ms", False),
+    ("pages_per_sec", "Pages per second", "pages/s", True),
+    ("client_overhead.p50_ms", "Client overhead per call p50", "ms", False),
+    ("peak_kib", "Peak memory per drain", "KiB", False),
+)
+
+COLORS = ("#0366d6", "#2ea44f", "#d73a49", "#6f42c1", "#f66a0a", "#005cc5")
+
+# Worse than the oldest kept run by more than this fraction is flagged
+CREEP_THRESHOLD = 0.10
+
+
+def python_version(snapshot: dict) -> str:
+    """Major.minor Python version a snapshot ran on."""
+    return ".".join(snapshot["environment"]["python"].split(".")[:2])
+
+
+def load_history(path: str) -> List[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            history = json.load(f)
+        except ValueError:
+            return []
+    return history if isinstance(history, list) else []
+
+
+def append_run(
+    history: List[dict],
+    snapshots: Sequence[dict],
+    commit: str,
+    ref: str = "",
+    date: Optional[str] = None,
+    keep: int = 200,
+) -> List[dict]:
+    """Add one CI run (its per-Python snapshots) to the history.
+
+    A run for a commit already in the history replaces it (re-runs). Only the
+    last ``keep`` runs are kept.
+    """
+    entry = {
+        "commit": commit,
+        "ref": ref,
+        "date": date or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "runs": {
+            python_version(snapshot): {
+                "twelvelabs": snapshot["environment"].get("twelvelabs"),
+                "indexes": snapshot["indexes"],
+            }
+            for snapshot in snapshots
+        },
+    }
+    history = [run for run in history if run.get("commit") != commit]
+    history.append(entry)
+    return history[-keep:]
+
+
+def metric_value(index_entry: dict, key: str) -> Optional[float]:
+    value = index_entry
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return float(value)
+
+
+def series(
+    history: List[dict], key: str, index: str
+) -> Dict[str, List[Tuple[int, float]]]:
+    """Python version -> [(run position, value)] for one metric of one index."""
+    lines: Dict[str, List[Tuple[int, float]]] = {}
+    for position, run in enumerate(history):
+        for version, result in run["runs"].items():
+            entry = result["indexes"].get(index)
+            value = metric_value(entry, key) if entry else None
+            if value is not None:
+                lines.setdefault(version, []).append((position, value))
+    return dict(sorted(lines.items(), key=lambda e: tuple(map(int, e[0].split(".")))))
+
+
+def _svg_chart(
+    title: str,
+    unit: str,
+    lines: Dict[str, List[Tuple[int, float]]],
+    commits: List[str],
+) -> str:
+    width, height, left, right, top, bottom = 440, 200, 52, 12, 28, 24
+    runs = max(len(commits) - 1, 1)
+    peak = max((value for points in lines.values() for _, value in points), default=1)
+    peak = peak * 1.1 or 1.0
+
+    def x(position: int) -> float:
+        return left + (width - left - right) * position / runs
+
+    def y(value: float) -> float:
+        return top + (height - top - bottom) * (1 - value / peak)
+
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' "
+        f"class='chart'><text x='{left}' y='16' class='title'>{html.escape(title)}"
+        f" ({html.escape(unit)})</text>",
+        f"<line x1='{left}' y1='{height - bottom}' x2='{width - right}' "
+        f"y2='{height - bottom}' class='axis'/>",
+    ]
+    for fraction in (0.0, 0.5, 1.0):
+        value = peak / 1.1 * fraction
+        parts.append(
+            f"<text x='{left - 6}' y='{y(value) + 4:.1f}' class='tick' "
+            f"text-anchor='end'>{value:.3g}</text>"
+        )
+    for number, (version, points) in enumerate(lines.items()):
+        color = COLORS[number % len(COLORS)]
+        coordinates = " ".join(f"{x(p):.1f},{y(v):.1f}" for p, v in points)
+        parts.append(
+            f"<polyline points='{coordinates}' fill='none' stroke='{color}' "
+            "stroke-width='2'/>"
+        )
+        for position, value in points:
+            parts.append(
+                f"<circle cx='{x(position):.1f}' cy='{y(value):.1f}' r='2.5' "
+                f"fill='{color}'><title>Python {version} @ "
+                f"{html.escape(commits[position][:8])}: {value:.4g} {html.escape(unit)}"
+                "</title></circle>"
+            )
+        parts.append(
+            f"<text x='{width - right - 60 * (len(lines) - number)}' "
+            f"y='{height - 6}' fill='{color}' class='tick'>py{version}</text>"
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def creep_rows(history: List[dict]) -> List[dict]:
+    """Latest value per metric, index and Python version vs previous and oldest run."""
+    if not history:
+        return []
+    rows = []
+    for key, title, unit, higher_is_better in METRICS:
+        for index in _indexes(history):
+            for version, points in series(history, key, index).items():
+                if points[-1][0] != len(history) - 1:
+                    continue  # not measured in the latest run
+                latest = points[-1][1]
+                previous = points[-2][1] if len(points) > 1 else None
+                oldest = points[0][1]
+                change = (latest - oldest) / oldest if oldest else 0.0
+                worse = -change if higher_is_better else change
+                rows.append(
+                    {
+                        "metric": title,
+                        "unit": unit,
+                        "index": index,
+                        "python": version,
+                        "latest": latest,
+                        "previous": previous,
+                        "oldest": oldest,
+                        "change": change,
+                        "creep": worse > CREEP_THRESHOLD,
+                    }
+                )
+    return rows
+
+
+def _indexes(history: List[dict]) -> List[str]:
+    names = set()
+    for run in history:
+        for result in run["runs"].values():
+            names.update(result["indexes"])
+    return sorted(names)
+
+
+def render_html(history: List[dict]) -> str:
+    """Render the history as a standalone page of trend charts."""
+    commits = [run["commit"] for run in history]
+    sections = []
+    for index in _indexes(history):
+        charts = "".join(
+            _svg_chart(title, unit, series(history, key, index), commits)
+            for key, title, unit, _ in METRICS
+        )
+        sections.append(
+            f"<div class='card'><h2>{html.escape(index)}</h2>"
+            f"<div class='charts'>{charts}</div></div>"
+        )
+    rows = "".join(
+        f"<tr><td>{html.escape(row['metric'])}</td><td>{html.escape(row['index'])}</td>"
+        f"<td>{row['python']}</td><td>{row['latest']:.4g} {html.escape(row['unit'])}</td>"
+        f"<td>{'' if row['previous'] is None else format(row['previous'], '.4g')}</td>"
+        f"<td>{row['oldest']:.4g}</td>"
+        f"<td class='{'fail' if row['creep'] else ''}'>{row['change']:+.1%}</td></tr>"
+        for row in creep_rows(history)
+    )
+    span = (
+        f"{len(history)} runs, {html.escape(history[0]['date'])} to "
+        f"{html.escape(history[-1]['date'])}"
+        if history
+        else "no runs yet"
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>Benchmark Trends</title>
+  <style>
+    body {{ font-family: -apple-system, sans-serif; padding: 40px; background: #f6f8fa; color: #24292e; }}
+    .container {{ max-width: 960px; margin: 0 auto; }}
+    .card {{ background: white; padding: 20px; margin-bottom: 20px; border: 1px solid #e1e4e8; border-radius: 6px; }}
+    .charts {{ display: flex; flex-wrap: wrap; gap: 8px; }}
+    .chart .title {{ font-size: 12px; font-weight: bold; }}
+    .chart .tick {{ font-size: 10px; fill: #586069; }}
+    .chart .axis {{ stroke: #d1d5da; }}
+    table {{ width: 100%; border-collapse: collapse; font-size: 13px; }}
+    th, td {{ padding: 6px; text-align: left; border-bottom: 1px solid #eaecef; }}
+    .fail {{ color: #cb2431; font-weight: bold; }}
+  </style>
+</head>
+<body>
+  <div class="container">
+    <h1>📈 Benchmark Trends</h1>
+    <p>Stand-in workloads from <code>benchmarks/bench_trend.py</code>, {span}.
+    <a href="../index.html">Back to dashboard</a></p>
+    {''.join(sections)}
+    <div class="card">
+      <h2>Latest vs previous and oldest run</h2>
+      <p>Changes worse than {CREEP_THRESHOLD:.0%} against the oldest kept run are highlighted.</p>
+      <table>
+        <tr><th>Metric</th><th>Index</th><th>Python</th><th>Latest</th><th>Previous</th>
+        <th>Oldest</th><th>Change</th></tr>
+        {rows}
+      </table>
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--history", required=True, help="History JSON to update")
+    parser.add_argument(
+        "--snapshots",
+        required=True,
+        help="Glob of bench_trend result files from this run (one per Python version)",
+    )
+    parser.add_argument("--commit", required=True, help="Commit the run belongs to")
+    parser.add_argument("--ref", default="", help="Branch or tag of the run")
+    parser.add_argument("--keep", type=int, default=200, help="Runs kept in history")
+    parser.add_argument("--html", required=True, help="Trend page to write")
+    args = parser.parse_args()
+
+    snapshots = []
+    for path in sorted(glob.glob(args.snapshots)):
+        with open(path, "r", encoding="utf-8") as f:
+            snapshots.append(json.load(f))
+    history = load_history(args.history)
+    if snapshots:
+        history = append_run(history, snapshots, args.commit, args.ref, keep=args.keep)
+    else:
+        print("No benchmark snapshots matched", args.snapshots)
+
+    for path in (args.history, args.html):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(args.history, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=1)
+    with open(args.html, "w", encoding="utf-8") as f:
+        f.write(render_html(history))
+    print(f"{len(history)} runs in {args.history}; trends written to {args.html}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+Performance regression gate
+
+Runs the gate workloads against the in-process stand-in and compares them with
+a committed baseline (``benchmarks/baseline.json``):
+
+- ``page_latency``: wall time per page (``search.query`` and ``next_page``)
+  while draining ``--pages`` pages
+- ``client_overhead``: client-side time per ``search.query`` call, i.e. wall
+  time minus the stand-in handler time
+- ``drain_peak_kib``: tracemalloc peak per drain
+- ``drain_blocks``: traced blocks still allocated after a drain that keeps its
+  pages (CPython has no allocation counter; see bench_client_overhead)
+
+Each metric is compared through a statistic (p95 for times, median for memory)
+with a bootstrap confidence interval of the ratio current/baseline. A metric
+fails when the whole interval lies above ``1 + threshold``, i.e. when the
+regression is both beyond the threshold and statistically clear. Times are
+divided by a CPU calibration loop measured in the same run, so a baseline
+recorded on one machine can gate runs on another.
+
+The baseline records the ``twelvelabs`` version it was measured with. A run on
+another SDK version measures the SDK change as well as this repo's, so the gate
+refuses to compare (exit 2) unless ``--allow-sdk-mismatch`` is given.
+
+    python -m benchmarks.perf_gate                    # compare, exit 1 on regression
+    python -m benchmarks.perf_gate --update-baseline  # record a new baseline
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+from .common import (
+    TimedServer,
+    base_parser,
+    client_seconds,
+    drain,
+    environment,
+    write_results,
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+PARAMS = {
+    "index_id": STANDIN_INDEX_MARENGO_30,
+    "query_text": "water",
+    "search_options": ["visual", "audio"],
+    "page_limit": 10,
+}
+
+# metric -> (statistic, normalized by the calibration loop, default threshold)
+METRICS = {
+    "page_latency": ("p95", True, 0.10),
+    "client_overhead": ("p95", True, 0.10),
+    "drain_peak_kib": ("median", False, 0.05),
+    "drain_blocks": ("median", False, 0.05),
+}
+
+STATISTICS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "p95": lambda values: np.percentile(values, 95, axis=-1),
+    "median": lambda values: np.median(values, axis=-1),
+}
+
+
+def bootstrap_ratio(
+    current: Sequence[float],
+    baseline: Sequence[float],
+    statistic: str,
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float, float]:
+    """Return (ratio, low, high) of statistic(current)/statistic(baseline).
+
+    low/high bound the ``confidence`` interval of the ratio, estimated by
+    resampling both sample sets with replacement.
+    """
+    stat = STATISTICS[statistic]
+    current = np.asarray(current, dtype=np.float64)
+    baseline = np.asarray(baseline, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    current_boot = stat(
+        current[rng.integers(0, len(current), (resamples, len(current)))]
+    )
+    baseline_boot = stat(
+        baseline[rng.integers(0, len(baseline), (resamples, len(baseline)))]
+    )
+    ratios = current_boot / np.maximum(baseline_boot, 1e-12)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    point = float(stat(current) / max(float(stat(baseline)), 1e-12))
+    low, high = np.percentile(ratios, [tail, 100.0 - tail])
+    return point, float(low), float(high)
+
+
+def calibration_seconds(repeat: int = 15) -> float:
+    """Median time of a fixed pure-Python workload (decode, dicts, sorting)."""
+    payload = json.dumps(
+        {"data": [{"id": str(i), "rank": i, "start": i * 0.5} for i in range(400)]}
+    )
+    samples = []
+    for _ in range(repeat + 2):
+        start = time.perf_counter()
+        for _ in range(5):
+            items = json.loads(payload)["data"]
+            sorted(items, key=lambda item: -item["start"])
+            {item["id"]: item for item in items}
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples[2:]))
+
+
+def collect(repeat: int = 30, pages: int = 5, videos: int = 500, seed: int = 0):
+    """Run the gate workloads and return raw samples per metric."""
+    server = StandinServer.with_default_indexes(num_videos=videos, seed=seed)
+    timed = TimedServer(server)
+    client = server.make_client()
+    for _ in range(3):
+        drain(client, pages, **PARAMS)
+
+    page_latency: List[float] = []
+    client_overhead: List[float] = []
+    for _ in range(repeat):
+        pager, total, client_only = client_seconds(
+            timed, lambda: client.search.query(**PARAMS)
+        )
+        page_latency.append(total)
+        client_overhead.append(client_only)
+        for _ in range(pages - 1):
+            if not pager.has_next:
+                break
+            start = time.perf_counter()
+            pager = pager.next_page()
+            page_latency.append(time.perf_counter() - start)
+
+    peaks: List[float] = []
+    blocks: List[float] = []
+    tracemalloc.start()
+    try:
+        for _ in range(max(repeat // 3, 3)):
+            before = tracemalloc.take_snapshot()
+            base, _ = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            kept = drain(client, pages, **PARAMS)
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            peaks.append((peak - base) / 1024)
+            blocks.append(
+                sum(
+                    max(stat.count_diff, 0)
+                    for stat in after.compare_to(before, "filename")
+                )
+            )
+            del kept
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "calibration_s": calibration_seconds(),
+        "samples": {
+            "page_latency": page_latency,
+            "client_overhead": client_overhead,
+            "drain_peak_kib": peaks,
+            "drain_blocks": blocks,
+        },
+    }
+
+
+def _normalized(run: dict, metric: str) -> np.ndarray:
+    values = np.asarray(run["samples"][metric], dtype=np.float64)
+    if METRICS[metric][1]:
+        values = values / run["calibration_s"]
+    return values
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    thresholds: Dict[str, float] = None,
+    resamples: int = 2000,
+) -> Dict[str, dict]:
+    """Compare two ``collect`` results metric by metric."""
+    thresholds = thresholds or {}
+    report = {}
+    for metric, (statistic, _, default_threshold) in METRICS.items():
+        threshold = thresholds.get(metric, default_threshold)
+        ratio, low, high = bootstrap_ratio(
+            _normalized(current, metric),
+            _normalized(baseline, metric),
+            statistic,
+            resamples=resamples,
+        )
+        if low > 1.0 + threshold:
+            verdict = "regression"
+        elif high < 1.0 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "ok"
+        report[metric] = {
+            "statistic": statistic,
+            "threshold": threshold,
+            "ratio": round(ratio, 4),
+            "ci_low": round(low, 4),
+            "ci_high": round(high, 4),
+            "verdict": verdict,
+        }
+    return report
+
+
+def _rounded(run: dict) -> dict:
+    return {
+        "calibration_s": round(run["calibration_s"], 7),
+        "samples": {
+            metric: [round(float(value), 7) for value in values]
+            for metric, values in run["samples"].items()
+        },
+    }
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def sdk_mismatch(baseline: dict) -> Optional[str]:
+    """Baseline SDK version when it differs from the installed one, else None."""
+    recorded = baseline.get("environment", {}).get("twelvelabs")
+    if recorded and recorded != environment()["twelvelabs"]:
+        return recorded
+    return None
+
+
+def save_baseline(run: dict, path: str = BASELINE_PATH, settings: dict = None):
+    payload = {"environment": environment(), "settings": settings or {}}
+    payload.update(_rounded(run))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=1)
+        f.write("\n")
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.set_defaults(repeat=30)
+    parser.add_argument("--pages", type=int, default=5, help="Pages per drain")
+    parser.add_argument("--videos", type=int, default=500, help="Videos per index")
+    parser.add_argument(
+        "--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record this run as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="Override a metric's threshold, e.g. page_latency=0.2 (repeatable)",
+    )
+    parser.add_argument(
+        "--allow-sdk-mismatch",
+        action="store_true",
+        help="Compare even when the baseline was recorded with another SDK version",
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.update_baseline:
+        baseline = load_baseline(args.baseline)
+        recorded = sdk_mismatch(baseline)
+        if recorded:
+            message = (
+                f"baseline was recorded with twelvelabs {recorded}, but "
+                f"{environment()['twelvelabs']} is installed"
+            )
+            if not args.allow_sdk_mismatch:
+                parser.error(
+                    f"{message}; install twelvelabs=={recorded} or pass "
+                    "--allow-sdk-mismatch"
+                )
+            print(f"Warning: {message}; SDK changes show up as regressions")
+
+    settings = {"repeat": args.repeat, "pages": args.pages, "videos": args.videos}
+    run = collect(
+        repeat=args.repeat, pages=args.pages, videos=args.videos, seed=args.seed
+    )
+    if args.update_baseline:
+        save_baseline(run, args.baseline, settings)
+        print("Baseline written to", args.baseline)
+        return
+
+    if baseline.get("environment", {}).get("python", "").rsplit(".", 1)[0] != (
+        environment()["python"].rsplit(".", 1)[0]
+    ):
+        print(
+            f"Warning: baseline was recorded on Python "
+            f"{baseline['environment'].get('python')}; memory metrics may differ"
+        )
+    thresholds = {}
+    for entry in args.threshold:
+        metric, _, value = entry.partition("=")
+        if metric not in METRICS:
+            parser.error(
+                f"Unknown metric {metric!r} (choose from {', '.join(METRICS)})"
+            )
+        thresholds[metric] = float(value)
+
+    report = compare(run, baseline, thresholds)
+    failed = [
+        metric for metric, entry in report.items() if entry["verdict"] == "regression"
+    ]
+    for metric, entry in report.items():
+        print(
+            f"{metric:16s} {entry['statistic']:6s} ratio={entry['ratio']:.3f} "
+            f"CI=[{entry['ci_low']:.3f}, {entry['ci_high']:.3f}] "
+            f"threshold=+{entry['threshold']:.0%}  {entry['verdict']}"
+        )
+    results = {
+        "settings": settings,
+        "report": report,
+        "failed": failed,
+        **_rounded(run),
+    }
+    print("Results written to", write_results("perf_gate", results, args.output_dir))
+    if failed:
+        print("Performance regression in:", ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Cross-Python-version performance report
+
+Combines the ``bench_trend`` results of the CI test matrix (one file per Python
+version) into one side-by-side report: import time, and per index page
+latency, pages per second, client overhead and peak memory. The reference
+column is the oldest interpreter unless ``--reference`` is given.
+
+    python -m benchmarks.python_matrix --snapshots 'bench-trend/*/bench_trend.json' \\
+        --html public/python-matrix.html
+
+The Markdown table is also appended to ``$GITHUB_STEP_SUMMARY`` when it is set.
+"""
+
+import glob
+import json
+import os
+from typing import Dict, List
+
+from .common import base_parser, write_results
+from .dashboard import python_version
+from .report import render_html_table, render_markdown, side_by_side
+
+
+def _version_key(version: str):
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def load_snapshots(paths: List[str], reference: str = None) -> Dict[str, dict]:
+    """Python version -> bench_trend result, reference version first."""
+    results = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        results[python_version(snapshot)] = snapshot
+    order = sorted(results, key=_version_key)
+    if reference in results:
+        order.remove(reference)
+        order.insert(0, reference)
+    return {version: results[version] for version in order}
+
+
+def render_page(results: Dict[str, dict], rows: List[dict]) -> str:
+    headers = {version: f"Python {version}" for version in results}
+    sdk = sorted(
+        {r.get("environment", {}).get("twelvelabs", "?") for r in results.values()}
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>Python Version Performance Matrix</title>
+  <style>
+    body {{ font-family: -apple-system, sans-serif; padding: 40px; background: #f6f8fa; color: #24292e; }}
+    .container {{ max-width: 960px; margin: 0 auto; }}
+    .card {{ background: white; padding: 20px; margin-bottom: 20px; border: 1px solid #e1e4e8; border-radius: 6px; }}
+    table {{ width: 100%; border-collapse: collapse; font-size: 13px; }}
+    th, td {{ padding: 6px; text-align: left; border-bottom: 1px solid #eaecef; }}
+    .pass {{ color: #2ea44f; font-weight: bold; }}
+    .fail {{ color: #cb2431; font-weight: bold; }}
+  </style>
+</head>
+<body>
+  <div class="container">
+    <h1>🐍 Python Version Performance Matrix</h1>
+    <div class="card">
+      <p>Offline <code>bench_trend</code> workload against the stand-in, SDK
+      {", ".join(sdk)}. Changes are relative to Python {next(iter(results), "?")};
+      more than 5% better or worse is highlighted.
+      <a href="index.html">Back to dashboard</a></p>
+      {render_html_table(results, rows, headers)}
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--snapshots",
+        required=True,
+        help="Glob of bench_trend result files (one per Python version)",
+    )
+    parser.add_argument(
+        "--reference", default=None, help="Reference Python version (default: oldest)"
+    )
+    parser.add_argument("--html", default=None, help="Also write an HTML page here")
+    args = parser.parse_args()
+
+    results = load_snapshots(sorted(glob.glob(args.snapshots)), args.reference)
+    if not results:
+        parser.error(f"No benchmark snapshots matched {args.snapshots}")
+    rows = side_by_side(results)
+    headers = {version: f"Python {version}" for version in results}
+    markdown = render_markdown(results, rows, headers)
+    print(markdown)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    with open(
+        os.path.join(args.output_dir, "python_matrix.md"), "w", encoding="utf-8"
+    ) as f:
+        f.write(markdown)
+    summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if summary:
+        with open(summary, "a", encoding="utf-8") as f:
+            f.write("## Performance by Python version\n\n" + markdown + "\n")
+    if args.html:
+        os.makedirs(os.path.dirname(args.html) or ".", exist_ok=True)
+        with open(args.html, "w", encoding="utf-8") as f:
+            f.write(render_page(results, rows))
+    path = write_results(
+        "python_matrix",
+        {"reference": next(iter(results)), "rows": rows},
+        args.output_dir,
+    )
+    print("Results written to", path)
+
+
+if __name__ == "__main__":
+    main()
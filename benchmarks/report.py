@@ -0,0 +1,126 @@
+"""
+Side-by-side reports of ``bench_trend`` results
+
+Shared by ``sdk_compare`` (one column per SDK version) and ``python_matrix``
+(one column per Python version). The first column is the reference; the others
+show their change against it.
+"""
+
+import html
+from typing import Dict, List, Optional
+
+# (key in a bench_trend index entry, label, higher is better)
+METRICS = (
+    ("page_latency.p50_ms", "page p50 (ms)", False),
+    ("page_latency.p95_ms", "page p95 (ms)", False),
+    ("page_latency.p99_ms", "page p99 (ms)", False),
+    ("pages_per_sec", "pages/sec", True),
+    ("client_overhead.p50_ms", "client overhead p50 (ms)", False),
+    ("peak_kib", "peak memory (KiB)", False),
+)
+
+# Same, for keys at the top level of a bench_trend result
+STARTUP_METRICS = (
+    ("startup.import_twelvelabs.p50_ms", "import twelvelabs p50 (ms)", False),
+)
+
+
+def metric_value(entry: dict, key: str) -> Optional[float]:
+    for part in key.split("."):
+        if not isinstance(entry, dict) or part not in entry:
+            return None
+        entry = entry[part]
+    return float(entry)
+
+
+def _row(results: Dict[str, dict], index: str, entries: Dict[str, dict], metric):
+    key, label, higher_is_better = metric
+    columns = list(results)
+    measured = [c for c in columns if "indexes" in results[c]]
+    base = metric_value(entries.get(measured[0]), key) if measured else None
+    cells = {}
+    for column in columns:
+        value = metric_value(entries.get(column), key)
+        change = (value - base) / base if value is not None and base else None
+        cells[column] = {"value": value, "change": change}
+    return {
+        "index": index,
+        "metric": label,
+        "higher_is_better": higher_is_better,
+        "versions": cells,
+    }
+
+
+def side_by_side(results: Dict[str, dict]) -> List[dict]:
+    """One row per metric (and index) with each column's value and change vs the first.
+
+    Columns whose result has no ``indexes`` (failed runs) get ``None`` values.
+    """
+    measured = {c: r for c, r in results.items() if "indexes" in r}
+    rows = [_row(results, "-", measured, metric) for metric in STARTUP_METRICS]
+    indexes = sorted({i for r in measured.values() for i in r["indexes"]})
+    for index in indexes:
+        entries = {c: r["indexes"].get(index) for c, r in measured.items()}
+        rows += [_row(results, index, entries, metric) for metric in METRICS]
+    return [
+        row
+        for row in rows
+        if any(c["value"] is not None for c in row["versions"].values())
+    ]
+
+
+def _cell(cell: dict, reference: bool) -> str:
+    if cell["value"] is None:
+        return "n/a"
+    if reference or cell["change"] is None:
+        return f"{cell['value']:.4g}"
+    return f"{cell['value']:.4g} ({cell['change']:+.1%})"
+
+
+def render_markdown(
+    results: Dict[str, dict], rows: List[dict], headers: Dict[str, str] = None
+) -> str:
+    """Markdown table; ``headers`` overrides column titles (default: column keys)."""
+    columns = list(results)
+    headers = headers or {}
+    lines = [
+        "| index | metric | " + " | ".join(headers.get(c, c) for c in columns) + " |",
+        "|---|---|" + "---:|" * len(columns),
+    ]
+    for row in rows:
+        cells = [
+            _cell(row["versions"][c], position == 0)
+            for position, c in enumerate(columns)
+        ]
+        lines.append(
+            f"| {row['index']} | {row['metric']} | " + " | ".join(cells) + " |"
+        )
+    errors = [f"- {c}: {results[c]['error']}" for c in columns if "error" in results[c]]
+    if errors:
+        lines += ["", "Failed:", *errors]
+    return "\n".join(lines) + "\n"
+
+
+def render_html_table(
+    results: Dict[str, dict], rows: List[dict], headers: Dict[str, str] = None
+) -> str:
+    """HTML table; changes for the worse are marked with the ``fail`` class."""
+    columns = list(results)
+    headers = headers or {}
+    head = "".join(f"<th>{html.escape(headers.get(c, c))}</th>" for c in columns)
+    body = []
+    for row in rows:
+        cells = []
+        for position, column in enumerate(columns):
+            cell = row["versions"][column]
+            change = cell["change"] or 0.0
+            worse = -change if row["higher_is_better"] else change
+            css = " class='fail'" if position and worse > 0.05 else ""
+            if position and worse < -0.05:
+                css = " class='pass'"
+            cells.append(f"<td{css}>{html.escape(_cell(cell, position == 0))}</td>")
+        body.append(
+            f"<tr><td>{html.escape(row['index'])}</td>"
+            f"<td>{html.escape(row['metric'])}</td>{''.join(cells)}</tr>"
+        )
+    return f"<table><tr><th>Index</th><th>Metric</th>{head}</tr>{''.join(body)}</table>"
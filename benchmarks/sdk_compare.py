@@ -0,0 +1,176 @@
+"""
+Cross-SDK-version performance comparison
+
+Installs each requested twelvelabs SDK version into its own virtual environment
+under ``--envs-dir`` and runs the same offline workload (``bench_trend`` against
+the in-process stand-in) with every one. The results are written to a
+side-by-side report (Markdown and JSON) with import time, and page latency,
+pages per second, client overhead and peak memory per index. The first version is the reference
+column and the others are shown relative to it.
+
+    python -m benchmarks.sdk_compare 1.3.5 1.3.6
+    python -m benchmarks.sdk_compare current git+https://github.com/twelvelabs-io/twelvelabs-python@main
+
+A version is a release number (installed as ``twelvelabs==<version>``), any
+other pip requirement (a VCS URL or a local path), or ``current`` for the SDK
+already installed in the running interpreter. Environments are reused on later
+runs unless ``--recreate`` is given.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import venv
+from typing import Dict, List
+
+from .common import base_parser, write_results
+from .report import render_markdown, side_by_side
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CURRENT = "current"
+
+
+def requirement(version: str) -> str:
+    """pip requirement for a version argument."""
+    if re.fullmatch(r"[0-9][0-9A-Za-z.+!-]*", version):
+        return f"twelvelabs=={version}"
+    return version
+
+
+def slug(version: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", version).strip("_")[:80]
+
+
+def _env_python(env_dir: str) -> str:
+    if os.name == "nt":
+        return os.path.join(env_dir, "Scripts", "python.exe")
+    return os.path.join(env_dir, "bin", "python")
+
+
+def _workload_requirements() -> List[str]:
+    """requirements.txt without the SDK itself (the environment's version is pinned)."""
+    with open(os.path.join(ROOT, "requirements.txt"), "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    return [
+        line
+        for line in lines
+        if line and not line.startswith("#") and not line.startswith("twelvelabs")
+    ]
+
+
+def ensure_env(version: str, envs_dir: str, recreate: bool = False) -> str:
+    """Create (or reuse) the environment for ``version``; return its interpreter."""
+    if version == CURRENT:
+        return sys.executable
+    env_dir = os.path.join(envs_dir, slug(version))
+    marker = os.path.join(env_dir, ".sdk-requirement")
+    spec = requirement(version)
+    if not recreate and os.path.exists(marker):
+        with open(marker, "r", encoding="utf-8") as f:
+            if f.read() == spec:
+                return _env_python(env_dir)
+    if os.path.exists(env_dir):
+        shutil.rmtree(env_dir)
+    venv.EnvBuilder(with_pip=True).create(env_dir)
+    python = _env_python(env_dir)
+    subprocess.run(
+        [python, "-m", "pip", "install", "-q", spec, *_workload_requirements()],
+        check=True,
+    )
+    with open(marker, "w", encoding="utf-8") as f:
+        f.write(spec)
+    return python
+
+
+def run_workload(python: str, output_dir: str, workload_args: List[str]) -> dict:
+    """Run bench_trend with ``python`` from the repository root; return its results."""
+    subprocess.run(
+        [python, "-m", "benchmarks.bench_trend", "--output-dir", output_dir]
+        + workload_args,
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    with open(os.path.join(output_dir, "bench_trend.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(
+    versions: List[str],
+    envs_dir: str,
+    output_dir: str,
+    workload_args: List[str],
+    recreate: bool = False,
+) -> Dict[str, dict]:
+    """Install and benchmark every version; failures are recorded, not raised."""
+    results: Dict[str, dict] = {}
+    for version in versions:
+        print(f"[{version}] preparing environment")
+        try:
+            python = ensure_env(version, envs_dir, recreate)
+            print(f"[{version}] running workload")
+            results[version] = run_workload(
+                python, os.path.join(output_dir, "sdk", slug(version)), workload_args
+            )
+        except subprocess.CalledProcessError as e:
+            detail = (e.stderr or "").strip().splitlines()[-1:] or [str(e)]
+            results[version] = {"error": detail[0]}
+            print(f"[{version}] failed: {detail[0]}")
+    return results
+
+
+def main():
+    parser = base_parser(__doc__.strip().splitlines()[0])
+    parser.set_defaults(repeat=30)
+    parser.add_argument(
+        "versions",
+        nargs="+",
+        help="SDK versions to compare (release number, pip requirement or 'current')",
+    )
+    parser.add_argument("--pages", type=int, default=5, help="Pages per drain")
+    parser.add_argument("--videos", type=int, default=500, help="Videos per index")
+    parser.add_argument(
+        "--envs-dir", default=".sdk-envs", help="Directory for the per-version venvs"
+    )
+    parser.add_argument(
+        "--recreate", action="store_true", help="Rebuild environments that exist"
+    )
+    args = parser.parse_args()
+
+    workload_args = [
+        f"--repeat={args.repeat}",
+        f"--pages={args.pages}",
+        f"--videos={args.videos}",
+        f"--seed={args.seed}",
+    ]
+    results = compare(
+        args.versions, args.envs_dir, args.output_dir, workload_args, args.recreate
+    )
+    rows = side_by_side(results)
+    headers = {}
+    for version, result in results.items():
+        installed = result.get("environment", {}).get("twelvelabs")
+        if installed and installed != version:
+            headers[version] = f"{version} ({installed})"
+    markdown = render_markdown(results, rows, headers)
+    print(markdown)
+    os.makedirs(args.output_dir, exist_ok=True)
+    with open(
+        os.path.join(args.output_dir, "sdk_compare.md"), "w", encoding="utf-8"
+    ) as f:
+        f.write(markdown)
+    path = write_results(
+        "sdk_compare", {"versions": results, "rows": rows}, args.output_dir
+    )
+    print("Results written to", path)
+    if any("error" in result for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
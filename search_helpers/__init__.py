@@ -0,0 +1,38 @@
+"""
+Client-side helpers for ``search.query``
+
+Alternative ways to issue searches and consume their pages with the Twelve Labs
+SDK's own HTTP client (same base URL, headers, retries and timeouts as
+``client.search.query``).
+"""
+
+from .adaptive import AdaptivePager, PageSizeTuner
+from .fanout import FanoutSearch, Hit, by_rank, by_score, query_many
+from .fast_path import FastPage, FastSearchPager, query_fast
+from .hedging import HedgeBudget, HedgingTransport, hedge
+from .metadata import LazyMetadata, decode_page
+from .raw import UnsupportedSDKError
+from .top_k import TopK, page_limit_for, query_top_k, top_k
+
+__all__ = [
+    "AdaptivePager",
+    "FanoutSearch",
+    "FastPage",
+    "FastSearchPager",
+    "HedgeBudget",
+    "HedgingTransport",
+    "Hit",
+    "LazyMetadata",
+    "PageSizeTuner",
+    "TopK",
+    "UnsupportedSDKError",
+    "by_rank",
+    "by_score",
+    "decode_page",
+    "hedge",
+    "page_limit_for",
+    "query_fast",
+    "query_many",
+    "query_top_k",
+    "top_k",
+]
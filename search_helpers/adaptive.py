@@ -0,0 +1,208 @@
+"""
+Adaptive ``page_limit`` for repeated searches
+
+The right page size depends on how results are consumed. A caller that shows
+the first few results wants small pages: the first page arrives sooner because
+less is searched, serialized and decoded. A caller that drains hundreds of
+results wants 50 per page, because every extra request pays the fixed
+round-trip cost again.
+
+``AdaptivePager`` runs searches through ``client.search.query`` and measures,
+per search, the latency of every page request and the number of items the
+caller actually consumed. ``PageSizeTuner`` fits page latency as
+``base + per_item * items`` by least squares over recent pages. For every
+``page_limit`` from 1 to 50 it computes the time the recent searches would
+have taken to deliver what their callers consumed, and uses the fastest
+(smallest on ties) for the next fresh search. A ``page_limit`` passed explicitly
+is used as is, but the search still feeds the tuner.
+
+Decisions are kept in ``PageSizeTuner.decisions`` and logged to the
+``search_helpers.adaptive`` logger (changes at INFO, unchanged at DEBUG).
+"""
+
+import logging
+import time
+import typing
+from collections import deque
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .top_k import MAX_PAGE_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+class Decision(NamedTuple):
+    """A page size chosen after a search."""
+
+    searches: int
+    previous: int
+    page_limit: int
+    consumed_p50: float
+    base_s: float
+    per_item_s: float
+    expected_s: float
+
+
+class PageSizeTuner:
+    """Chooses ``page_limit`` from recent page latencies and consumption.
+
+    Args:
+        initial: Page size until the first search is recorded
+        window: Searches whose consumption is remembered
+        page_window: Page latencies used for the latency fit
+    """
+
+    def __init__(self, initial: int = 10, window: int = 20, page_window: int = 100):
+        if not 1 <= initial <= MAX_PAGE_LIMIT:
+            raise ValueError(f"initial must be between 1 and {MAX_PAGE_LIMIT}")
+        self.page_limit = initial
+        self.consumed: deque = deque(maxlen=window)
+        self.pages: deque = deque(maxlen=page_window)
+        self.searches = 0
+        self.decisions: List[Decision] = []
+
+    def page_cost(self) -> Tuple[float, float]:
+        """(base seconds, seconds per item) of a page request, fitted by least squares."""
+        if not self.pages:
+            return 0.0, 0.0
+        items = [float(n) for n, _ in self.pages]
+        latencies = [latency for _, latency in self.pages]
+        mean_items = sum(items) / len(items)
+        mean_latency = sum(latencies) / len(latencies)
+        spread = sum((n - mean_items) ** 2 for n in items)
+        if spread == 0:
+            return mean_latency, 0.0
+        per_item = (
+            sum((n - mean_items) * (t - mean_latency) for n, t in zip(items, latencies))
+            / spread
+        )
+        per_item = max(per_item, 0.0)
+        return max(mean_latency - per_item * mean_items, 0.0), per_item
+
+    def expected_time(self, page_limit: int, base: float, per_item: float) -> float:
+        """Mean time the recent searches would take to deliver what was consumed."""
+        total = 0.0
+        for consumed in self.consumed:
+            pages = -(-max(consumed, 1) // page_limit)
+            total += pages * (base + per_item * page_limit)
+        return total / max(len(self.consumed), 1)
+
+    def record(
+        self, page_limit: int, consumed: int, pages: Sequence[Tuple[int, float]]
+    ):
+        """Add a finished search and choose the page size of the next one.
+
+        Args:
+            page_limit: The search's page size
+            consumed: Items the caller read
+            pages: (items returned, latency in seconds) of every page requested
+        """
+        self.searches += 1
+        self.consumed.append(consumed)
+        self.pages.extend(pages)
+        base, per_item = self.page_cost()
+        expected = {
+            limit: self.expected_time(limit, base, per_item)
+            for limit in range(1, MAX_PAGE_LIMIT + 1)
+        }
+        best = min(expected, key=lambda limit: (expected[limit], limit))
+        ordered = sorted(self.consumed)
+        decision = Decision(
+            self.searches,
+            self.page_limit,
+            best,
+            float(ordered[len(ordered) // 2]),
+            base,
+            per_item,
+            expected[best],
+        )
+        self.decisions.append(decision)
+        logger.log(
+            logging.INFO if best != self.page_limit else logging.DEBUG,
+            "page_limit %d -> %d after %d searches (consumed p50 %.0f items, "
+            "page latency %.1f ms + %.3f ms/item, expected %.1f ms per search)",
+            decision.previous,
+            best,
+            decision.searches,
+            decision.consumed_p50,
+            base * 1000,
+            per_item * 1000,
+            expected[best] * 1000,
+        )
+        self.page_limit = best
+
+
+class AdaptiveSearch:
+    """Items of one search, with its page latencies and consumption.
+
+    Attributes:
+        page_limit: The page size the search was sent with
+        consumed: Items read so far
+        pages: (items returned, latency in seconds) of every page requested
+    """
+
+    def __init__(self, pager, page_limit: int, first_latency: float, tuner):
+        self._first = pager
+        self.page_limit = page_limit
+        self.consumed = 0
+        self.pages: List[Tuple[int, float]] = [(len(pager.items or ()), first_latency)]
+        self._tuner = tuner
+        self._finished = False
+
+    def __iter__(self) -> Iterator[typing.Any]:
+        page = self._first
+        try:
+            while True:
+                for item in page.items or ():
+                    self.consumed += 1
+                    yield item
+                if not page.has_next or page.get_next is None:
+                    return
+                start = time.perf_counter()
+                page = page.next_page()
+                if page is None:
+                    return
+                self.pages.append((len(page.items or ()), time.perf_counter() - start))
+                if not page.items:
+                    return
+        finally:
+            self.finish()
+
+    def finish(self):
+        """Report the search to the tuner (once; called when iteration ends)."""
+        if not self._finished:
+            self._finished = True
+            self._tuner.record(self.page_limit, self.consumed, self.pages)
+
+
+class AdaptivePager:
+    """Runs searches with a ``page_limit`` tuned to how results are consumed.
+
+    Args:
+        client: ``TwelveLabs`` client
+        tuner: Shared ``PageSizeTuner`` (default: a new one)
+    """
+
+    def __init__(self, client, tuner: Optional[PageSizeTuner] = None):
+        self.client = client
+        self.tuner = tuner or PageSizeTuner()
+        self._last: Optional[AdaptiveSearch] = None
+
+    def query(self, **params) -> AdaptiveSearch:
+        """Send ``client.search.query`` with the tuned ``page_limit``.
+
+        The previous search of this pager is reported to the tuner first, even
+        when its iteration was abandoned without being closed.
+
+        Raises:
+            ApiError: Same error types as ``client.search.query``
+        """
+        if self._last is not None:
+            self._last.finish()
+        params.setdefault("page_limit", self.tuner.page_limit)
+        start = time.perf_counter()
+        pager = self.client.search.query(**params)
+        self._last = AdaptiveSearch(
+            pager, params["page_limit"], time.perf_counter() - start, self.tuner
+        )
+        return self._last
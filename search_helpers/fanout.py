@@ -0,0 +1,209 @@
+"""
+Fan-out search over several indexes
+
+``query_many`` sends ``client.search.query`` to every index concurrently and
+merges the per-index result streams into one ranked stream with a heap-based
+k-way merge. Each index's results are already ordered, so the merge only holds
+the current head of every stream: the next page of an index is requested when
+its last buffered item is consumed, never ahead of time. With ``k`` the merge
+stops after ``k`` distinct results, so no page beyond the settled top-k is
+fetched.
+
+Results are ordered by a key of ``(item, position)``, where ``position`` is the
+item's 1-based position in its index's results:
+
+- ``by_rank`` (default): the item's ``rank`` (Marengo 3.0), or its position
+  when the index returns scores instead (Marengo 2.7). Indexes of different
+  models are interleaved rank by rank.
+- ``by_score``: highest ``score`` first, for indexes that all return scores;
+  items without a score come after every scored item.
+
+Results found in more than one index (same video and time range, or same video
+with ``group_by="video"``) are yielded once, from the index that ranks them
+first.
+"""
+
+import heapq
+import typing
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, NamedTuple, Optional, Sequence
+
+from .top_k import page_limit_for
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class Hit(NamedTuple):
+    """One merged result and the index it came from."""
+
+    index_id: str
+    item: typing.Any
+
+
+def _first_clip(item):
+    clips = getattr(item, "clips", None)
+    return clips[0] if clips else item
+
+
+def by_rank(item, position: int):
+    rank = _first_clip(item).rank
+    return rank if rank is not None else position
+
+
+def by_score(item, position: int):
+    score = _first_clip(item).score
+    return (0, -score) if score is not None else (1, position)
+
+
+def identity(item) -> tuple:
+    """Key under which results from different indexes are duplicates."""
+    if getattr(item, "clips", None) is not None:
+        return ("video", item.id)
+    return ("clip", item.video_id, item.start, item.end)
+
+
+class _Stream:
+    """Results of one index, advanced one item at a time."""
+
+    __slots__ = ("order", "index_id", "page", "offset", "position")
+
+    def __init__(self, order: int, index_id: str, page):
+        self.order = order
+        self.index_id = index_id
+        self.page = page
+        self.offset = 0
+        self.position = 0
+
+
+class FanoutSearch:
+    """Merged results of one search over several indexes (see ``query_many``).
+
+    Attributes:
+        pages_fetched: Pages requested per index ID, first pages included
+        duplicates: Results skipped because another index already returned them
+    """
+
+    def __init__(
+        self,
+        client,
+        index_ids: Sequence[str],
+        params: dict,
+        k: Optional[int] = None,
+        key: Callable[[typing.Any, int], typing.Any] = by_rank,
+        dedupe: bool = True,
+        max_workers: Optional[int] = None,
+    ):
+        if k is not None and k < 1:
+            raise ValueError("k must be at least 1")
+        self.index_ids = list(index_ids)
+        self.k = k
+        self.key = key
+        self.dedupe = dedupe
+        self.pages_fetched: Counter = Counter()
+        self.duplicates = 0
+        self._first_pages = self._query_all(client, params, max_workers)
+
+    def _query_all(self, client, params: dict, max_workers: Optional[int]) -> list:
+        if not self.index_ids:
+            return []
+        workers = min(len(self.index_ids), max_workers or DEFAULT_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(client.search.query, index_id=index_id, **params)
+                for index_id in self.index_ids
+            ]
+            pages = [future.result() for future in futures]
+        self.pages_fetched.update(self.index_ids)
+        return pages
+
+    def _advance(self, stream: _Stream) -> Optional[tuple]:
+        """Heap entry of the stream's next item, fetching its next page if needed."""
+        page = stream.page
+        while page is not None and stream.offset >= len(page.items or ()):
+            if not page.has_next or page.get_next is None:
+                page = None
+                break
+            page = page.next_page()
+            self.pages_fetched[stream.index_id] += 1
+            stream.offset = 0
+            if page is None or not page.items:
+                page = None
+        stream.page = page
+        if page is None:
+            return None
+        item = page.items[stream.offset]
+        stream.offset += 1
+        stream.position += 1
+        return (self.key(item, stream.position), stream.order, stream.position, item)
+
+    def __iter__(self) -> Iterator[Hit]:
+        streams = [
+            _Stream(order, index_id, page)
+            for order, (index_id, page) in enumerate(
+                zip(self.index_ids, self._first_pages)
+            )
+        ]
+        heap = [entry for entry in map(self._advance, streams) if entry is not None]
+        heapq.heapify(heap)
+        seen = set()
+        produced = 0
+        while heap and (self.k is None or produced < self.k):
+            _, order, _, item = heap[0]
+            stream = streams[order]
+            duplicate = False
+            if self.dedupe:
+                item_key = identity(item)
+                duplicate = item_key in seen
+                seen.add(item_key)
+            if duplicate:
+                self.duplicates += 1
+            else:
+                produced += 1
+                yield Hit(stream.index_id, item)
+                if self.k is not None and produced >= self.k:
+                    return
+            entry = self._advance(stream)
+            if entry is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, entry)
+
+    def top(self) -> List[Hit]:
+        """All merged results, or the first ``k`` when ``k`` was given."""
+        return list(self)
+
+
+def query_many(
+    client,
+    index_ids: Sequence[str],
+    k: Optional[int] = None,
+    key: Callable[[typing.Any, int], typing.Any] = by_rank,
+    dedupe: bool = True,
+    max_workers: Optional[int] = None,
+    **params,
+) -> FanoutSearch:
+    """Run ``search.query`` on every index concurrently and merge the results.
+
+    Returns once every index has answered its first page; iterating the result
+    yields ``Hit(index_id, item)`` in merged order and fetches later pages only
+    as the merge reaches them.
+
+    Args:
+        client: ``TwelveLabs`` client (shared by the worker threads)
+        index_ids: Indexes to search, in tie-breaking order
+        k: Stop after this many distinct results (None: merge everything). With
+            k, ``page_limit`` defaults to ``page_limit_for(k)``
+        key: Merge key of ``(item, position)``, ascending (``by_rank``, ``by_score``)
+        dedupe: Yield results found in several indexes once
+        max_workers: Concurrent first-page requests (default: up to 8)
+        **params: ``search.query`` parameters other than ``index_id``
+
+    Raises:
+        ApiError: The first error of any index, as raised by ``client.search.query``
+    """
+    if "index_id" in params:
+        raise TypeError("query_many takes index_ids instead of index_id")
+    if k is not None and k >= 1:
+        params.setdefault("page_limit", page_limit_for(k))
+    return FanoutSearch(client, index_ids, params, k, key, dedupe, max_workers)
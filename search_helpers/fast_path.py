@@ -0,0 +1,190 @@
+"""
+Raw-response fast path for bulk consumers of search results
+
+``query_fast`` issues the same request as ``client.search.query`` but skips
+pydantic: each page's JSON is decoded once (orjson when available) and exposed
+as ``(video_id, start, end, rank)`` rows or NumPy columns. Full ``SearchItem``
+models are only built when ``FastPage.items()`` is called.
+
+Grouped results (``group_by="video"``) are flattened to one row per clip.
+
+With ``lazy_metadata=True`` or ``metadata_fields=[...]``, ``user_metadata`` is
+left as raw bytes until accessed or projected to the listed fields (see
+``search_helpers.metadata``).
+"""
+
+import typing
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .metadata import decode_page, materialize
+from .raw import get_page, loads, post_search
+
+Row = Tuple[str, Optional[float], Optional[float], Optional[int]]
+
+
+def _clip_rows(data: List[dict]) -> Iterator[Row]:
+    for item in data:
+        clips = item.get("clips")
+        if clips is None:
+            yield (
+                item.get("video_id"),
+                item.get("start"),
+                item.get("end"),
+                item.get("rank"),
+            )
+            continue
+        video_id = item.get("id") or item.get("video_id")
+        for clip in clips:
+            yield (
+                clip.get("video_id") or video_id,
+                clip.get("start"),
+                clip.get("end"),
+                clip.get("rank"),
+            )
+
+
+class FastPage:
+    """One decoded page of search results.
+
+    Attributes:
+        data: The page's items as decoded JSON (dicts)
+        page_info: The page's ``page_info`` dict
+    """
+
+    __slots__ = ("data", "page_info", "_items")
+
+    def __init__(self, payload: dict):
+        self.data: List[dict] = payload.get("data") or []
+        self.page_info: Dict[str, typing.Any] = payload.get("page_info") or {}
+        self._items = None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def next_page_token(self) -> Optional[str]:
+        return self.page_info.get("next_page_token")
+
+    def rows(self) -> List[Row]:
+        """Return ``(video_id, start, end, rank)`` per clip (rank is None on Marengo 2.7)."""
+        return list(_clip_rows(self.data))
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the rows column-wise.
+
+        ``start``/``end`` are float64 (NaN when absent) and ``rank`` is int64
+        (0 when absent, e.g. Marengo 2.7 results).
+        """
+        rows = self.rows()
+        return {
+            "video_id": np.array([row[0] for row in rows], dtype=object),
+            "start": np.array(
+                [np.nan if row[1] is None else row[1] for row in rows],
+                dtype=np.float64,
+            ),
+            "end": np.array(
+                [np.nan if row[2] is None else row[2] for row in rows],
+                dtype=np.float64,
+            ),
+            "rank": np.array([row[3] or 0 for row in rows], dtype=np.int64),
+        }
+
+    def items(self) -> list:
+        """Build (once) and return the page's ``SearchItem`` models."""
+        if self._items is None:
+            from twelvelabs.core.pydantic_utilities import parse_obj_as
+            from twelvelabs.types import SearchItem
+
+            self._items = parse_obj_as(
+                type_=List[SearchItem], object_=materialize(self.data)
+            )
+        return self._items
+
+
+class FastSearchPager:
+    """Iterates the pages of one search, fetching each page on demand.
+
+    Args:
+        client: ``TwelveLabs`` client used for page requests
+        first_page: The search's first page
+        decode: Decodes a raw response body into a payload dict
+    """
+
+    def __init__(
+        self,
+        client,
+        first_page: FastPage,
+        decode: Callable[[bytes], dict] = loads,
+    ):
+        self.client = client
+        self.first_page = first_page
+        self.decode = decode
+        self.pages_fetched = 1
+
+    def iter_pages(self) -> Iterator[FastPage]:
+        page = self.first_page
+        while True:
+            yield page
+            token = page.next_page_token
+            if not token:
+                return
+            page = FastPage(self.decode(get_page(self.client, token).content))
+            self.pages_fetched += 1
+            if not page.data:
+                return
+
+    def rows(self) -> Iterator[Row]:
+        """Yield rows across all pages."""
+        for page in self.iter_pages():
+            yield from _clip_rows(page.data)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the columns of all pages concatenated."""
+        pages = [page.columns() for page in self.iter_pages()]
+        return {
+            name: np.concatenate([page[name] for page in pages])
+            for name in ("video_id", "start", "end", "rank")
+        }
+
+    def __iter__(self):
+        """Yield ``SearchItem`` models across all pages (built per page on demand)."""
+        for page in self.iter_pages():
+            yield from page.items()
+
+
+def _page_decoder(
+    lazy_metadata: bool, metadata_fields: Optional[Sequence[str]]
+) -> Callable[[bytes], dict]:
+    if metadata_fields is not None:
+        fields = tuple(metadata_fields)
+        return lambda body: decode_page(body, fields)
+    if lazy_metadata:
+        return decode_page
+    return loads
+
+
+def query_fast(
+    client,
+    lazy_metadata: bool = False,
+    metadata_fields: Optional[Sequence[str]] = None,
+    **params,
+) -> FastSearchPager:
+    """Run ``search.query`` without building pydantic models.
+
+    Accepts the same search parameters as ``client.search.query`` (except the
+    deprecated ones and the plural media parameters).
+
+    Args:
+        lazy_metadata: Keep each ``user_metadata`` as a ``LazyMetadata`` that is
+            decoded on first access
+        metadata_fields: Decode only these top-level ``user_metadata`` fields
+            (takes precedence over ``lazy_metadata``)
+
+    Raises:
+        ApiError: Same error types as ``client.search.query``
+    """
+    decode = _page_decoder(lazy_metadata, metadata_fields)
+    response = post_search(client, params)
+    return FastSearchPager(client, FastPage(decode(response.content)), decode)
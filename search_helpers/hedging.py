@@ -0,0 +1,228 @@
+"""
+Hedged search requests
+
+A search whose response is slower than almost all others is usually slow for
+reasons that a second, identical request does not share (a busy replica, a
+lost packet). ``HedgingTransport`` sends search requests (``search.query``:
+``POST /search``; ``next_page()``: ``GET /search/{token}``) and, when one has
+not answered within the ``percentile``-th percentile of recent latencies of its
+endpoint, sends the same request again. The first response to complete is
+returned. The other request is cancelled if it has not started yet; otherwise
+its response is closed unread when it arrives, because a blocking HTTP request
+cannot be interrupted.
+
+Every hedge spends from a ``HedgeBudget``. The budget earns ``ratio`` of a hedge
+per search request, up to ``burst``, so over any run the transport sends at
+most ``burst + ratio * requests`` extra requests. Share one budget between
+transports to cap the extra load of a whole process.
+
+Delays come from the latencies of first requests (hedges excluded, so hedging
+does not pull its own threshold down), measured to the response headers. Until
+``min_samples`` have been seen, ``initial_delay`` is used; when it is None, the
+request is sent directly, without hedging. A delay of 0 sends both copies at
+once, without waiting for the first.
+
+The body of the winning response is returned unread, so ``query_streaming``
+still decodes it incrementally.
+
+Other requests pass through unchanged. ``hedge(client)`` installs the transport
+on an existing ``TwelveLabs`` client.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Optional
+
+import numpy as np
+
+from .raw import http_client
+
+ENDPOINT_SEARCH = "search"
+ENDPOINT_SEARCH_PAGE = "search_page"
+
+
+def endpoint_of(request) -> Optional[str]:
+    """Search endpoint of an httpx request, or None for other requests."""
+    path = request.url.path.rstrip("/")
+    if request.method == "POST" and path.endswith("/search"):
+        return ENDPOINT_SEARCH
+    head, _, token = path.rpartition("/")
+    if request.method == "GET" and token and head.endswith("/search"):
+        return ENDPOINT_SEARCH_PAGE
+    return None
+
+
+class HedgeBudget:
+    """Token bucket of hedges: ``ratio`` per request, at most ``burst`` saved.
+
+    Thread-safe; one budget may be shared by several transports.
+    """
+
+    def __init__(self, ratio: float = 0.05, burst: float = 2.0):
+        if ratio < 0 or burst < 0:
+            raise ValueError("ratio and burst must be >= 0")
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.granted = 0
+        self.denied = 0
+
+    def earn(self):
+        """Credit one search request."""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one hedge if the budget allows it."""
+        with self._lock:
+            if self._tokens >= 1.0 - 1e-9:
+                self._tokens -= 1.0
+                self.granted += 1
+                return True
+            self.denied += 1
+            return False
+
+
+class HedgingTransport:
+    """httpx transport wrapper that hedges slow search requests.
+
+    Args:
+        inner: Transport that actually sends the request (e.g. ``httpx.HTTPTransport()``)
+        percentile: Hedge after this percentile of recent latencies of the endpoint
+        budget: Shared ``HedgeBudget`` (default: a new one, 5% and a burst of 2)
+        min_samples: Latencies needed before the percentile is used
+        initial_delay: Hedge delay in seconds until then (None: no hedging)
+        window: Recent latencies kept per endpoint
+        max_workers: Threads sending requests concurrently
+
+    Attributes:
+        hedged: Requests that were sent a second time
+        hedge_wins: Hedged requests answered first by the second request
+    """
+
+    def __init__(
+        self,
+        inner,
+        percentile: float = 95.0,
+        budget: Optional[HedgeBudget] = None,
+        min_samples: int = 20,
+        initial_delay: Optional[float] = None,
+        window: int = 1000,
+        max_workers: int = 32,
+    ):
+        self.inner = inner
+        self.percentile = percentile
+        self.budget = budget if budget is not None else HedgeBudget()
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.latencies: Dict[str, deque] = {
+            endpoint: deque(maxlen=window)
+            for endpoint in (ENDPOINT_SEARCH, ENDPOINT_SEARCH_PAGE)
+        }
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging a request to ``endpoint`` (None: never)."""
+        with self._lock:
+            samples = list(self.latencies[endpoint])
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        return float(np.percentile(samples, self.percentile))
+
+    def _send(self, request, endpoint: Optional[str] = None):
+        """Send ``request``; record its latency when ``endpoint`` is given."""
+        start = time.perf_counter()
+        response = self.inner.handle_request(request)
+        if endpoint is not None:
+            latency = time.perf_counter() - start
+            with self._lock:
+                self.latencies[endpoint].append(latency)
+        return response
+
+    def handle_request(self, request):
+        endpoint = endpoint_of(request)
+        if endpoint is None:
+            return self.inner.handle_request(request)
+        self.budget.earn()
+        delay = self.delay(endpoint)
+        if delay is None:
+            return self._send(request, endpoint)
+        body = request.read()
+        primary = self._pool.submit(self._send, request, endpoint)
+        if delay > 0 and wait([primary], timeout=delay).done:
+            return primary.result()
+        if not self.budget.try_spend():
+            return primary.result()
+
+        import httpx
+
+        duplicate = httpx.Request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            content=body,
+            extensions=request.extensions,
+        )
+        secondary = self._pool.submit(self._send, duplicate)
+        with self._lock:
+            self.hedged += 1
+        pending = {primary, secondary}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if future.exception() is None]
+            if succeeded or not pending:
+                winner = succeeded[0] if succeeded else primary
+                for future in (primary, secondary):
+                    if future is not winner:
+                        _discard(future)
+                if winner is secondary:
+                    with self._lock:
+                        self.hedge_wins += 1
+                return winner.result()
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+        self.inner.close()
+
+    def __enter__(self):
+        self.inner.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._pool.shutdown(wait=False)
+        self.inner.__exit__(*exc_info)
+
+
+def _discard(future):
+    """Cancel a losing request, or close its response once it arrives."""
+    if future.cancel():
+        return
+
+    def close(done):
+        if done.exception() is None:
+            done.result().close()
+
+    future.add_done_callback(close)
+
+
+def hedge(client, **kwargs) -> HedgingTransport:
+    """Hedge the search requests of a ``TwelveLabs`` client in place.
+
+    Wraps the transport of the client's httpx client, so ``search.query``,
+    ``next_page()`` and the ``search_helpers`` functions are all hedged.
+    Accepts the keyword arguments of ``HedgingTransport``.
+    """
+    httpx_client = http_client(client).httpx_client
+    transport = HedgingTransport(httpx_client._transport, **kwargs)
+    httpx_client._transport = transport
+    return transport
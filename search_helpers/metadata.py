@@ -0,0 +1,206 @@
+"""
+Lazy decoding and projection of ``user_metadata``
+
+With ``include_user_metadata=True`` each result carries its video's user
+metadata, which can dominate the size of a page while most consumers never read
+it. ``decode_page`` cuts every ``user_metadata`` value out of the raw body
+before the rest is decoded, and either
+
+- keeps it as raw bytes in a ``LazyMetadata`` mapping that is only decoded when
+  it is first accessed (``lazy``), or
+- decodes only the requested top-level fields (``fields``), so the other fields
+  are never turned into Python objects.
+
+The cut relies on JSON escaping: an unescaped ``"user_metadata"`` followed by a
+colon can only be an object key, never part of a string.
+"""
+
+import re
+import typing
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .raw import loads
+
+_KEY = b'"user_metadata"'
+# Everything up to the next brace or bracket, with whole strings skipped
+_SKIP = re.compile(rb'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*', re.S)
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_COLON = re.compile(rb"\s*:\s*")
+_NULL = re.compile(rb"null")
+_SCALAR_END = re.compile(rb"[^,}\]\s]*")
+_SEPARATOR = re.compile(rb"\s*(,)?\s*")
+
+
+class LazyMetadata(Mapping):
+    """Read-only mapping over one ``user_metadata`` object, decoded on first access.
+
+    Attributes:
+        raw: The JSON bytes of the object as received
+    """
+
+    __slots__ = ("raw", "_decoded")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._decoded: Optional[dict] = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._decoded is not None
+
+    def _value(self) -> dict:
+        if self._decoded is None:
+            self._decoded = loads(self.raw)
+        return self._decoded
+
+    def __getitem__(self, key):
+        return self._value()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._value())
+
+    def __len__(self) -> int:
+        return len(self._value())
+
+    def project(self, fields: Sequence[str]) -> dict:
+        """Decode only the given top-level fields (missing fields are left out)."""
+        if self._decoded is not None:
+            return {
+                name: self._decoded[name] for name in fields if name in self._decoded
+            }
+        return project(self.raw, fields)
+
+    def __repr__(self) -> str:
+        if self._decoded is not None:
+            return f"LazyMetadata({self._decoded!r})"
+        return f"LazyMetadata(<{len(self.raw)} bytes>)"
+
+
+def _value_end(body: bytes, start: int) -> int:
+    """Return the end offset of the JSON value starting at ``start``."""
+    opening = body[start : start + 1]
+    if opening == b'"':
+        return _STRING_END.match(body, start + 1).end()
+    if opening not in (b"{", b"["):
+        return _SCALAR_END.match(body, start).end()
+    depth = 0
+    pos = start
+    while True:
+        pos = _SKIP.match(body, pos).end()
+        if pos >= len(body):
+            raise ValueError("Unterminated JSON value")
+        depth += 1 if body[pos] in (0x7B, 0x5B) else -1  # '{' '[' vs '}' ']'
+        pos += 1
+        if depth == 0:
+            return pos
+
+
+def _escaped(body: bytes, quote: int) -> bool:
+    backslashes = 0
+    while quote - backslashes > 0 and body[quote - backslashes - 1] == 0x5C:
+        backslashes += 1
+    return backslashes % 2 == 1
+
+
+def split_user_metadata(body: bytes) -> Tuple[bytes, List[bytes]]:
+    """Cut every ``user_metadata`` object out of a response body.
+
+    Returns the body with each object replaced by its position in the returned
+    list of raw objects (``null`` values are left in place).
+    """
+    pieces: List[bytes] = []
+    blobs: List[bytes] = []
+    copied = 0
+    pos = body.find(_KEY)
+    while pos >= 0:
+        colon = _COLON.match(body, pos + len(_KEY))
+        if colon is None or _escaped(body, pos):
+            pos = body.find(_KEY, pos + 1)
+            continue
+        start = colon.end()
+        if _NULL.match(body, start):
+            pos = body.find(_KEY, start)
+            continue
+        end = _value_end(body, start)
+        pieces.append(body[copied:start])
+        pieces.append(str(len(blobs)).encode())
+        blobs.append(body[start:end])
+        copied = end
+        pos = body.find(_KEY, end)
+    if not blobs:
+        return body, blobs
+    pieces.append(body[copied:])
+    return b"".join(pieces), blobs
+
+
+def project(raw: bytes, fields: Sequence[str]) -> dict:
+    """Decode only the given top-level fields of a raw JSON object."""
+    wanted = set(fields)
+    result: Dict[str, typing.Any] = {}
+    pos = raw.index(b"{") + 1
+    while wanted:
+        quote = raw.find(b'"', pos)
+        if quote < 0:
+            break
+        key_end = _STRING_END.match(raw, quote + 1).end()
+        key = loads(raw[quote:key_end])
+        value_start = _COLON.match(raw, key_end).end()
+        value_end = _value_end(raw, value_start)
+        if key in wanted:
+            result[key] = loads(raw[value_start:value_end])
+            wanted.discard(key)
+        separator = _SEPARATOR.match(raw, value_end)
+        if not separator.group(1):
+            break
+        pos = separator.end()
+    return result
+
+
+def _attach(holder: dict, blobs: List[bytes], fields: Optional[Sequence[str]]):
+    position = holder.get("user_metadata")
+    if isinstance(position, int) and not isinstance(position, bool):
+        raw = blobs[position]
+        holder["user_metadata"] = (
+            LazyMetadata(raw) if fields is None else project(raw, fields)
+        )
+
+
+def decode_page(body: bytes, fields: Optional[Sequence[str]] = None) -> dict:
+    """Decode a search response body without decoding its ``user_metadata``.
+
+    Args:
+        body: Raw response body of a search or page request
+        fields: Top-level metadata fields to decode eagerly; when None every
+            ``user_metadata`` becomes a ``LazyMetadata``
+
+    Returns:
+        The decoded response (``data``, ``page_info``, ...)
+    """
+    stripped, blobs = split_user_metadata(body)
+    payload = loads(stripped)
+    if not blobs:
+        return payload
+    for item in payload.get("data") or []:
+        _attach(item, blobs, fields)
+        for clip in item.get("clips") or []:
+            _attach(clip, blobs, fields)
+    return payload
+
+
+def materialize(data: List[dict]) -> List[dict]:
+    """Return ``data`` with every ``LazyMetadata`` replaced by a plain dict."""
+
+    def plain(holder: dict) -> dict:
+        changes = {}
+        metadata = holder.get("user_metadata")
+        if isinstance(metadata, LazyMetadata):
+            changes["user_metadata"] = dict(metadata)
+        clips = holder.get("clips")
+        if clips:
+            plain_clips = [plain(clip) for clip in clips]
+            if any(new is not old for new, old in zip(plain_clips, clips)):
+                changes["clips"] = plain_clips
+        return dict(holder, **changes) if changes else holder
+
+    return [plain(item) for item in data]
@@ -0,0 +1,152 @@
+"""
+Raw search requests through the SDK's HTTP client
+
+Sends the same requests as ``client.search.query`` and ``next_page`` but returns
+the ``httpx.Response`` instead of pydantic models, and decodes JSON with orjson
+when it is installed.
+"""
+
+import json
+import typing
+
+from twelvelabs.core.api_error import ApiError
+
+# Concrete modules rather than twelvelabs.errors, whose __init__ imports the
+# generated types (see tests/plugins/lazy_imports.py)
+from twelvelabs.errors.bad_request_error import BadRequestError
+from twelvelabs.errors.too_many_requests_error import TooManyRequestsError
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    loads = json.loads
+
+OMIT = typing.cast(typing.Any, ...)
+
+# Parameters accepted by the raw search helpers, as sent by client.search.query
+SEARCH_PARAMETERS = (
+    "index_id",
+    "search_options",
+    "query_media_type",
+    "query_media_url",
+    "query_text",
+    "group_by",
+    "operator",
+    "page_limit",
+    "filter",
+    "include_user_metadata",
+    "transcription_options",
+)
+
+
+# SDK releases whose internal HTTP client the helpers are tested against
+TESTED_SDK_VERSIONS = ("1.3.5", "1.3.6")
+
+
+class UnsupportedSDKError(RuntimeError):
+    """The installed ``twelvelabs`` does not expose the HTTP client the helpers use."""
+
+
+def _sdk_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("twelvelabs")
+    except Exception:
+        return "unknown"
+
+
+def http_client(client):
+    """Return the SDK's internal HTTP client of a ``TwelveLabs`` instance.
+
+    The client (``client.search._raw_client._client_wrapper.httpx_client``) is
+    private to the SDK, so a release that moves it fails here with a clear
+    error instead of an ``AttributeError`` in the middle of a search.
+
+    Raises:
+        UnsupportedSDKError: The client is missing or lacks ``request``/``stream``
+    """
+    try:
+        http = client.search._raw_client._client_wrapper.httpx_client
+    except AttributeError as e:
+        raise UnsupportedSDKError(_unsupported(str(e))) from e
+    missing = [
+        name
+        for name in ("request", "stream", "httpx_client")
+        if not hasattr(http, name)
+    ]
+    if missing:
+        raise UnsupportedSDKError(
+            _unsupported(f"its HTTP client has no {', '.join(missing)}")
+        )
+    return http
+
+
+def _unsupported(reason: str) -> str:
+    return (
+        f"search_helpers cannot use the HTTP client of twelvelabs {_sdk_version()} "
+        f"({reason}); tested with twelvelabs {', '.join(TESTED_SDK_VERSIONS)}"
+    )
+
+
+def search_request(
+    params: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """Build keyword arguments of ``HttpClient.request``/``stream`` for a search.
+
+    Raises:
+        TypeError: An unsupported parameter was given
+    """
+    unknown = set(params) - set(SEARCH_PARAMETERS) - {"query_media_file"}
+    if unknown:
+        raise TypeError(f"Unsupported search parameters: {', '.join(sorted(unknown))}")
+    data = {name: params.get(name, OMIT) for name in SEARCH_PARAMETERS}
+    files = {}
+    if params.get("query_media_file") is not None:
+        files["query_media_file"] = params["query_media_file"]
+    return {
+        "method": "POST",
+        "data": data,
+        "files": files,
+        "omit": OMIT,
+        "force_multipart": True,
+    }
+
+
+def raise_for_error(response, body: typing.Optional[bytes] = None):
+    """Raise the same exception types as the SDK for an error response."""
+    if 200 <= response.status_code < 300:
+        return
+    content = response.content if body is None else body
+    try:
+        decoded = loads(content)
+    except ValueError:
+        raise ApiError(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            body=content.decode("utf-8", "replace"),
+        )
+    error_class = {400: BadRequestError, 429: TooManyRequestsError}.get(
+        response.status_code
+    )
+    if error_class is not None:
+        raise error_class(headers=dict(response.headers), body=decoded)
+    raise ApiError(
+        status_code=response.status_code, headers=dict(response.headers), body=decoded
+    )
+
+
+def post_search(client, params: typing.Dict[str, typing.Any]):
+    """Send a search request and return the raw response (errors raise ApiError)."""
+    response = http_client(client).request("search", **search_request(params))
+    raise_for_error(response)
+    return response
+
+
+def get_page(client, page_token: str):
+    """Retrieve a page of search results and return the raw response."""
+    response = http_client(client).request(f"search/{page_token}", method="GET")
+    raise_for_error(response)
+    return response
@@ -0,0 +1,177 @@
+"""
+Streaming decode of search result pages
+
+``query_streaming`` reads each response body incrementally and yields
+``SearchItem`` models as soon as each element of the top-level ``data`` array
+has fully arrived, instead of waiting for the whole page to be buffered and
+parsed. Only the bytes of the item being received are kept, so peak memory
+stays close to one item rather than one page.
+
+``ItemStreamDecoder`` does the splitting: it tracks JSON nesting and string
+state over the incoming chunks (jumping between structural characters with a
+regular expression) and cuts out the byte range of every ``data`` element. All
+other top-level fields (``page_info``, ``search_pool``) are collected into a
+small envelope that is decoded once the body is complete.
+"""
+
+import re
+import typing
+from typing import Iterator, List, Optional
+
+from .raw import http_client, loads, raise_for_error, search_request
+
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'(?:[^"\\]|\\.)*"', re.S)
+_COLON = re.compile(rb"\s*(:)?")
+
+
+class ItemStreamDecoder:
+    """Incrementally splits a search response body into its ``data`` items.
+
+    Feed body chunks with ``feed``; each call returns the raw JSON bytes of the
+    items completed by that chunk. After the last chunk, ``envelope()`` returns
+    the rest of the response with ``data`` emptied.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0  # next byte to scan
+        self._depth = 0
+        self._data_depth = 0  # depth inside the data array, 0 when outside it
+        self._item_start = -1
+        self._last_key = b""
+        self._pending_key: Optional[bytes] = None
+        self._envelope = bytearray()
+        self._envelope_from = 0  # start of bytes not yet copied to the envelope
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self._buffer += chunk
+        items: List[bytes] = []
+        buffer = self._buffer
+        while True:
+            if self._pending_key is not None:
+                # A depth-1 string is a key only if a colon follows it
+                match = _COLON.match(buffer, self._pos)
+                if match.end() == len(buffer):
+                    break
+                if match.group(1):
+                    self._last_key = self._pending_key
+                self._pending_key = None
+                self._pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                break
+            char = buffer[match.start()]
+            if char == 0x22:  # '"'
+                end = _STRING_END.match(buffer, match.start() + 1)
+                if end is None:
+                    self._pos = match.start()
+                    break
+                self._pos = end.end()
+                if self._depth == 1 and not self._data_depth:
+                    self._pending_key = bytes(buffer[match.start() + 1 : end.end() - 1])
+                continue
+
+            self._pos = match.end()
+            if char in (0x7B, 0x5B):  # '{' '['
+                self._depth += 1
+                if self._data_depth:
+                    if self._depth == self._data_depth + 1 and char == 0x7B:
+                        self._item_start = match.start()
+                elif self._depth == 2 and char == 0x5B and self._last_key == b"data":
+                    self._data_depth = 2
+                    self._envelope += buffer[self._envelope_from : self._pos]
+            else:  # '}' ']'
+                self._depth -= 1
+                if self._data_depth:
+                    if self._depth == self._data_depth and self._item_start >= 0:
+                        items.append(bytes(buffer[self._item_start : self._pos]))
+                        self._item_start = -1
+                    elif self._depth < self._data_depth:
+                        self._data_depth = 0
+                        self._envelope_from = match.start()
+        self._compact()
+        return items
+
+    def _compact(self):
+        """Drop scanned bytes that are no longer needed."""
+        if self._data_depth:
+            keep = self._item_start if self._item_start >= 0 else self._pos
+        else:
+            self._envelope += self._buffer[self._envelope_from : self._pos]
+            self._envelope_from = keep = self._pos
+        del self._buffer[:keep]
+        self._pos -= keep
+        self._envelope_from -= keep
+        if self._item_start >= 0:
+            self._item_start -= keep
+
+    def envelope(self) -> dict:
+        """Decode everything except the data items (call after the last chunk)."""
+        self._envelope += self._buffer[max(self._envelope_from, 0) :]
+        self._buffer.clear()
+        self._envelope_from = self._pos = 0
+        return loads(bytes(self._envelope)) if self._envelope.strip() else {}
+
+
+class StreamingSearchPager:
+    """Yields ``SearchItem`` models of every page while each page is received.
+
+    After a page has been fully read, ``page_info`` holds its ``page_info`` dict.
+    """
+
+    def __init__(self, client, params: dict, chunk_size: Optional[int] = None):
+        self.client = client
+        self.params = params
+        self.chunk_size = chunk_size
+        self.page_info: dict = {}
+        self.pages_fetched = 0
+
+    def _stream_page(self, path: str, request: dict) -> Iterator[typing.Any]:
+        from twelvelabs.core.pydantic_utilities import parse_obj_as
+        from twelvelabs.types import SearchItem
+
+        decoder = ItemStreamDecoder()
+        with http_client(self.client).stream(path, **request) as response:
+            if not 200 <= response.status_code < 300:
+                raise_for_error(response, response.read())
+            self.pages_fetched += 1
+            for chunk in response.iter_bytes(self.chunk_size):
+                for raw_item in decoder.feed(chunk):
+                    yield parse_obj_as(type_=SearchItem, object_=loads(raw_item))
+        self.page_info = decoder.envelope().get("page_info") or {}
+
+    def iter_pages(self) -> Iterator[Iterator[typing.Any]]:
+        """Yield one item iterator per page; consume each before advancing."""
+        yield self._stream_page("search", search_request(self.params))
+        while self.page_info.get("next_page_token"):
+            token = self.page_info["next_page_token"]
+            self.page_info = {}
+            yield self._stream_page(f"search/{token}", {"method": "GET"})
+
+    def __iter__(self):
+        for page in self.iter_pages():
+            count = 0
+            for item in page:
+                count += 1
+                yield item
+            if count == 0:
+                return
+
+
+def query_streaming(
+    client, chunk_size: Optional[int] = None, **params
+) -> StreamingSearchPager:
+    """Run ``search.query`` and decode every page incrementally.
+
+    The request is only sent when iteration starts. Accepts the same search
+    parameters as ``search_helpers.query_fast``.
+
+    Raises:
+        ApiError: Same error types as ``client.search.query`` (raised on iteration)
+    """
+    search_request(params)  # validate parameter names up front
+    return StreamingSearchPager(client, params, chunk_size)
@@ -0,0 +1,136 @@
+"""
+Top-k search with early termination
+
+``list(pager)`` and plain iteration of a ``SyncPager`` request pages until
+``has_next`` is false. ``top_k`` reads a pager only until it has ``k`` items:
+the page that completes k is the last one requested. ``query_top_k`` also picks
+the page size from k, as the fewest pages of at most 50 that hold k items,
+split evenly (k=60 asks for 2 pages of 30, not 50 + 50).
+
+The result reports the requests sent and, when the search's ``total_results``
+is known, how many requests draining the same search would have taken.
+"""
+
+import typing
+from typing import List, Optional
+
+MAX_PAGE_LIMIT = 50
+
+
+def page_limit_for(k: int) -> int:
+    """Page size that returns ``k`` items in the fewest requests."""
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    pages = -(-k // MAX_PAGE_LIMIT)
+    return -(-k // pages)
+
+
+class TopK:
+    """The first ``k`` results of a search and the requests they took.
+
+    Attributes:
+        items: Up to ``k`` items, in result order
+        requests: Page requests sent, the first search included
+        has_more: Whether the search had results beyond the items read
+        page_limit: The search's page size, when known
+        total_results: The search's ``total_results``, when known
+    """
+
+    def __init__(
+        self,
+        items: List[typing.Any],
+        k: int,
+        requests: int,
+        has_more: bool,
+        page_limit: Optional[int] = None,
+        total_results: Optional[int] = None,
+    ):
+        self.items = items
+        self.k = k
+        self.requests = requests
+        self.has_more = has_more
+        self.page_limit = page_limit
+        self.total_results = total_results
+
+    @property
+    def drain_requests(self) -> Optional[int]:
+        """Requests that reading every page of the search would have taken."""
+        if not self.page_limit or self.total_results is None:
+            return None
+        return max(1, -(-self.total_results // self.page_limit))
+
+    @property
+    def requests_saved(self) -> Optional[int]:
+        drain = self.drain_requests
+        return None if drain is None else max(drain - self.requests, 0)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def top_k(
+    pager,
+    k: int,
+    page_limit: Optional[int] = None,
+    total_results: Optional[int] = None,
+) -> TopK:
+    """Read the first ``k`` items of a ``SyncPager`` without requesting more pages.
+
+    Args:
+        pager: First page of a search (``client.search.query``)
+        k: Items wanted
+        page_limit: The search's page size, to report ``requests_saved``
+        total_results: The search's ``total_results``, to report ``requests_saved``
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    items: List[typing.Any] = []
+    requests = 1
+    page = pager
+    while True:
+        page_items = page.items or []
+        taken = page_items[: k - len(items)]
+        items.extend(taken)
+        if len(items) >= k:
+            has_more = len(taken) < len(page_items) or page.has_next
+            break
+        if not page_items or not page.has_next or page.get_next is None:
+            has_more = False
+            break
+        page = page.next_page()
+        requests += 1
+        if page is None:
+            has_more = False
+            break
+    return TopK(items, k, requests, has_more, page_limit, total_results)
+
+
+def _pager(client, results):
+    """``SyncPager`` over a ``SearchResults``/``SearchRetrieveResponse`` page."""
+    from twelvelabs.core.pagination import SyncPager
+
+    token = results.page_info.next_page_token if results.page_info else None
+    return SyncPager(
+        has_next=token is not None,
+        items=results.data,
+        get_next=(lambda: _pager(client, client.search.retrieve(token))),
+        response=None,
+    )
+
+
+def query_top_k(client, k: int, **params) -> TopK:
+    """Run a search sized for ``k`` results and read only the pages they need.
+
+    ``page_limit`` defaults to ``page_limit_for(k)``. Accepts the parameters of
+    ``client.search.create`` (the request ``client.search.query`` sends).
+
+    Raises:
+        ApiError: Same error types as ``client.search.query``
+    """
+    params.setdefault("page_limit", page_limit_for(k))
+    results = client.search.create(**params)
+    total = results.page_info.total_results if results.page_info else None
+    return top_k(_pager(client, results), k, params["page_limit"], total)
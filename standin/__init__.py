@@ -0,0 +1,36 @@
+"""
+Local stand-in for the Twelve Labs search API
+
+Serves ``search.query`` and page retrieval from deterministic synthetic indexes
+so that the suite and the benchmarks can run without the live API.
+"""
+
+from .corpus import Corpus, Embedder, build_corpus
+from .index import MARENGO_27, MARENGO_30, SearchIndex, merge_modalities
+from .latency import LatencyModel, RecordingTransport
+from .server import (
+    STANDIN_BASE_URL,
+    STANDIN_INDEX_MARENGO_27,
+    STANDIN_INDEX_MARENGO_30,
+    StandinError,
+    StandinServer,
+)
+from .vector import VectorIndex
+
+__all__ = [
+    "Corpus",
+    "Embedder",
+    "build_corpus",
+    "MARENGO_27",
+    "MARENGO_30",
+    "SearchIndex",
+    "merge_modalities",
+    "LatencyModel",
+    "RecordingTransport",
+    "STANDIN_BASE_URL",
+    "STANDIN_INDEX_MARENGO_27",
+    "STANDIN_INDEX_MARENGO_30",
+    "StandinError",
+    "StandinServer",
+    "VectorIndex",
+]
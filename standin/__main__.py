@@ -0,0 +1,58 @@
+"""
+Run the local stand-in as an HTTP server
+
+Usage:
+    python -m standin --port 8765 --videos 1000
+
+Then point the SDK at it, e.g. ``TWELVELABS_BASE_URL=http://127.0.0.1:8765/v1.3``.
+"""
+
+import argparse
+import time
+
+from .latency import LatencyModel
+from .server import STANDIN_INDEX_MARENGO_27, STANDIN_INDEX_MARENGO_30, StandinServer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Twelve Labs search API"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--videos", type=int, default=120, help="Videos per synthetic index"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--latency",
+        metavar="PATH",
+        help="Replay latencies from recorded live runs (pytest --record-latency) or a saved model",
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for replayed latencies",
+    )
+    args = parser.parse_args()
+
+    latency_model = None
+    if args.latency:
+        latency_model = LatencyModel.load(args.latency, scale=args.latency_scale)
+    server = StandinServer.with_default_indexes(
+        num_videos=args.videos, seed=args.seed, latency_model=latency_model
+    )
+    httpd = server.serve_http(args.host, args.port)
+    print(f"Stand-in listening on http://{args.host}:{httpd.server_port}/v1.3")
+    print(f"  Marengo 2.7 index: {STANDIN_INDEX_MARENGO_27}")
+    print(f"  Marengo 3.0 index: {STANDIN_INDEX_MARENGO_30}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
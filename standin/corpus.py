@@ -0,0 +1,345 @@
+"""
+Synthetic corpus for the local stand-in
+
+Generates deterministic videos, clips, transcripts and user metadata, and embeds
+clips and queries into the same vector space so that similarity is meaningful:
+a query for "swimming" lands close to clips whose visual concepts include swimming.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Topic -> concepts per modality. Words used by the test queries
+# ("water", "swimming", "animal", "otter", "cat", "man", "fall", "test", "hello")
+# are spread over several topics so every test query has real matches.
+TOPICS = {
+    "nature": {
+        "visual": [
+            "water",
+            "river",
+            "otter",
+            "animal",
+            "swimming",
+            "swim",
+            "rhino",
+            "forest",
+            "bird",
+            "fish",
+        ],
+        "audio": ["splash", "birds", "wind", "water", "rain"],
+        "speech": [
+            "look",
+            "otter",
+            "swimming",
+            "river",
+            "nature",
+            "water",
+            "animal",
+            "wild",
+        ],
+    },
+    "city": {
+        "visual": [
+            "man",
+            "car",
+            "street",
+            "building",
+            "walking",
+            "fall",
+            "crowd",
+            "night",
+        ],
+        "audio": ["engine", "horn", "traffic", "crowd", "footsteps"],
+        "speech": ["hello", "city", "street", "traffic", "people", "meeting", "test"],
+    },
+    "home": {
+        "visual": ["cat", "dog", "sofa", "kitchen", "animal", "play", "window"],
+        "audio": ["meow", "bark", "music", "dishes", "laughter"],
+        "speech": ["hello", "cat", "dinner", "kitchen", "family", "play", "cute"],
+    },
+    "sports": {
+        "visual": [
+            "swimming",
+            "pool",
+            "water",
+            "ball",
+            "running",
+            "stadium",
+            "man",
+            "fall",
+        ],
+        "audio": ["whistle", "cheering", "splash", "crowd", "music"],
+        "speech": ["goal", "race", "swimming", "record", "team", "win", "test"],
+    },
+    "studio": {
+        "visual": ["test", "screen", "chart", "desk", "man", "presentation"],
+        "audio": ["speech", "music", "applause", "silence"],
+        "speech": ["hello", "welcome", "test", "today", "product", "demo", "video"],
+    },
+}
+
+# Filler words mixed into generated transcripts.
+FILLER_WORDS = [
+    "the",
+    "a",
+    "and",
+    "is",
+    "we",
+    "this",
+    "that",
+    "so",
+    "now",
+    "here",
+    "with",
+    "into",
+]
+
+MODALITIES = ("visual", "audio", "transcription")
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case and split text into alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def stable_seed(*parts) -> int:
+    """Derive a process-independent 64-bit seed from the given parts."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(p) for p in parts).encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Embedder:
+    """Maps tokens to fixed random unit vectors and texts to their normalized sum.
+
+    Token vectors are derived from a hash of the token, so the same word always
+    maps to the same direction regardless of corpus, process or seed.
+    """
+
+    def __init__(self, dim: int = 64):
+        self.dim = dim
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def token_vector(self, token: str) -> np.ndarray:
+        vector = self._cache.get(token)
+        if vector is None:
+            rng = np.random.default_rng(stable_seed("token", token))
+            vector = rng.standard_normal(self.dim).astype(np.float32)
+            vector /= np.linalg.norm(vector)
+            self._cache[token] = vector
+        return vector
+
+    def embed_tokens(self, tokens: Sequence[str]) -> np.ndarray:
+        """Embed a token sequence; an empty sequence yields the zero vector."""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token in tokens:
+            vector += self.token_vector(token)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def embed_text(self, text: str) -> np.ndarray:
+        return self.embed_tokens(tokenize(text))
+
+    def embed_media(self, content: bytes) -> np.ndarray:
+        """Embed media bytes by mapping their digest onto a few visual concepts."""
+        rng = np.random.default_rng(
+            stable_seed("media", hashlib.sha1(content).hexdigest())
+        )
+        topic = list(TOPICS)[int(rng.integers(len(TOPICS)))]
+        concepts = TOPICS[topic]["visual"]
+        picks = rng.choice(len(concepts), size=min(3, len(concepts)), replace=False)
+        return self.embed_tokens([concepts[i] for i in picks])
+
+
+class Corpus:
+    """Columnar store of synthetic videos and clips.
+
+    Videos are stored as a list of dicts (system metadata plus ``user_metadata``);
+    clips are stored column-wise so that million-clip corpora stay compact.
+    ``vectors`` maps each modality to an (n_clips, dim) float32 matrix of unit vectors.
+    """
+
+    def __init__(
+        self,
+        videos: List[dict],
+        clip_video: np.ndarray,
+        clip_start: np.ndarray,
+        clip_end: np.ndarray,
+        transcripts: List[str],
+        vectors: Dict[str, np.ndarray],
+        embedder: Embedder,
+    ):
+        self.videos = videos
+        self.clip_video = clip_video
+        self.clip_start = clip_start
+        self.clip_end = clip_end
+        self.transcripts = transcripts
+        self.vectors = vectors
+        self.embedder = embedder
+
+    def __len__(self) -> int:
+        return len(self.clip_video)
+
+    def video_of(self, clip_id: int) -> dict:
+        return self.videos[int(self.clip_video[clip_id])]
+
+
+def _concept_matrix(embedder: Embedder, words: Sequence[str]) -> np.ndarray:
+    return np.stack([embedder.token_vector(word) for word in words])
+
+
+def _modality_vectors(
+    rng: np.random.Generator,
+    embedder: Embedder,
+    clip_topic: np.ndarray,
+    modality: str,
+    concepts_per_clip: int,
+    noise: float,
+) -> np.ndarray:
+    """Sum a few topic concepts per clip, add noise and normalize (vectorized per topic)."""
+    vectors = np.empty((len(clip_topic), embedder.dim), dtype=np.float32)
+    for topic_index, topic in enumerate(TOPICS):
+        mask = clip_topic == topic_index
+        count = int(mask.sum())
+        if not count:
+            continue
+        concepts = _concept_matrix(embedder, TOPICS[topic][modality])
+        picks = rng.integers(0, len(concepts), size=(count, concepts_per_clip))
+        vectors[mask] = concepts[picks].sum(axis=1)
+    vectors += noise * rng.standard_normal(vectors.shape).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _padding_metadata(topic: str, video_index: int, size: int) -> dict:
+    """Deterministic description/tags of roughly ``size`` bytes."""
+    words = TOPICS[topic]["speech"] + FILLER_WORDS
+    offset = video_index % len(words)
+    words = words[offset:] + words[:offset]
+    description = []
+    length = 0
+    while length < size * 3 // 4:
+        word = words[len(description) % len(words)]
+        description.append(word)
+        length += len(word) + 1
+    tags = [f"{topic}-{word}" for word in words[: max(1, size // 64)]]
+    return {"description": " ".join(description), "tags": tags}
+
+
+def build_corpus(
+    num_videos: int = 120,
+    clips_per_video: int = 12,
+    dim: int = 64,
+    seed: int = 0,
+    transcripts: bool = True,
+    embedder: Optional[Embedder] = None,
+    metadata_size: int = 0,
+) -> Corpus:
+    """Build a deterministic synthetic corpus.
+
+    Args:
+        num_videos: Number of videos in the index
+        clips_per_video: Average number of clips per video (actual count varies per video)
+        dim: Embedding dimension
+        seed: Seed for all random choices; the same arguments always give the same corpus
+        transcripts: Generate transcript text per clip (disable for very large vector-only corpora)
+        embedder: Shared embedder (created with ``dim`` if omitted)
+        metadata_size: Approximate extra bytes of user metadata per video (a
+            ``description`` text and a ``tags`` list), for large-response tests
+
+    Returns:
+        Corpus instance
+    """
+    embedder = embedder or Embedder(dim)
+    rng = np.random.default_rng(seed)
+    topic_names = list(TOPICS)
+
+    video_topic = rng.integers(0, len(topic_names), size=num_videos)
+    clip_counts = rng.integers(
+        max(1, clips_per_video // 2),
+        clips_per_video + clips_per_video // 2 + 1,
+        size=num_videos,
+    )
+    clip_video = np.repeat(np.arange(num_videos, dtype=np.int32), clip_counts)
+    # Position of each clip inside its video
+    first_clip = np.repeat(np.cumsum(clip_counts) - clip_counts, clip_counts)
+    clip_position = np.arange(len(clip_video)) - first_clip
+    clip_length = rng.uniform(2.0, 12.0, size=len(clip_video)).round(2)
+    clip_start = (
+        clip_position * 15.0 + rng.uniform(0.0, 2.0, size=len(clip_video))
+    ).round(2)
+    clip_end = (clip_start + clip_length).round(2)
+
+    videos = []
+    for video_index in range(num_videos):
+        topic = topic_names[video_topic[video_index]]
+        video_id = hashlib.blake2b(
+            f"{seed}:{video_index}".encode("utf-8"), digest_size=12
+        ).hexdigest()
+        duration = float(clip_counts[video_index] * 15 + 10)
+        width, height = [(1280, 720), (1920, 1080), (3840, 2160)][video_index % 3]
+        videos.append(
+            {
+                "id": video_id,
+                "filename": f"{topic} clip {video_index}.mp4",
+                "duration": duration,
+                "width": width,
+                "height": height,
+                "size": int(duration * width * 6),
+                "user_metadata": {
+                    "category": topic,
+                    "type": "video",
+                    "status": "active" if video_index % 4 else "archived",
+                    "needs_review": video_index % 5 == 0,
+                    "views": int(rng.integers(0, 100000)),
+                },
+            }
+        )
+        if metadata_size > 0:
+            videos[-1]["user_metadata"].update(
+                _padding_metadata(topic, video_index, metadata_size)
+            )
+
+    clip_topic = video_topic[clip_video]
+    vectors = {
+        "visual": _modality_vectors(rng, embedder, clip_topic, "visual", 3, 0.35),
+        "audio": _modality_vectors(rng, embedder, clip_topic, "audio", 2, 0.45),
+    }
+
+    transcript_texts: List[str] = []
+    if transcripts:
+        for clip_index in range(len(clip_video)):
+            words = TOPICS[topic_names[clip_topic[clip_index]]]["speech"]
+            picks = rng.integers(0, len(words), size=4)
+            fillers = rng.integers(0, len(FILLER_WORDS), size=4)
+            sentence = []
+            for word_pick, filler_pick in zip(picks, fillers):
+                sentence.append(FILLER_WORDS[filler_pick])
+                sentence.append(words[word_pick])
+            transcript_texts.append(" ".join(sentence).capitalize() + ".")
+        vectors["transcription"] = np.stack(
+            [embedder.embed_text(text) for text in transcript_texts]
+        )
+    else:
+        vectors["transcription"] = _modality_vectors(
+            rng, embedder, clip_topic, "speech", 3, 0.5
+        )
+        transcript_texts = [""] * len(clip_video)
+
+    return Corpus(
+        videos=videos,
+        clip_video=clip_video,
+        clip_start=clip_start,
+        clip_end=clip_end,
+        transcripts=transcript_texts,
+        vectors=vectors,
+        embedder=embedder,
+    )
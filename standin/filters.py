@@ -0,0 +1,205 @@
+"""
+Metadata filters for the local stand-in
+
+Filter strings are compiled once into predicate objects and evaluated against
+per-field secondary indexes over the videos' system and user metadata, so a
+filtered search costs a few dictionary lookups and binary searches instead of a
+scan over every video.
+
+Supported syntax (a JSON object; all conditions must hold):
+
+- ``{"field": value}``: exact match on a string, number or boolean
+- ``{"field": [v1, v2]}``: match any of the listed values
+- ``{"field": {"gte": 10, "lt": 20}}``: numeric range with gt/gte/lt/lte
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# System metadata fields that can be filtered on besides user_metadata.
+SYSTEM_FIELDS = ("id", "filename", "duration", "width", "height", "size")
+
+RANGE_OPERATORS = ("gt", "gte", "lt", "lte")
+
+
+class FilterSyntaxError(ValueError):
+    """Raised when a filter string cannot be compiled."""
+
+
+def _value_key(value) -> Tuple[bool, object]:
+    # JSON true must not match 1 (and false must not match 0)
+    return (isinstance(value, bool), value)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class FieldIndex:
+    """Secondary index of one metadata field.
+
+    ``postings`` maps each distinct value to the sorted ids of the videos holding
+    it; numeric values are also kept sorted for range queries.
+    """
+
+    __slots__ = ("postings", "sorted_values", "sorted_ids")
+
+    def __init__(self, values: Sequence[Tuple[int, object]]):
+        postings: Dict[Tuple[bool, object], List[int]] = {}
+        numeric: List[Tuple[float, int]] = []
+        for video_id, value in values:
+            if isinstance(value, (list, dict)):
+                continue
+            postings.setdefault(_value_key(value), []).append(video_id)
+            if _is_number(value):
+                numeric.append((float(value), video_id))
+        self.postings = {
+            key: np.asarray(ids, dtype=np.int64) for key, ids in postings.items()
+        }
+        numeric.sort()
+        self.sorted_values = np.asarray([v for v, _ in numeric], dtype=np.float64)
+        self.sorted_ids = np.asarray([i for _, i in numeric], dtype=np.int64)
+
+    def equal(self, value) -> np.ndarray:
+        return self.postings.get(_value_key(value), np.empty(0, dtype=np.int64))
+
+    def between(self, bounds: Dict[str, float]) -> np.ndarray:
+        low, high = 0, len(self.sorted_values)
+        if "gte" in bounds:
+            low = max(low, np.searchsorted(self.sorted_values, bounds["gte"], "left"))
+        if "gt" in bounds:
+            low = max(low, np.searchsorted(self.sorted_values, bounds["gt"], "right"))
+        if "lte" in bounds:
+            high = min(
+                high, np.searchsorted(self.sorted_values, bounds["lte"], "right")
+            )
+        if "lt" in bounds:
+            high = min(high, np.searchsorted(self.sorted_values, bounds["lt"], "left"))
+        return self.sorted_ids[low:high] if low < high else self.sorted_ids[:0]
+
+
+class MetadataIndex:
+    """Secondary indexes over every filterable field of a list of videos.
+
+    System fields shadow user metadata fields of the same name.
+    """
+
+    def __init__(self, videos: Sequence[dict]):
+        self.num_videos = len(videos)
+        values: Dict[str, List[Tuple[int, object]]] = {}
+        for video_id, video in enumerate(videos):
+            for field, value in (video.get("user_metadata") or {}).items():
+                if field not in SYSTEM_FIELDS:
+                    values.setdefault(field, []).append((video_id, value))
+            for field in SYSTEM_FIELDS:
+                if field in video:
+                    values.setdefault(field, []).append((video_id, video[field]))
+        self.fields: Dict[str, FieldIndex] = {
+            field: FieldIndex(field_values) for field, field_values in values.items()
+        }
+
+    def evaluate(self, compiled: "CompiledFilter") -> np.ndarray:
+        """Return a boolean mask over videos that satisfy every condition."""
+        allowed = np.ones(self.num_videos, dtype=bool)
+        for condition in compiled.conditions:
+            field_index = self.fields.get(condition.field)
+            matched = np.zeros(self.num_videos, dtype=bool)
+            if field_index is not None:
+                matched[condition.lookup(field_index)] = True
+            allowed &= matched
+        return allowed
+
+
+class Condition:
+    """One compiled ``field: constraint`` pair."""
+
+    __slots__ = ("field", "kind", "operand")
+
+    def __init__(self, field: str, kind: str, operand):
+        self.field = field
+        self.kind = kind
+        self.operand = operand
+
+    def lookup(self, field_index: FieldIndex) -> np.ndarray:
+        if self.kind == "equal":
+            return field_index.equal(self.operand)
+        if self.kind == "any":
+            return np.concatenate(
+                [field_index.equal(value) for value in self.operand]
+                or [np.empty(0, dtype=np.int64)]
+            )
+        return field_index.between(self.operand)
+
+
+class CompiledFilter:
+    """A parsed filter: the conjunction of its conditions."""
+
+    __slots__ = ("text", "conditions")
+
+    def __init__(self, text: str, conditions: Sequence[Condition]):
+        self.text = text
+        self.conditions = tuple(conditions)
+
+
+def _compile_condition(field: str, constraint) -> Condition:
+    if isinstance(constraint, dict):
+        if not constraint or any(op not in RANGE_OPERATORS for op in constraint):
+            raise FilterSyntaxError(
+                f"Range on {field} must use only {', '.join(RANGE_OPERATORS)}"
+            )
+        if not all(_is_number(bound) for bound in constraint.values()):
+            raise FilterSyntaxError(f"Range bounds on {field} must be numbers")
+        return Condition(field, "range", dict(constraint))
+    if isinstance(constraint, list):
+        if any(isinstance(value, (list, dict)) for value in constraint):
+            raise FilterSyntaxError(f"Values for {field} must be scalars")
+        return Condition(field, "any", tuple(constraint))
+    if constraint is None:
+        raise FilterSyntaxError(f"Value for {field} must not be null")
+    return Condition(field, "equal", constraint)
+
+
+def compile_filter(text: str) -> CompiledFilter:
+    """Parse a filter string into a CompiledFilter.
+
+    Raises:
+        FilterSyntaxError: The text is not a JSON object of supported conditions
+    """
+    try:
+        parsed = json.loads(text)
+    except ValueError as e:
+        raise FilterSyntaxError(f"Filter is not valid JSON: {e}") from None
+    if not isinstance(parsed, dict):
+        raise FilterSyntaxError("Filter must be a JSON object")
+    return CompiledFilter(
+        text, [_compile_condition(field, value) for field, value in parsed.items()]
+    )
+
+
+class FilterCache:
+    """Thread-safe LRU cache of compiled filters keyed by filter text."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CompiledFilter]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def compile(self, text: str) -> CompiledFilter:
+        with self._lock:
+            compiled = self._entries.get(text)
+            if compiled is not None:
+                self._entries.move_to_end(text)
+                return compiled
+        compiled = compile_filter(text)
+        with self._lock:
+            self._entries[text] = compiled
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return compiled
@@ -0,0 +1,176 @@
+"""
+Searchable index for the local stand-in
+
+Wraps a synthetic corpus with one vector engine per modality and combines the
+per-modality hits according to the ``operator`` search parameter.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .corpus import MODALITIES, Corpus
+from .filters import CompiledFilter, MetadataIndex
+from .lexical import InvertedIndex
+from .vector import VectorIndex
+
+MARENGO_27 = "marengo2.7"
+MARENGO_30 = "marengo3.0"
+
+# Search options supported by each model family
+SUPPORTED_OPTIONS = {
+    MARENGO_27: ("visual", "audio"),
+    MARENGO_30: ("visual", "audio", "transcription"),
+}
+
+# Default transcription matching when transcription_options is omitted
+DEFAULT_TRANSCRIPTION_OPTIONS = ("lexical", "semantic")
+
+# Maximum query length in tokens by model family
+MAX_QUERY_TOKENS = {MARENGO_27: 77, MARENGO_30: 500}
+
+Hits = Tuple[np.ndarray, np.ndarray]
+
+
+def merge_modalities(hits: Sequence[Hits], operator: str) -> Hits:
+    """Combine per-modality hits into one ranked list.
+
+    ``or`` keeps every clip matched by any modality and scores it by its best
+    modality; ``and`` keeps only clips matched by all modalities and scores them
+    by the mean of their modality scores.
+
+    Args:
+        hits: One (clip_ids, scores) pair per requested modality
+        operator: "or" or "and"
+
+    Returns:
+        (clip_ids, scores) ordered by descending score, ties by clip id
+    """
+    if not hits:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    ids = np.concatenate([h[0] for h in hits])
+    scores = np.concatenate([h[1] for h in hits])
+    if ids.size == 0:
+        return ids, scores
+
+    order = np.argsort(ids, kind="stable")
+    ids, scores = ids[order], scores[order]
+    unique_ids, starts, counts = np.unique(ids, return_index=True, return_counts=True)
+    if operator == "and":
+        merged = np.add.reduceat(scores, starts) / counts
+        keep = counts == len(hits)
+        unique_ids, merged = unique_ids[keep], merged[keep]
+    else:
+        merged = np.maximum.reduceat(scores, starts)
+
+    ranking = np.lexsort((unique_ids, -merged))
+    return unique_ids[ranking], merged[ranking].astype(np.float32)
+
+
+class SearchIndex:
+    """One stand-in index: a corpus, its model family and per-modality engines.
+
+    Indexes that support transcription also keep a positional inverted index
+    over the clip transcripts for lexical matching, and every index keeps
+    secondary indexes over video metadata for filtering.
+
+    Args:
+        index_id: Identifier clients use in ``index_id``
+        model_name: MARENGO_27 or MARENGO_30
+        corpus: Synthetic corpus to search
+        nlist: IVF list count passed to each VectorIndex (0 = automatic)
+        nprobe: IVF lists scanned per query
+    """
+
+    def __init__(
+        self,
+        index_id: str,
+        model_name: str,
+        corpus: Corpus,
+        nlist: int = 0,
+        nprobe: int = 16,
+    ):
+        self.index_id = index_id
+        self.model_name = model_name
+        self.corpus = corpus
+        self.total_duration = float(sum(video["duration"] for video in corpus.videos))
+        self.engines: Dict[str, VectorIndex] = {
+            modality: VectorIndex(corpus.vectors[modality], nlist=nlist, nprobe=nprobe)
+            for modality in MODALITIES
+            if modality in SUPPORTED_OPTIONS[model_name]
+        }
+        self.lexical: Optional[InvertedIndex] = None
+        if "transcription" in self.engines:
+            self.lexical = InvertedIndex(corpus.transcripts)
+        self.metadata = MetadataIndex(corpus.videos)
+
+    @property
+    def supported_options(self) -> Tuple[str, ...]:
+        return SUPPORTED_OPTIONS[self.model_name]
+
+    def clip_mask(self, compiled: CompiledFilter) -> np.ndarray:
+        """Return a boolean mask over clips whose video satisfies the filter."""
+        return self.metadata.evaluate(compiled)[self.corpus.clip_video]
+
+    def search(
+        self,
+        query: np.ndarray,
+        search_options: List[str],
+        operator: str = "or",
+        candidate_k: int = 200,
+        min_score: float = 0.1,
+        query_text: str = "",
+        transcription_options: Sequence[str] = DEFAULT_TRANSCRIPTION_OPTIONS,
+        allowed: Optional[np.ndarray] = None,
+    ) -> Hits:
+        """Run one top-k search per modality and merge the results.
+
+        Args:
+            query: Query unit vector
+            search_options: Modalities to search (already validated)
+            operator: "or" or "and"
+            candidate_k: Maximum hits kept per modality
+            min_score: Minimum cosine similarity for a hit
+            query_text: Raw query text, used for lexical transcription matching
+            transcription_options: "lexical" and/or "semantic"
+            allowed: Optional boolean mask over clips (see ``clip_mask``); other
+                clips are never returned
+
+        Returns:
+            (clip_ids, scores) ordered by descending score
+        """
+        hits = []
+        for option in dict.fromkeys(search_options):
+            if option == "transcription":
+                hits.append(
+                    self._search_transcription(
+                        query,
+                        query_text,
+                        transcription_options,
+                        candidate_k,
+                        min_score,
+                        allowed,
+                    )
+                )
+            else:
+                hits.append(
+                    self.engines[option].search(
+                        query, candidate_k, min_score=min_score, allowed=allowed
+                    )
+                )
+        return merge_modalities(hits, operator)
+
+    def _search_transcription(
+        self, query, query_text, transcription_options, candidate_k, min_score, allowed
+    ) -> Hits:
+        """Search transcripts lexically, semantically or both (best score wins)."""
+        hits = []
+        if "semantic" in transcription_options:
+            hits.append(
+                self.engines["transcription"].search(
+                    query, candidate_k, min_score=min_score, allowed=allowed
+                )
+            )
+        if "lexical" in transcription_options and query_text.strip():
+            hits.append(self.lexical.search(query_text, candidate_k, allowed=allowed))
+        return merge_modalities(hits, "or")
@@ -0,0 +1,286 @@
+"""
+Latency replay for the local stand-in
+
+Records per-request latencies of live runs (``RecordingTransport``), learns
+empirical latency distributions keyed by endpoint, index model and request shape
+(``LatencyModel``), and samples delays from them so that stand-in responses are
+timed like the real API, tail included.
+
+A request shape is ``(endpoint, model, page_limit, group_by, query_kind)``.
+Shapes with too few recorded samples back off to coarser keys
+(dropping page_limit, then group_by, then query_kind, then model).
+"""
+
+import json
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+ENDPOINT_SEARCH = "search"
+ENDPOINT_SEARCH_PAGE = "search_page"
+ENDPOINT_ERROR = "error"
+
+ShapeKey = Tuple[str, ...]
+
+
+def request_shape(
+    endpoint: str,
+    model: str = "unknown",
+    page_limit: Optional[int] = None,
+    group_by: Optional[str] = None,
+    query_kind: str = "text",
+) -> ShapeKey:
+    """Build the full latency key of a request."""
+    return (
+        endpoint,
+        model,
+        str(page_limit if page_limit is not None else 10),
+        group_by or "clip",
+        query_kind,
+    )
+
+
+def _backoff_keys(shape: ShapeKey) -> List[ShapeKey]:
+    """Keys from most to least specific for a full shape."""
+    endpoint, model, page_limit, group_by, query_kind = shape
+    return [
+        shape,
+        (endpoint, model, "*", group_by, query_kind),
+        (endpoint, model, "*", "*", query_kind),
+        (endpoint, model, "*", "*", "*"),
+        (endpoint, "*", "*", "*", "*"),
+    ]
+
+
+def _key_text(key: ShapeKey) -> str:
+    return "|".join(key)
+
+
+class LatencyModel:
+    """Empirical latency distributions per request shape.
+
+    Args:
+        samples: Latency samples in seconds per shape key (any backoff level)
+        min_samples: Samples a key needs before it is used instead of a coarser key
+        scale: Multiplier applied to every sampled delay (0 disables delays)
+        seed: Seed of the sampling random generator
+    """
+
+    def __init__(
+        self,
+        samples: Dict[ShapeKey, Sequence[float]],
+        min_samples: int = 20,
+        scale: float = 1.0,
+        seed: int = 0,
+    ):
+        self.samples = {
+            tuple(key): np.sort(np.asarray(values, dtype=np.float64))
+            for key, values in samples.items()
+            if len(values)
+        }
+        self.min_samples = min_samples
+        self.scale = scale
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], **kwargs) -> "LatencyModel":
+        """Fit a model from recorded requests (see ``RecordingTransport``).
+
+        Every record contributes to its full shape and to each coarser backoff key.
+        """
+        pooled: Dict[ShapeKey, List[float]] = {}
+        for record in records:
+            endpoint = record["endpoint"]
+            if int(record.get("status", 200)) >= 400:
+                endpoint = ENDPOINT_ERROR
+            shape = request_shape(
+                endpoint,
+                record.get("model") or "unknown",
+                record.get("page_limit"),
+                record.get("group_by"),
+                record.get("query_kind") or "text",
+            )
+            for key in _backoff_keys(shape):
+                pooled.setdefault(key, []).append(float(record["latency_s"]))
+        return cls(pooled, **kwargs)
+
+    @classmethod
+    def synthetic(
+        cls,
+        median_s: float = 0.25,
+        sigma: float = 0.35,
+        tail_fraction: float = 0.02,
+        tail_alpha: float = 1.5,
+        count: int = 2000,
+        seed: int = 0,
+        **kwargs,
+    ) -> "LatencyModel":
+        """Heavy-tailed model for every request: log-normal body plus a Pareto tail.
+
+        Useful when no live recordings exist, e.g. to test tail-latency mitigations.
+        """
+        rng = np.random.default_rng(seed)
+        body = median_s * np.exp(sigma * rng.standard_normal(count))
+        tail = rng.random(count) < tail_fraction
+        body[tail] = median_s * 4.0 * (1.0 + rng.pareto(tail_alpha, int(tail.sum())))
+        samples = {
+            (endpoint, "*", "*", "*", "*"): body
+            for endpoint in (ENDPOINT_SEARCH, ENDPOINT_SEARCH_PAGE)
+        }
+        samples[(ENDPOINT_ERROR, "*", "*", "*", "*")] = body * 0.5
+        kwargs.setdefault("seed", seed)
+        return cls(samples, **kwargs)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "LatencyModel":
+        """Load a saved model, or fit one from a JSON Lines file of recorded requests."""
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        try:
+            saved = json.loads(text)
+        except ValueError:
+            saved = None
+        if isinstance(saved, dict) and "samples" in saved:
+            kwargs.setdefault("min_samples", saved.get("min_samples", 20))
+            return cls(
+                {
+                    tuple(key.split("|")): values
+                    for key, values in saved["samples"].items()
+                },
+                **kwargs,
+            )
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        return cls.from_records(records, **kwargs)
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "min_samples": self.min_samples,
+                    "samples": {
+                        _key_text(key): [round(float(v), 6) for v in values]
+                        for key, values in sorted(self.samples.items())
+                    },
+                },
+                f,
+            )
+
+    def distribution(self, shape: ShapeKey) -> Optional[np.ndarray]:
+        """Return the sorted samples used for ``shape`` after backoff, if any."""
+        fallback = None
+        for key in _backoff_keys(shape):
+            values = self.samples.get(key)
+            if values is None:
+                continue
+            if len(values) >= self.min_samples:
+                return values
+            if fallback is None:
+                fallback = values
+        return fallback
+
+    def sample(self, shape: ShapeKey) -> float:
+        """Draw one delay in seconds for a request of the given shape.
+
+        Draws interpolate between recorded quantiles, so repeated draws do not
+        just replay the same handful of values.
+        """
+        values = self.distribution(shape)
+        if values is None or self.scale <= 0:
+            return 0.0
+        with self._lock:
+            u = self._rng.random()
+        position = u * (len(values) - 1)
+        low = int(position)
+        high = min(low + 1, len(values) - 1)
+        delay = values[low] + (values[high] - values[low]) * (position - low)
+        return float(delay) * self.scale
+
+    def percentile(self, shape: ShapeKey, q: float) -> float:
+        values = self.distribution(shape)
+        if values is None:
+            return 0.0
+        return float(np.percentile(values, q)) * self.scale
+
+
+class RecordingTransport:
+    """httpx transport wrapper that records the latency of every search request.
+
+    Appends one JSON line per request to ``path`` with the endpoint, the index
+    model (looked up from ``index_models``), page_limit, group_by, query kind,
+    status code and latency in seconds. Page requests inherit the shape of the
+    search that produced their page token.
+
+    Args:
+        inner: Transport that actually sends the request (e.g. ``httpx.HTTPTransport()``)
+        path: JSON Lines file to append to
+        index_models: Index ID -> model name (e.g. MARENGO_27)
+    """
+
+    def __init__(self, inner, path: str, index_models: Optional[Dict[str, str]] = None):
+        self.inner = inner
+        self.path = path
+        self.index_models = dict(index_models or {})
+        self._token_shapes: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request):
+        from .server import _PATH_PATTERN, parse_multipart
+
+        body = request.read()
+        start = time.perf_counter()
+        response = self.inner.handle_request(request)
+        response.read()
+        latency = time.perf_counter() - start
+
+        match = _PATH_PATTERN.match(request.url.path)
+        if not match:
+            return response
+        token = match.group("token")
+        if token is None:
+            fields, _ = parse_multipart(body, request.headers.get("content-type", ""))
+
+            def first(name):
+                values = fields.get(name)
+                return values[0] if values else None
+
+            page_limit = first("page_limit")
+            shape = {
+                "endpoint": ENDPOINT_SEARCH,
+                "model": self.index_models.get(first("index_id") or "", "unknown"),
+                "page_limit": int(page_limit) if page_limit else None,
+                "group_by": first("group_by"),
+                "query_kind": "media" if first("query_media_type") else "text",
+            }
+        else:
+            with self._lock:
+                origin = self._token_shapes.pop(token, None)
+            shape = dict(origin or {"model": "unknown"}, endpoint=ENDPOINT_SEARCH_PAGE)
+
+        if response.status_code < 400:
+            try:
+                next_token = json.loads(response.content)["page_info"].get(
+                    "next_page_token"
+                )
+            except (ValueError, KeyError, TypeError, AttributeError):
+                next_token = None
+            if next_token:
+                with self._lock:
+                    self._token_shapes[next_token] = shape
+
+        record = dict(shape, status=response.status_code, latency_s=round(latency, 6))
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        return response
+
+    def close(self):
+        self.inner.close()
+
+    def __enter__(self):
+        self.inner.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.inner.__exit__(*exc_info)
@@ -0,0 +1,155 @@
+"""
+Lexical transcription search for the local stand-in
+
+An inverted index over clip transcripts with positional postings, scored with
+Okapi BM25. Serves ``transcription_options=["lexical"]`` (exact word matching);
+quoted phrases in the query must match consecutive words.
+"""
+
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .corpus import tokenize
+from .vector import top_k
+
+_PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+
+
+class Postings:
+    """Postings list of one term.
+
+    ``doc_ids`` is sorted and unique; the positions of the term in
+    ``doc_ids[i]`` are ``positions[offsets[i]:offsets[i + 1]]``.
+    """
+
+    __slots__ = ("doc_ids", "term_freqs", "offsets", "positions")
+
+    def __init__(self, doc_ids, term_freqs, offsets, positions):
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.offsets = offsets
+        self.positions = positions
+
+    def positions_of(self, i: int) -> np.ndarray:
+        return self.positions[self.offsets[i] : self.offsets[i + 1]]
+
+
+class InvertedIndex:
+    """Positional inverted index with BM25 scoring.
+
+    Args:
+        documents: One text per document (document id = position in the sequence)
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization
+    """
+
+    def __init__(self, documents: Sequence[str], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.num_docs = len(documents)
+
+        occurrences: Dict[str, Tuple[List[int], List[int]]] = {}
+        doc_lengths = np.zeros(self.num_docs, dtype=np.float32)
+        for doc_id, text in enumerate(documents):
+            tokens = tokenize(text)
+            doc_lengths[doc_id] = len(tokens)
+            for position, token in enumerate(tokens):
+                docs, positions = occurrences.setdefault(token, ([], []))
+                docs.append(doc_id)
+                positions.append(position)
+
+        self.doc_lengths = doc_lengths
+        self.avg_doc_length = float(doc_lengths.mean()) if self.num_docs else 0.0
+        self.postings: Dict[str, Postings] = {}
+        for token, (docs, positions) in occurrences.items():
+            # Occurrences were appended in (doc, position) order, so they are sorted
+            docs_array = np.asarray(docs, dtype=np.int32)
+            doc_ids, first, counts = np.unique(
+                docs_array, return_index=True, return_counts=True
+            )
+            self.postings[token] = Postings(
+                doc_ids,
+                counts.astype(np.float32),
+                np.append(first, len(docs_array)).astype(np.int64),
+                np.asarray(positions, dtype=np.int32),
+            )
+
+    def __len__(self) -> int:
+        return self.num_docs
+
+    def idf(self, term: str) -> float:
+        postings = self.postings.get(term)
+        df = len(postings.doc_ids) if postings is not None else 0
+        return math.log(1.0 + (self.num_docs - df + 0.5) / (df + 0.5))
+
+    def bm25(self, terms: Sequence[str]) -> np.ndarray:
+        """Return the BM25 score of every document for the given query terms."""
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+        norm = self.k1 * (
+            1.0 - self.b + self.b * self.doc_lengths / max(self.avg_doc_length, 1e-9)
+        )
+        for term in dict.fromkeys(terms):
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            tf = postings.term_freqs
+            scores[postings.doc_ids] += (
+                self.idf(term) * tf * (self.k1 + 1.0) / (tf + norm[postings.doc_ids])
+            )
+        return scores
+
+    def phrase_docs(self, terms: Sequence[str]) -> np.ndarray:
+        """Return ids of documents containing ``terms`` as consecutive words."""
+        if not terms:
+            return np.empty(0, dtype=np.int32)
+        postings = [self.postings.get(term) for term in terms]
+        if any(p is None for p in postings):
+            return np.empty(0, dtype=np.int32)
+
+        # Encode every occurrence as doc * stride + (position - offset): a phrase
+        # starts wherever all terms share the same key.
+        stride = int(self.doc_lengths.max()) + len(terms) + 1
+        starts = None
+        for offset, p in enumerate(postings):
+            occurrence_docs = np.repeat(p.doc_ids.astype(np.int64), np.diff(p.offsets))
+            keys = occurrence_docs * stride + (p.positions - offset + len(terms))
+            starts = keys if starts is None else np.intersect1d(starts, keys)
+            if starts.size == 0:
+                break
+        return np.unique(starts // stride).astype(np.int32)
+
+    def search(
+        self,
+        query_text: str,
+        k: int,
+        saturation: float = 4.0,
+        allowed: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Lexical top-k search.
+
+        Documents must contain at least one query word; quoted phrases must all
+        match as consecutive words. BM25 scores are mapped to [0, 1) with
+        ``s / (s + saturation)`` so they can be merged with cosine similarities.
+        When ``allowed`` (a boolean mask over documents) is given, only those
+        documents are returned.
+
+        Returns:
+            (doc_ids, scores) ordered by descending score
+        """
+        phrases = [tokenize(phrase) for phrase in _PHRASE_PATTERN.findall(query_text)]
+        terms = tokenize(query_text)
+        scores = self.bm25(terms)
+        for phrase in phrases:
+            has_phrase = np.zeros(self.num_docs, dtype=bool)
+            has_phrase[self.phrase_docs(phrase)] = True
+            scores[~has_phrase] = 0.0
+        if allowed is not None:
+            scores[~allowed] = 0.0
+
+        best = top_k(scores, k)
+        best = best[scores[best] > 0]
+        raw = scores[best]
+        return best.astype(np.int64), (raw / (raw + saturation)).astype(np.float32)
@@ -0,0 +1,695 @@
+"""
+HTTP front end of the local stand-in
+
+Implements ``POST /search`` and ``GET /search/{page_token}`` with the request
+validation, error codes, grouping and pagination described in reference/search.md,
+and ``GET /indexes/{index_id}`` for index details.
+The same handler is exposed as an in-process httpx transport (zero network) and
+as a threaded HTTP server for out-of-process clients.
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from .corpus import build_corpus, tokenize
+from .filters import FilterCache, FilterSyntaxError
+from .index import (
+    DEFAULT_TRANSCRIPTION_OPTIONS,
+    MARENGO_27,
+    MARENGO_30,
+    MAX_QUERY_TOKENS,
+    SearchIndex,
+)
+from .latency import (
+    ENDPOINT_ERROR,
+    ENDPOINT_SEARCH,
+    ENDPOINT_SEARCH_PAGE,
+    LatencyModel,
+    request_shape,
+)
+
+STANDIN_INDEX_MARENGO_27 = "standin-marengo27"
+STANDIN_INDEX_MARENGO_30 = "standin-marengo30"
+STANDIN_BASE_URL = "http://standin.local/v1.3"
+
+KNOWN_OPTIONS = ("visual", "audio", "transcription")
+DEFAULT_PAGE_LIMIT = 10
+MAX_PAGE_LIMIT = 50
+
+_PATH_PATTERN = re.compile(r"^(?:.*/)?search(?:/(?P<token>[^/]+))?/?$")
+_INDEX_PATH_PATTERN = re.compile(r"^(?:.*/)?indexes/(?P<index_id>[^/]+)/?$")
+# created_at/updated_at of every stand-in index (the corpus is rebuilt per run)
+_INDEX_TIMESTAMP = "2024-01-01T00:00:00Z"
+_IMAGE_SIGNATURES = (b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff", b"GIF8", b"RIFF", b"BM")
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class StandinError(Exception):
+    """Error returned to the client as ``{"code": ..., "message": ...}``."""
+
+    def __init__(self, code: str, message: str, status: int = 400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+class _SearchSession:
+    """Ranked results of one search request, paged by ``next_page_token``."""
+
+    __slots__ = (
+        "search_id",
+        "index",
+        "clip_ids",
+        "scores",
+        "groups",
+        "search_options",
+        "page_limit",
+        "include_user_metadata",
+        "expires_at",
+        "shape",
+    )
+
+    def __init__(
+        self,
+        search_id,
+        index,
+        clip_ids,
+        scores,
+        groups,
+        search_options,
+        page_limit,
+        include_user_metadata,
+        expires_at,
+        shape=None,
+    ):
+        self.search_id = search_id
+        self.index = index
+        self.clip_ids = clip_ids
+        self.scores = scores
+        self.groups = groups
+        self.search_options = search_options
+        self.page_limit = page_limit
+        self.include_user_metadata = include_user_metadata
+        self.expires_at = expires_at
+        # Latency key of the originating search (see standin.latency)
+        self.shape = shape
+
+    @property
+    def total_results(self) -> int:
+        return len(self.groups) if self.groups is not None else len(self.clip_ids)
+
+
+def parse_multipart(
+    body: bytes, content_type: str
+) -> Tuple[Dict[str, List[str]], Dict[str, bytes]]:
+    """Split a multipart/form-data body into text fields and file contents."""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise StandinError("parameter_invalid", "Malformed multipart request body.")
+    delimiter = b"--" + match.group(1).encode("latin-1")
+    fields: Dict[str, List[str]] = {}
+    files: Dict[str, bytes] = {}
+    for part in body.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break
+        head, _, content = part[2:].partition(b"\r\n\r\n")
+        if content.endswith(b"\r\n"):
+            content = content[:-2]
+        disposition = head.decode("latin-1")
+        name = re.search(r'name="([^"]*)"', disposition)
+        if not name:
+            continue
+        if re.search(r'filename="', disposition):
+            files[name.group(1)] = content
+        else:
+            fields.setdefault(name.group(1), []).append(content.decode("utf-8"))
+    return fields, files
+
+
+class StandinServer:
+    """Local stand-in for the Twelve Labs search API.
+
+    Args:
+        indexes: Indexes to serve
+        page_token_ttl: Seconds a ``next_page_token`` stays valid
+        max_sessions: Number of searches whose pages are retained (oldest evicted first)
+        candidate_k: Maximum hits per modality for each search
+        min_score: Minimum cosine similarity for a hit
+        latency_model: Optional LatencyModel; responses are delayed by a sampled
+            latency for the request's endpoint, index model and shape
+        transfer_rate: Optional body transfer rate in bytes per second; bodies are
+            then sent in ``chunk_size`` chunks paced to that rate (streamed)
+        chunk_size: Chunk size of paced response bodies
+    """
+
+    def __init__(
+        self,
+        indexes: Sequence[SearchIndex] = (),
+        page_token_ttl: float = 3600.0,
+        max_sessions: int = 10_000,
+        candidate_k: int = 200,
+        min_score: float = 0.1,
+        latency_model: Optional[LatencyModel] = None,
+        transfer_rate: Optional[float] = None,
+        chunk_size: int = 16_384,
+    ):
+        self.indexes: Dict[str, SearchIndex] = {}
+        for index in indexes:
+            self.add_index(index)
+        self.page_token_ttl = page_token_ttl
+        self.max_sessions = max_sessions
+        self.candidate_k = candidate_k
+        self.min_score = min_score
+        self.latency_model = latency_model
+        self.transfer_rate = transfer_rate
+        self.chunk_size = chunk_size
+        self.request_counts: Counter = Counter()
+        self._sessions: "OrderedDict[str, _SearchSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._filters = FilterCache()
+
+    @classmethod
+    def with_default_indexes(
+        cls, num_videos: int = 120, seed: int = 0, metadata_size: int = 0, **kwargs
+    ) -> "StandinServer":
+        """Create a server with one Marengo 2.7 and one Marengo 3.0 index.
+
+        ``metadata_size`` adds roughly that many bytes of user metadata per video.
+        """
+        return cls(
+            [
+                SearchIndex(
+                    STANDIN_INDEX_MARENGO_27,
+                    MARENGO_27,
+                    build_corpus(num_videos, seed=seed, metadata_size=metadata_size),
+                ),
+                SearchIndex(
+                    STANDIN_INDEX_MARENGO_30,
+                    MARENGO_30,
+                    build_corpus(
+                        num_videos, seed=seed + 1, metadata_size=metadata_size
+                    ),
+                ),
+            ],
+            **kwargs,
+        )
+
+    def add_index(self, index: SearchIndex):
+        self.indexes[index.index_id] = index
+
+    # ------------------------------------------------------------------
+    # Transports
+    # ------------------------------------------------------------------
+
+    def transport(self):
+        """Return an httpx transport that serves requests in-process."""
+        import httpx
+
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            status, headers, body = self.handle(
+                request.method,
+                request.url.path,
+                {
+                    key: request.url.params.get_list(key)
+                    for key in request.url.params.keys()
+                },
+                request.headers.get("content-type", ""),
+                request.read(),
+            )
+            if self.transfer_rate:
+                return httpx.Response(
+                    status, headers=headers, content=self.body_chunks(body)
+                )
+            return httpx.Response(status, headers=headers, content=body)
+
+        return httpx.MockTransport(handler)
+
+    def body_chunks(self, body: bytes) -> Iterator[bytes]:
+        """Yield ``body`` in chunks paced to ``transfer_rate`` bytes per second."""
+        started = time.perf_counter()
+        for offset in range(0, len(body), self.chunk_size):
+            chunk = body[offset : offset + self.chunk_size]
+            if self.transfer_rate:
+                due = started + (offset + len(chunk)) / self.transfer_rate
+                remaining = due - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+            yield chunk
+
+    def make_client(self, **kwargs):
+        """Create a ``TwelveLabs`` client wired to this stand-in (no network)."""
+        import httpx
+        from twelvelabs import TwelveLabs
+
+        kwargs.setdefault("api_key", "standin")
+        kwargs.setdefault("base_url", STANDIN_BASE_URL)
+        kwargs.setdefault("httpx_client", httpx.Client(transport=self.transport()))
+        return TwelveLabs(**kwargs)
+
+    def serve_http(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """Start a threaded HTTP server in a daemon thread and return it.
+
+        Point the SDK at it with ``base_url=f"http://{host}:{server.server_port}/v1.3"``.
+        """
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _dispatch(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                status, headers, body = standin.handle(
+                    self.command,
+                    url.path,
+                    parse_qs(url.query),
+                    self.headers.get("Content-Type", ""),
+                    self.rfile.read(length) if length else b"",
+                )
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                for chunk in standin.body_chunks(body):
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+
+            def log_message(self, format, *args):
+                pass
+
+        httpd = ThreadingHTTPServer((host, port), Handler)
+        httpd.daemon_threads = True
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        return httpd
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, List[str]],
+        content_type: str,
+        body: bytes,
+    ) -> Response:
+        """Serve one request and return (status, headers, body)."""
+        started = time.perf_counter()
+        match = _PATH_PATTERN.match(path)
+        index_match = _INDEX_PATH_PATTERN.match(path)
+        try:
+            if index_match and method == "GET":
+                self.request_counts["index"] += 1
+                payload = self._render_index(index_match.group("index_id"))
+                return (
+                    200,
+                    {"content-type": "application/json"},
+                    json.dumps(payload).encode("utf-8"),
+                )
+            if not match:
+                raise StandinError("resource_not_exists", f"No route for {path}.", 404)
+            token = match.group("token")
+            if method == "POST" and token is None:
+                self.request_counts["search"] += 1
+                fields, files = self._parse_body(content_type, body)
+                session = self._create_search(fields, files)
+                shape = session.shape
+                payload = self._render_page(session, 0)
+            elif method == "GET" and token is not None:
+                self.request_counts["search_page"] += 1
+                session, page_number = self._page_session(token)
+                shape = (ENDPOINT_SEARCH_PAGE,) + session.shape[1:]
+                payload = self._render_page(session, page_number)
+            else:
+                raise StandinError(
+                    "resource_not_exists", f"No route for {method} {path}.", 404
+                )
+        except StandinError as e:
+            self._delay(request_shape(ENDPOINT_ERROR), started)
+            return (
+                e.status,
+                {"content-type": "application/json"},
+                json.dumps({"code": e.code, "message": e.message}).encode("utf-8"),
+            )
+        response = json.dumps(payload).encode("utf-8")
+        self._delay(shape, started)
+        return 200, {"content-type": "application/json"}, response
+
+    def _render_index(self, index_id: str) -> dict:
+        index = self.indexes.get(index_id)
+        if index is None:
+            raise StandinError(
+                "resource_not_exists", f"Index {index_id} does not exist.", 404
+            )
+        return {
+            "_id": index.index_id,
+            "index_name": index.index_id,
+            "models": [
+                {
+                    "model_name": index.model_name,
+                    "model_options": list(index.supported_options),
+                }
+            ],
+            "video_count": len(index.corpus.videos),
+            "total_duration": index.total_duration,
+            "created_at": _INDEX_TIMESTAMP,
+            "updated_at": _INDEX_TIMESTAMP,
+            "expires_at": None,
+        }
+
+    def _delay(self, shape, started: float):
+        """Sleep so the request takes as long as a latency-model sample, if any."""
+        if self.latency_model is None:
+            return
+        remaining = self.latency_model.sample(shape) - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _parse_body(self, content_type: str, body: bytes):
+        if content_type.startswith("multipart/form-data"):
+            return parse_multipart(body, content_type)
+        if content_type.startswith("application/json"):
+            data = json.loads(body or b"{}")
+            return {k: v if isinstance(v, list) else [v] for k, v in data.items()}, {}
+        return parse_qs(body.decode("utf-8")), {}
+
+    def _create_search(
+        self, fields: Dict[str, List[str]], files: Dict[str, bytes]
+    ) -> _SearchSession:
+        def first(name: str) -> Optional[str]:
+            values = fields.get(name)
+            return values[0] if values else None
+
+        index_id = first("index_id")
+        if not index_id:
+            raise StandinError(
+                "parameter_not_provided", "The index_id parameter is required."
+            )
+        index = self.indexes.get(index_id)
+        if index is None:
+            raise StandinError(
+                "parameter_invalid", f"The index_id parameter is invalid: {index_id}."
+            )
+
+        search_options = fields.get("search_options") or []
+        if not search_options:
+            raise StandinError(
+                "parameter_not_provided", "The search_options parameter is required."
+            )
+        for option in search_options:
+            if option not in KNOWN_OPTIONS or option not in index.supported_options:
+                raise StandinError(
+                    "search_option_not_supported",
+                    f"Search option {option} is not supported for index {index_id}. "
+                    f"Please use one of the following search options: {', '.join(index.supported_options)}.",
+                )
+
+        transcription_options = fields.get("transcription_options") or list(
+            DEFAULT_TRANSCRIPTION_OPTIONS
+        )
+        for option in transcription_options:
+            if option not in ("lexical", "semantic"):
+                raise StandinError(
+                    "parameter_invalid",
+                    f"The transcription_options value {option} is invalid.",
+                )
+
+        query_vector = self._query_vector(index, fields, files, search_options)
+
+        group_by = first("group_by") or "clip"
+        if group_by not in ("clip", "video"):
+            raise StandinError(
+                "parameter_invalid",
+                "The group_by parameter must be one of: video, clip.",
+            )
+        operator = first("operator") or "or"
+        if operator not in ("or", "and"):
+            raise StandinError(
+                "parameter_invalid", "The operator parameter must be one of: or, and."
+            )
+        sort_option = first("sort_option") or "score"
+        if sort_option not in ("score", "clip_count"):
+            raise StandinError(
+                "parameter_invalid",
+                "The sort_option parameter must be one of: score, clip_count.",
+            )
+        if sort_option == "clip_count" and group_by != "video":
+            raise StandinError(
+                "parameter_invalid", "sort_option=clip_count requires group_by=video."
+            )
+
+        page_limit = first("page_limit")
+        try:
+            page_limit = (
+                int(page_limit) if page_limit is not None else DEFAULT_PAGE_LIMIT
+            )
+        except ValueError:
+            raise StandinError(
+                "parameter_invalid", "The page_limit parameter must be an integer."
+            )
+        if page_limit < 1 or page_limit > MAX_PAGE_LIMIT:
+            raise StandinError(
+                "parameter_invalid",
+                f"The page_limit parameter must be between 1 and the maximum of {MAX_PAGE_LIMIT}.",
+            )
+
+        allowed = None
+        filter_text = first("filter")
+        if filter_text:
+            try:
+                compiled = self._filters.compile(filter_text)
+            except FilterSyntaxError:
+                raise StandinError(
+                    "search_filter_invalid",
+                    "Filter used in search is invalid. Please use the valid filter syntax by following filtering documentation.",
+                )
+            allowed = index.clip_mask(compiled)
+
+        clip_ids, scores = index.search(
+            query_vector,
+            search_options,
+            operator,
+            self.candidate_k,
+            self.min_score,
+            query_text=first("query_text") or "",
+            transcription_options=transcription_options,
+            allowed=allowed,
+        )
+
+        groups = None
+        if group_by == "video":
+            groups = self._group_by_video(index, clip_ids, sort_option)
+
+        include_user_metadata = (first("include_user_metadata") or "").lower() == "true"
+        session = _SearchSession(
+            uuid.uuid4().hex[:16],
+            index,
+            clip_ids,
+            scores,
+            groups,
+            tuple(search_options),
+            page_limit,
+            include_user_metadata,
+            time.time() + self.page_token_ttl,
+            request_shape(
+                ENDPOINT_SEARCH,
+                index.model_name,
+                page_limit,
+                group_by,
+                "media" if first("query_media_type") else "text",
+            ),
+        )
+        self._store_session(session)
+        return session
+
+    def _query_vector(
+        self, index: SearchIndex, fields, files, search_options
+    ) -> np.ndarray:
+        query_text = (fields.get("query_text") or [""])[0]
+        media_type = (fields.get("query_media_type") or [None])[0]
+        media_url = (fields.get("query_media_url") or [None])[0]
+        media_file = files.get("query_media_file")
+        has_media = media_file is not None or bool(media_url)
+
+        if (media_type is None and has_media) or (
+            media_type is not None and not has_media and not query_text.strip()
+        ):
+            raise StandinError(
+                "parameter_not_provided",
+                "Media queries require both query_media_type and query_media_file or query_media_url.",
+            )
+        if not query_text.strip() and not has_media:
+            raise StandinError(
+                "parameter_not_provided",
+                "Either query_text or a media query is required.",
+            )
+
+        vectors = []
+        if query_text.strip():
+            if len(query_text.split()) > MAX_QUERY_TOKENS[index.model_name]:
+                raise StandinError(
+                    "parameter_invalid",
+                    f"The query_text parameter exceeds the maximum of {MAX_QUERY_TOKENS[index.model_name]} tokens.",
+                )
+            vectors.append(index.corpus.embedder.embed_tokens(tokenize(query_text)))
+        if has_media:
+            if media_type != "image":
+                raise StandinError(
+                    "parameter_invalid", "The query_media_type parameter must be image."
+                )
+            if "visual" not in search_options:
+                raise StandinError(
+                    "parameter_invalid",
+                    "Image queries require the visual search option.",
+                )
+            if vectors and index.model_name != MARENGO_30:
+                raise StandinError(
+                    "parameter_invalid",
+                    "Composed text and media queries require Marengo 3.0.",
+                )
+            if media_file is not None:
+                if not media_file.startswith(_IMAGE_SIGNATURES):
+                    raise StandinError(
+                        "parameter_invalid",
+                        "The query_media_file is not a supported image file.",
+                    )
+                vectors.append(index.corpus.embedder.embed_media(media_file))
+            else:
+                vectors.append(
+                    index.corpus.embedder.embed_media(media_url.encode("utf-8"))
+                )
+
+        query = np.sum(vectors, axis=0)
+        norm = np.linalg.norm(query)
+        return query / norm if norm > 0 else query
+
+    @staticmethod
+    def _group_by_video(
+        index: SearchIndex, clip_ids: np.ndarray, sort_option: str
+    ) -> List[Tuple[int, np.ndarray]]:
+        """Group ranked positions by video, preserving rank order within each video."""
+        video_of_clip = index.corpus.clip_video[clip_ids]
+        groups: "OrderedDict[int, List[int]]" = OrderedDict()
+        for position, video in enumerate(video_of_clip.tolist()):
+            groups.setdefault(video, []).append(position)
+        grouped = [(video, np.array(positions)) for video, positions in groups.items()]
+        if sort_option == "clip_count":
+            grouped.sort(key=lambda group: (-len(group[1]), group[1][0]))
+        return grouped
+
+    def _store_session(self, session: _SearchSession):
+        with self._lock:
+            now = time.time()
+            while self._sessions:
+                oldest = next(iter(self._sessions.values()))
+                if oldest.expires_at > now and len(self._sessions) < self.max_sessions:
+                    break
+                self._sessions.popitem(last=False)
+            self._sessions[session.search_id] = session
+
+    def _page_session(self, token: str) -> Tuple[_SearchSession, int]:
+        search_id, _, page = token.rpartition("-")
+        with self._lock:
+            session = self._sessions.get(search_id)
+        if session is None or not page.isdigit() or session.expires_at <= time.time():
+            raise StandinError(
+                "search_page_token_expired",
+                f"The token that identifies the page to be retrieved is expired or invalid. "
+                f"You must make a new search request. Token: {token}.",
+            )
+        page_number = int(page)
+        if page_number * session.page_limit >= max(session.total_results, 1):
+            raise StandinError(
+                "search_page_token_expired",
+                f"The page token is invalid. Token: {token}.",
+            )
+        return session, page_number
+
+    # ------------------------------------------------------------------
+    # Response rendering
+    # ------------------------------------------------------------------
+
+    def _clip_item(
+        self, session: _SearchSession, position: int, with_metadata: bool
+    ) -> dict:
+        corpus = session.index.corpus
+        clip_id = int(session.clip_ids[position])
+        video = corpus.video_of(clip_id)
+        item = {
+            "video_id": video["id"],
+            "start": float(corpus.clip_start[clip_id]),
+            "end": float(corpus.clip_end[clip_id]),
+            "thumbnail_url": f"https://standin.twelvelabs.local/thumbnails/{video['id']}/{clip_id}.jpg",
+        }
+        if session.index.model_name == MARENGO_30:
+            item["rank"] = position + 1
+            if "transcription" in session.search_options:
+                item["transcription"] = corpus.transcripts[clip_id]
+        else:
+            score = float(session.scores[position])
+            item["score"] = round(score * 100, 2)
+            item["confidence"] = (
+                "high" if score >= 0.55 else "medium" if score >= 0.35 else "low"
+            )
+        if with_metadata:
+            item["user_metadata"] = video["user_metadata"]
+        return item
+
+    def _render_page(self, session: _SearchSession, page_number: int) -> dict:
+        start = page_number * session.page_limit
+        end = start + session.page_limit
+        if session.groups is None:
+            data = [
+                self._clip_item(session, position, session.include_user_metadata)
+                for position in range(start, min(end, len(session.clip_ids)))
+            ]
+        else:
+            data = []
+            for video_index, positions in session.groups[start:end]:
+                video = session.index.corpus.videos[video_index]
+                item = {
+                    "id": video["id"],
+                    "clips": [
+                        self._clip_item(session, int(p), False) for p in positions
+                    ],
+                }
+                if session.include_user_metadata:
+                    item["user_metadata"] = video["user_metadata"]
+                data.append(item)
+
+        corpus = session.index.corpus
+        page_info = {
+            "limit_per_page": session.page_limit,
+            "total_results": session.total_results,
+            "page_expires_at": datetime.fromtimestamp(session.expires_at, timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z"),
+        }
+        if end < session.total_results:
+            page_info["next_page_token"] = f"{session.search_id}-{page_number + 1}"
+        if page_number > 0:
+            page_info["prev_page_token"] = f"{session.search_id}-{page_number - 1}"
+        return {
+            "data": data,
+            "page_info": page_info,
+            "search_pool": {
+                "total_count": len(corpus.videos),
+                "total_duration": session.index.total_duration,
+                "index_id": session.index.index_id,
+            },
+        }
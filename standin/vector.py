@@ -0,0 +1,155 @@
+"""
+Top-k vector search for the local stand-in
+
+Brute-force inner-product search for small corpora and an IVF (inverted file)
+index for large ones. Vectors are unit-normalized, so inner product is cosine
+similarity.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Corpora at or above this size get an IVF index unless told otherwise.
+IVF_MIN_VECTORS = 50_000
+
+# Below this fraction of allowed vectors, brute force gathers the allowed rows
+# instead of scoring everything and masking.
+GATHER_MAX_FRACTION = 0.25
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the k highest scores, ordered best first (ties by index)."""
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < scores.size:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.size)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def _spherical_kmeans(
+    vectors: np.ndarray, nlist: int, iterations: int, rng: np.random.Generator
+) -> np.ndarray:
+    centroids = vectors[rng.choice(len(vectors), size=nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        counts = np.bincount(assignment, minlength=nlist)
+        nonempty = counts > 0
+        sums = np.zeros_like(centroids)
+        sums[nonempty] = np.add.reduceat(
+            vectors[np.argsort(assignment, kind="stable")],
+            (np.cumsum(counts) - counts)[nonempty],
+            axis=0,
+        )
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        empty = norms[:, 0] == 0
+        # Re-seed empty clusters so every list stays usable
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()))]
+            norms[empty] = 1.0
+        centroids = sums / norms
+    return centroids.astype(np.float32)
+
+
+class VectorIndex:
+    """Top-k cosine search over a fixed matrix of unit vectors.
+
+    Args:
+        vectors: (n, dim) float32 matrix of unit vectors
+        nlist: Number of IVF lists; 0 picks brute force below ``IVF_MIN_VECTORS``
+            and ``sqrt(n)`` lists above it
+        nprobe: Number of IVF lists scanned per query
+        seed: Seed for k-means initialization
+    """
+
+    def __init__(
+        self, vectors: np.ndarray, nlist: int = 0, nprobe: int = 16, seed: int = 0
+    ):
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if nlist == 0 and len(self.vectors) >= IVF_MIN_VECTORS:
+            nlist = int(math.sqrt(len(self.vectors)))
+        self.nlist = min(nlist, len(self.vectors))
+        self.nprobe = nprobe
+        self.centroids: Optional[np.ndarray] = None
+        if self.nlist > 1:
+            self._build_ivf(seed)
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def is_ivf(self) -> bool:
+        return self.centroids is not None
+
+    def _build_ivf(self, seed: int, sample_size: int = 64, batch: int = 65_536):
+        rng = np.random.default_rng(seed)
+        training = self.vectors
+        if len(training) > self.nlist * sample_size:
+            training = training[
+                rng.choice(len(training), size=self.nlist * sample_size, replace=False)
+            ]
+        self.centroids = _spherical_kmeans(training, self.nlist, 10, rng)
+
+        assignment = np.empty(len(self.vectors), dtype=np.int64)
+        for offset in range(0, len(self.vectors), batch):
+            block = self.vectors[offset : offset + batch]
+            assignment[offset : offset + batch] = np.argmax(
+                block @ self.centroids.T, axis=1
+            )
+        # Store vectors grouped by list so every list is one contiguous slice
+        self.order = np.argsort(assignment, kind="stable")
+        self.sorted_vectors = self.vectors[self.order]
+        counts = np.bincount(assignment, minlength=self.nlist)
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        min_score: Optional[float] = None,
+        allowed: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the k vectors most similar to ``query``.
+
+        Args:
+            query: (dim,) unit vector
+            k: Number of results
+            min_score: Drop results whose similarity is below this value
+            allowed: Optional boolean mask; only vectors where it is True are returned
+
+        Returns:
+            (ids, scores) ordered by descending score
+        """
+        query = np.asarray(query, dtype=np.float32)
+        if self.centroids is None:
+            if allowed is not None and np.count_nonzero(
+                allowed
+            ) < GATHER_MAX_FRACTION * len(allowed):
+                ids = np.flatnonzero(allowed)
+                scores = self.vectors[ids] @ query
+            else:
+                ids = np.arange(len(self.vectors))
+                scores = self.vectors @ query
+                if allowed is not None:
+                    ids, scores = ids[allowed], scores[allowed]
+        else:
+            probe = top_k(self.centroids @ query, self.nprobe)
+            positions = np.concatenate(
+                [np.arange(self.offsets[p], self.offsets[p + 1]) for p in probe]
+            )
+            ids = self.order[positions]
+            if allowed is not None:
+                keep = allowed[ids]
+                ids, positions = ids[keep], positions[keep]
+            scores = self.sorted_vectors[positions] @ query
+
+        best = top_k(scores, k)
+        ids, scores = ids[best], scores[best]
+        if min_score is not None:
+            keep = scores >= min_score
+            ids, scores = ids[keep], scores[keep]
+        return ids.astype(np.int64), scores.astype(np.float32)
@@ -4,10 +4,24 @@ pytest configuration and common fixture definitions
 
 import json
 import os
+from typing import TYPE_CHECKING
 
 import pytest
-from twelvelabs import TwelveLabs
-from twelvelabs.core.api_error import ApiError
+
+from tests.plugins import (
+    call_budget,
+    capabilities,
+    cpuprofile,
+    durations,
+    index_matrix,
+    lazy_imports,
+    memprofile,
+    outcome_cache,
+)
+
+if TYPE_CHECKING:
+    from twelvelabs import TwelveLabs
+    from twelvelabs.core.api_error import ApiError
 
 
 def _load_env_file():
@@ -34,6 +48,77 @@ def _load_env_file():
 _load_env_file()
 
 
+def pytest_addoption(parser):
+    """Register suite-specific command line options."""
+    parser.addoption(
+        "--standin",
+        action="store_true",
+        default=False,
+        help="Run tests against the local stand-in (standin package) instead of the live API.",
+    )
+    parser.addoption(
+        "--record-latency",
+        metavar="PATH",
+        default=None,
+        help="Append the latency of every live search request to PATH (JSON Lines) for stand-in replay.",
+    )
+    parser.addoption(
+        "--standin-latency",
+        metavar="PATH",
+        default=None,
+        help="With --standin, delay responses by latencies learned from PATH (see --record-latency).",
+    )
+    parser.addoption(
+        "--hedge",
+        action="store_true",
+        default=False,
+        help="Send a second copy of search and page requests slower than the p95 latency (search_helpers.hedging).",
+    )
+    memprofile.add_options(parser)
+    cpuprofile.add_options(parser)
+    lazy_imports.add_options(parser)
+    durations.add_options(parser)
+    call_budget.add_options(parser)
+    outcome_cache.add_options(parser)
+    capabilities.add_options(parser)
+    index_matrix.add_options(parser)
+
+
+def pytest_configure(config):
+    """Register the optional profiling, import, selection and caching plugins."""
+    lazy_imports.register(config)
+    durations.register(config)
+    call_budget.register(config)
+    outcome_cache.register(config)
+    capabilities.register(config)
+    index_matrix.register(config)
+    memprofile.register(config)
+    cpuprofile.register(config)
+
+
+def pytest_generate_tests(metafunc):
+    """Run tests marked index_matrix once per configured index."""
+    index_matrix.parametrize(metafunc)
+
+
+def use_standin(config) -> bool:
+    """Return True when the suite runs against the local stand-in."""
+    return bool(config.getoption("--standin", default=False))
+
+
+@pytest.fixture(scope="session")
+def standin_server(request):
+    """Create the local stand-in server with one Marengo 2.7 and one Marengo 3.0 index.
+
+    With --standin-latency, responses are delayed by latencies replayed from recorded live runs.
+    """
+    from standin import LatencyModel, StandinServer
+
+    latency_path = request.config.getoption("--standin-latency", default=None)
+    latency_model = LatencyModel.load(latency_path) if latency_path else None
+    return StandinServer.with_default_indexes(latency_model=latency_model)
+
+
 @pytest.fixture(scope="session")
 def api_key():
     """Get API key from environment variable or config.env file."""
@@ -49,7 +134,8 @@ def api_key():
 def index_id(request):
     """Get index ID from environment variable or config.env file.
 
-    If a fixture name is passed from parametrize, return the value of that fixture.
+    If an index name is passed from parametrize (see tests/plugins/index_matrix.py),
+    return the ID configured for it or the value of the fixture of that name.
 
     Note: scope="function" is set to correctly handle different parameter values
     for each test function when used with indirect=True.
@@ -60,7 +146,13 @@ def index_id(request):
         and isinstance(request.param, str)
         and request.param.startswith("index_")
     ):
-        return request.getfixturevalue(request.param)
+        spec = index_matrix.resolve(request.config, request.param)
+        if spec is not None and spec.index_id and spec.env is None:
+            index_id = spec.index_id  # configured through TL_INDEXES or --indexes-file
+        else:
+            index_id = request.getfixturevalue(request.param)
+        _probe_capabilities(request, request.param, index_id)
+        return index_id
 
     # Default behavior: get from environment variable
     index_id = os.getenv("TL_INDEX_ID")
@@ -68,12 +160,37 @@ def index_id(request):
         raise ValueError(
             "TL_INDEX_ID environment variable is not set. Please check config.env file or set the environment variable."
         )
+    _probe_capabilities(request, "default", index_id)
     return index_id
 
 
+def _probe_capabilities(request, index_name: str, index_id: str):
+    """Make sure the capabilities of an index used with a client are known."""
+    cache = capabilities.session()
+    if cache is not None and "client" in request.fixturenames:
+        cache.get(request.getfixturevalue("client"), index_id, index_name)
+
+
+@pytest.fixture(scope="function")
+def index_capabilities(request, client, index_id):
+    """Model family and search options of the test's index (probed once per TTL).
+
+    Falls back to the index fixture name when the index cannot be retrieved.
+    """
+    cache = capabilities.session()
+    probed = cache.get(client, index_id) if cache else None
+    return probed or capabilities.assumed(
+        index_id, is_marengo30(get_index_name(request))
+    )
+
+
 @pytest.fixture(scope="session")
-def index_marengo27():
+def index_marengo27(request):
     """Get Marengo 2.7 index ID from environment variable or config.env file."""
+    if use_standin(request.config):
+        from standin import STANDIN_INDEX_MARENGO_27
+
+        return STANDIN_INDEX_MARENGO_27
     index_id = os.getenv("TL_INDEX_MARENGO_27")
     if not index_id:
         pytest.skip(
@@ -83,8 +200,12 @@ def index_marengo27():
 
 
 @pytest.fixture(scope="session")
-def index_marengo30():
+def index_marengo30(request):
     """Get Marengo 3.0 index ID from environment variable or config.env file."""
+    if use_standin(request.config):
+        from standin import STANDIN_INDEX_MARENGO_30
+
+        return STANDIN_INDEX_MARENGO_30
     index_id = os.getenv("TL_INDEX_MARENGO_30")
     if not index_id:
         pytest.skip(
@@ -94,9 +215,46 @@ def index_marengo30():
 
 
 @pytest.fixture(scope="session")
-def client(api_key):
-    """Create a TwelveLabs client instance."""
-    return TwelveLabs(api_key=api_key)
+def client(request):
+    """Create a TwelveLabs client instance.
+
+    With --standin, the client is wired to the local stand-in and no API key is needed.
+    With --hedge, its slow search and page requests are hedged.
+    """
+    if use_standin(request.config):
+        client = request.getfixturevalue("standin_server").make_client()
+    elif request.config.getoption("--record-latency", default=None):
+        client = _recording_client(
+            request.getfixturevalue("api_key"),
+            request.config.getoption("--record-latency"),
+        )
+    else:
+        from twelvelabs import TwelveLabs
+
+        client = TwelveLabs(api_key=request.getfixturevalue("api_key"))
+    if request.config.getoption("--hedge"):
+        from search_helpers import hedge
+
+        hedge(client)
+    return call_budget.track(request.config, client)
+
+
+def _recording_client(api_key: str, record_path: str) -> "TwelveLabs":
+    """Create a live client whose requests are timed and appended to record_path."""
+    import httpx
+    from twelvelabs import TwelveLabs
+
+    from standin import MARENGO_27, MARENGO_30, RecordingTransport
+
+    index_models = {
+        os.getenv("TL_INDEX_MARENGO_27", ""): MARENGO_27,
+        os.getenv("TL_INDEX_MARENGO_30", ""): MARENGO_30,
+    }
+    index_models.pop("", None)
+    transport = RecordingTransport(httpx.HTTPTransport(), record_path, index_models)
+    return TwelveLabs(
+        api_key=api_key, httpx_client=httpx.Client(transport=transport, timeout=600)
+    )
 
 
 def get_index_name(request) -> str:
@@ -116,18 +274,41 @@ def get_index_name(request) -> str:
 
 def is_marengo30(index_name: str) -> bool:
     """
-    Determine Marengo version by index name.
+    Determine Marengo version of an index.
+
+    Uses the model family probed from the index (see tests/plugins/capabilities.py)
+    and falls back to the index name when the index was not probed.
 
     Args:
-        index_name: Index name (e.g., "index_marengo27", "index_marengo30")
+        index_name: Index name (e.g., "index_marengo27", "index_marengo30") or index ID
 
     Returns:
         True if Marengo 3.0, False if Marengo 2.7
     """
+    cache = capabilities.session()
+    probed = cache.lookup(index_name) if cache else None
+    if probed is not None:
+        return probed.is_marengo30
     return index_name == "index_marengo30"
 
 
-def get_error_code(api_error: ApiError) -> str:
+def route_unsupported(request, client, index_id: str, search_options: list):
+    """
+    Pick where a search the index may not support is sent (see --unsupported).
+
+    Args:
+        request: pytest request fixture
+        client: TwelveLabs client of the test
+        index_id: Index ID of the test
+        search_options: search_options of the search
+
+    Returns:
+        (client, index_id) to search with; skips the test with --unsupported=skip
+    """
+    return capabilities.route_unsupported(request, client, index_id, search_options)
+
+
+def get_error_code(api_error: "ApiError") -> str:
     """
     Extract error code from ApiError.
 
@@ -0,0 +1,222 @@
+"""
+Covering arrays over the ``search.query`` parameters
+
+A t-wise covering array is a set of parameter rows in which every combination of
+values of any t parameters appears in at least one row. Pairwise (t=2) arrays
+catch the interaction bugs between two parameters with a small fraction of the
+full cartesian product; t=3 catches three-way interactions.
+
+Rows are built greedily: every constraint-satisfying row of the product is a
+candidate, and the row covering the most not-yet-covered t-tuples is taken
+until every coverable t-tuple is covered (ties go to the earliest row, so the
+array is the same on every run). Constraints are predicates over whole rows;
+a t-tuple that no valid row contains is not required.
+
+The default space covers both Marengo indexes and the documented constraints:
+
+- ``sort_option="clip_count"`` requires ``group_by="video"``
+- the ``transcription`` search option is Marengo 3.0 only
+
+``search_space(indexes)`` builds the same space over other indexes (the index
+matrix of a run), allowing ``transcription`` on the Marengo 3.0 ones.
+
+    python -m tests.covering_array --strength 3
+"""
+
+import argparse
+import itertools
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from tests.plugins.capabilities import MARENGO_27, MARENGO_30
+
+Row = Dict[str, object]
+Constraint = Callable[[Row], bool]
+
+# index name -> model of the default space
+SEARCH_INDEXES: Dict[str, Optional[str]] = {
+    "index_marengo27": MARENGO_27,
+    "index_marengo30": MARENGO_30,
+}
+
+SEARCH_PARAMETERS: Dict[str, Sequence] = {
+    "index_id": tuple(SEARCH_INDEXES),
+    "query_text": ("water", "a person walking on the beach"),
+    "search_options": (
+        ("visual",),
+        ("audio",),
+        ("transcription",),
+        ("visual", "audio"),
+        ("visual", "audio", "transcription"),
+    ),
+    "group_by": ("clip", "video"),
+    "sort_option": ("score", "clip_count"),
+    "operator": ("or", "and"),
+    "page_limit": (1, 5, 50),
+    "filter": (None, '{"category": "nature"}'),
+}
+
+
+def clip_count_needs_video_groups(row: Row) -> bool:
+    return not (
+        row.get("sort_option") == "clip_count" and row.get("group_by") == "clip"
+    )
+
+
+def transcription_on(marengo30: Collection[str]) -> Constraint:
+    """Constraint: ``transcription`` is only searched on the ``marengo30`` indexes."""
+
+    def transcription_needs_marengo30(row: Row) -> bool:
+        return not (
+            "transcription" in row.get("search_options", ())
+            and "index_id" in row
+            and row["index_id"] not in marengo30
+        )
+
+    return transcription_needs_marengo30
+
+
+SEARCH_CONSTRAINTS: Sequence[Constraint] = (
+    clip_count_needs_video_groups,
+    transcription_on({"index_marengo30"}),
+)
+
+
+def valid(row: Row, constraints: Sequence[Constraint]) -> bool:
+    return all(constraint(row) for constraint in constraints)
+
+
+def product(
+    parameters: Dict[str, Sequence], constraints: Sequence[Constraint] = ()
+) -> Iterator[Row]:
+    """Every row of the cartesian product that satisfies ``constraints``."""
+    names = list(parameters)
+    for values in itertools.product(*(parameters[name] for name in names)):
+        row = dict(zip(names, values))
+        if valid(row, constraints):
+            yield row
+
+
+def _tuples(row: Row, names: Sequence[str], strength: int) -> FrozenSet[Tuple]:
+    """The t-tuples a row covers, as ((name, value), ...) in parameter order."""
+    return frozenset(
+        tuple((name, _hashable(row[name])) for name in combination)
+        for combination in itertools.combinations(names, strength)
+    )
+
+
+def _hashable(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def covering_array(
+    parameters: Dict[str, Sequence],
+    strength: int = 2,
+    constraints: Sequence[Constraint] = (),
+) -> List[Row]:
+    """Greedy t-wise covering array over ``parameters``.
+
+    Args:
+        parameters: Parameter name -> values, in the order rows list them
+        strength: t, the number of parameters whose value combinations are covered
+        constraints: Predicates every row must satisfy
+
+    Returns:
+        Rows (parameter name -> value) covering every valid t-tuple at least once
+    """
+    names = list(parameters)
+    strength = min(strength, len(names))
+    candidates = list(product(parameters, constraints))
+    covers = [_tuples(row, names, strength) for row in candidates]
+    uncovered = set().union(*covers) if covers else set()
+
+    rows: List[Row] = []
+    while uncovered:
+        best = max(range(len(candidates)), key=lambda i: len(covers[i] & uncovered))
+        rows.append(candidates[best])
+        uncovered -= covers[best]
+    return rows
+
+
+def uncovered(
+    rows: Sequence[Row],
+    parameters: Dict[str, Sequence],
+    strength: int = 2,
+    constraints: Sequence[Constraint] = (),
+) -> FrozenSet[Tuple]:
+    """Valid t-tuples that none of ``rows`` covers (empty for a covering array)."""
+    names = list(parameters)
+    strength = min(strength, len(names))
+    required = set()
+    for row in product(parameters, constraints):
+        required |= _tuples(row, names, strength)
+    for row in rows:
+        required -= _tuples(row, names, strength)
+    return frozenset(required)
+
+
+def search_space(
+    indexes: Optional[Dict[str, Optional[str]]] = None,
+) -> Tuple[Dict[str, Sequence], Sequence[Constraint]]:
+    """Search parameters and constraints over ``indexes`` (index name -> model).
+
+    ``transcription`` is only combined with Marengo 3.0 indexes; an index of
+    unknown model is searched without it.
+    """
+    if indexes is None:
+        return SEARCH_PARAMETERS, SEARCH_CONSTRAINTS
+    marengo30 = {name for name, model in indexes.items() if model == MARENGO_30}
+    parameters = dict(SEARCH_PARAMETERS, index_id=tuple(indexes))
+    return parameters, (clip_count_needs_video_groups, transcription_on(marengo30))
+
+
+def search_rows(
+    strength: int = 2, indexes: Optional[Dict[str, Optional[str]]] = None
+) -> List[Row]:
+    """Covering array over the search space of ``indexes`` (default: both Marengo)."""
+    parameters, constraints = search_space(indexes)
+    return covering_array(parameters, strength, constraints)
+
+
+def row_id(row: Row) -> str:
+    """Short pytest ID for a search row."""
+    parts = []
+    for name, value in row.items():
+        if name == "index_id":
+            continue
+        if name == "query_text":
+            value = "long" if len(value) > 10 else "short"
+        elif name == "filter":
+            value = "filter" if value else "nofilter"
+        elif isinstance(value, (list, tuple)):
+            value = "+".join(value)
+        parts.append(str(value))
+    return "-".join(parts)
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strength", type=int, default=2, help="t (default: 2)")
+    args = parser.parse_args(argv)
+
+    rows = search_rows(args.strength)
+    total = sum(1 for _ in product(SEARCH_PARAMETERS, SEARCH_CONSTRAINTS))
+    for row in rows:
+        print(f"{row['index_id']:16s} {row_id(row)}")
+    print(
+        f"{len(rows)} rows cover every {args.strength}-way combination "
+        f"({total} valid rows in the full product)"
+    )
+
+
+if __name__ == "__main__":
+    main()
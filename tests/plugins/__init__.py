@@ -0,0 +1 @@
+# pytest plugins of the suite, registered from conftest.py
@@ -0,0 +1,328 @@
+"""
+API-quota budgeted test selection (``--call-budget=N``)
+
+Every HTTP request sent through the suite's ``client`` fixture counts as one API
+call. ``--record-calls`` stores the calls each test made (setup, call and
+teardown) in ``--test-calls`` (default ``.test-calls.json``); a ``--standin``
+run records the same request pattern without spending quota.
+
+With ``--call-budget=N`` the suite picks the subset of tests that covers the
+most search parameter features within N estimated calls. A test's features are
+read from its source and parametrization: each ``search.query`` parameter
+(query_text, search_options, group_by, sort_option, operator, page_limit,
+filter, media) with its value class, alone and per index. Selection is the
+greedy budgeted maximum coverage heuristic: repeatedly take the test with the
+most new features per call, compared against the best single test. Budget left
+once nothing new can be covered goes to the cheapest remaining tests.
+
+Tests that never use the ``client`` fixture cost nothing and always run. A test
+without a recorded count is estimated from the ``query``/``next_page`` calls in
+its source.
+
+Each test's count travels on its teardown report (``api_calls`` user property),
+so under pytest-xdist ``-n`` the controller collects the counts of all workers
+and is the only process that writes ``--test-calls``.
+"""
+
+import ast
+import inspect
+import json
+import os
+import textwrap
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+import pytest
+
+from tests.plugins.index_matrix import base_nodeid
+
+# search.query keyword -> parameter it covers
+PARAMETERS = {
+    "query_text": "query_text",
+    "search_options": "search_options",
+    "group_by": "group_by",
+    "sort_option": "sort_option",
+    "operator": "operator",
+    "page_limit": "page_limit",
+    "filter": "filter",
+    "query_media_type": "media",
+    "query_media_file": "media",
+    "query_media_url": "media",
+}
+
+CALLS = ("query", "next_page", "get_next")
+
+Feature = Tuple[str, ...]
+
+
+def add_options(parser):
+    group = parser.getgroup("call-budget", "API-quota budgeted selection")
+    group.addoption(
+        "--call-budget",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Run the tests that cover the most search parameters within N API calls.",
+    )
+    group.addoption(
+        "--test-calls",
+        metavar="PATH",
+        default=".test-calls.json",
+        help="API calls per test from past runs (default: .test-calls.json).",
+    )
+    group.addoption(
+        "--record-calls",
+        action="store_true",
+        default=False,
+        help="Count each test's API calls and update --test-calls.",
+    )
+
+
+def register(config):
+    """Register the plugin when --call-budget or --record-calls is given."""
+    budget = config.getoption("--call-budget")
+    if budget is not None and budget < 0:
+        raise pytest.UsageError("--call-budget must be >= 0")
+    if budget is None and not config.getoption("--record-calls"):
+        return
+    config.pluginmanager.register(CallBudget(config), "call-budget")
+
+
+def track(config, client):
+    """Count the requests ``client`` sends (a no-op unless the plugin is active)."""
+    plugin = config.pluginmanager.get_plugin("call-budget")
+    if plugin is None:
+        return client
+    # imported here so that loading the plugin does not import the SDK (--lazy-imports)
+    from search_helpers.raw import http_client
+
+    httpx_client = http_client(client).httpx_client
+    send = httpx_client.send
+
+    def counted_send(*args, **kwargs):
+        plugin.calls += 1
+        return send(*args, **kwargs)
+
+    httpx_client.send = counted_send
+    return client
+
+
+def load(path: str) -> Dict[str, int]:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError:
+            return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _value_class(parameter: str, value) -> str:
+    if parameter == "query_text":
+        if not isinstance(value, str):
+            return "*"
+        if not value.strip():
+            return "empty"
+        if len(value) > 100:
+            return "long"
+        return "non-ascii" if not value.isascii() else "text"
+    if parameter == "filter":
+        return "*"
+    if isinstance(value, (list, tuple)):
+        return "+".join(sorted(str(v) for v in value))
+    return str(value)
+
+
+def _literal(node: ast.AST, params: dict):
+    """Value of a keyword argument: literal, parametrized name, or '*' if unknown."""
+    if isinstance(node, ast.Name) and node.id in params:
+        return params[node.id]
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, SyntaxError):
+        return "*"
+
+
+def _function_ast(function) -> ast.AST:
+    try:
+        return ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return ast.parse("")
+
+
+def analyze(function, params: dict) -> Tuple[Set[Tuple[str, str]], int]:
+    """(parameter, value class) pairs a test function passes, and its API call sites."""
+    pairs = set()
+    call_sites = 0
+    for node in ast.walk(_function_ast(function)):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if node.func.attr in CALLS:
+                call_sites += 1
+            for keyword in node.keywords:
+                parameter = PARAMETERS.get(keyword.arg)
+                if parameter:
+                    value = _literal(keyword.value, params)
+                    pairs.add((parameter, _value_class(parameter, value)))
+        elif isinstance(node, ast.Dict):
+            for key, value in zip(node.keys, node.values):
+                parameter = isinstance(key, ast.Constant) and PARAMETERS.get(key.value)
+                if parameter:
+                    value = _literal(value, params)
+                    pairs.add((parameter, _value_class(parameter, value)))
+    return pairs, call_sites
+
+
+def features(item) -> FrozenSet[Feature]:
+    """Parameter features of a collected test, alone and qualified by its index."""
+    params = dict(getattr(getattr(item, "callspec", None), "params", {}))
+    pairs, _ = analyze(getattr(item, "obj", None), params)
+    for name, value in params.items():
+        # a dict parameter holds a whole set of search.query keywords
+        for key, item_value in (
+            value.items() if isinstance(value, dict) else [(name, value)]
+        ):
+            parameter = PARAMETERS.get(key)
+            if parameter and item_value is not None:
+                pairs.add((parameter, _value_class(parameter, item_value)))
+    index = params.get("index_id", "default")
+    return frozenset(list(pairs) + [(index,) + pair for pair in pairs])
+
+
+def estimated_calls(item, recorded: Dict[str, int]) -> int:
+    nodeid = base_nodeid(item.nodeid)
+    if nodeid in recorded:
+        return int(recorded[nodeid])
+    if "client" not in getattr(item, "fixturenames", ()):
+        return 0
+    _, call_sites = analyze(getattr(item, "obj", None), {})
+    return max(call_sites, 1)
+
+
+def select(
+    costs: Dict[str, int], coverage: Dict[str, FrozenSet[Feature]], budget: int
+) -> List[str]:
+    """Greedy budgeted maximum coverage over the tests with a cost.
+
+    Free tests are always selected. Ties prefer the cheaper test, then the
+    first node ID.
+    """
+    free = [n for n, cost in costs.items() if cost == 0]
+    paid = sorted(n for n, cost in costs.items() if cost > 0)
+
+    def greedy() -> Tuple[List[str], Set[Feature]]:
+        chosen: List[str] = []
+        covered: Set[Feature] = set()
+        remaining = budget
+        candidates = [n for n in paid if costs[n] <= remaining]
+        while candidates:
+            best = max(
+                candidates,
+                key=lambda n: (len(coverage[n] - covered) / costs[n], -costs[n]),
+            )
+            if not coverage[best] - covered:
+                break
+            chosen.append(best)
+            covered |= coverage[best]
+            remaining -= costs[best]
+            candidates = [n for n in candidates if n != best and costs[n] <= remaining]
+        return chosen, covered
+
+    chosen, covered = greedy()
+    feasible = [n for n in paid if costs[n] <= budget]
+    if feasible:
+        single = max(feasible, key=lambda n: (len(coverage[n]), -costs[n]))
+        if len(coverage[single]) > len(covered):
+            chosen = [single]
+
+    remaining = budget - sum(costs[n] for n in chosen)
+    for nodeid in sorted(paid, key=lambda n: (costs[n], n)):
+        if nodeid not in chosen and costs[nodeid] <= remaining:
+            chosen.append(nodeid)
+            remaining -= costs[nodeid]
+    return free + chosen
+
+
+class CallBudget:
+    """Counts API calls per test and applies --call-budget."""
+
+    def __init__(self, config):
+        self.budget = config.getoption("--call-budget")
+        self.path = config.getoption("--test-calls")
+        self.record = config.getoption("--record-calls")
+        self.recorded = load(self.path)
+        self.worker = hasattr(config, "workerinput")
+        self.calls = 0
+        self.started = 0
+        self.made = 0
+        self.measured: Dict[str, int] = {}
+        self.summary: Dict[str, object] = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if self.budget is None:
+            return
+        costs = {item.nodeid: estimated_calls(item, self.recorded) for item in items}
+        coverage = {item.nodeid: features(item) for item in items}
+        keep = set(select(costs, coverage, self.budget))
+        deselected = [item for item in items if item.nodeid not in keep]
+        items[:] = [item for item in items if item.nodeid in keep]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+
+        paid = [n for n, cost in costs.items() if cost > 0]
+        possible = set().union(*(coverage[n] for n in paid)) if paid else set()
+        covered = (
+            set().union(*(coverage[n] for n in keep if n in paid)) if paid else set()
+        )
+        self.summary = {
+            "selected": len(items),
+            "total": len(costs),
+            "estimated_calls": sum(costs[n] for n in keep),
+            "features": len(covered),
+            "possible_features": len(possible),
+            "missing": sorted(":".join(f) for f in possible - covered if len(f) == 2),
+        }
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item):
+        self.started = self.calls
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when == "teardown":
+            calls = self.calls - self.started
+            outcome.get_result().user_properties.append(("api_calls", calls))
+
+    def pytest_runtest_logreport(self, report):
+        properties = dict(report.user_properties)
+        if self.worker or "api_calls" not in properties:
+            return
+        self.made += properties["api_calls"]
+        if "outcome_reused" not in properties:
+            self.measured[base_nodeid(report.nodeid)] = properties["api_calls"]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary:
+            s = self.summary
+            terminalreporter.write_line(
+                f"call budget: {s['selected']} of {s['total']} tests, "
+                f"{s['estimated_calls']} of {self.budget} estimated calls "
+                f"({self.made} made), {s['features']} of {s['possible_features']} "
+                "parameter features covered"
+            )
+            if s["missing"]:
+                terminalreporter.write_line(
+                    "call budget: uncovered " + ", ".join(s["missing"])
+                )
+        if self.record and self.measured and not self.worker:
+            recorded = dict(self.recorded)
+            recorded.update(self.measured)
+            partial = f"{self.path}.{os.getpid()}.tmp"
+            with open(partial, "w", encoding="utf-8") as f:
+                json.dump(dict(sorted(recorded.items())), f, indent=1)
+                f.write("\n")
+            os.replace(partial, self.path)
+            terminalreporter.write_line(
+                f"call budget: calls of {len(self.measured)} tests recorded in {self.path}"
+            )
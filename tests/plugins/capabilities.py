@@ -0,0 +1,261 @@
+"""
+Index capability cache (``--index-capabilities``, ``--unsupported``)
+
+Which search options an index supports depends on its model: ``transcription``
+is Marengo 3.0 only. Instead of guessing the model from the fixture name
+(``index_marengo30``) or spending a search to discover a
+``search_option_not_supported`` error, the suite asks each index once with
+``client.indexes.retrieve`` and records its model family and search options
+in ``--index-capabilities`` (default ``.index-capabilities.json``). Entries
+younger than ``--capabilities-ttl`` seconds (default one day; 0 always probes)
+are reused across sessions, so a warm run makes no probe calls at all.
+
+Tests read the probed capabilities through ``is_marengo30`` and the
+``index_capabilities`` fixture in conftest.py. Tests that expect an unsupported
+option to be rejected go through ``route_unsupported``, which ``--unsupported``
+controls:
+
+- ``api`` (default): send the search to the index and check the API's error
+- ``skip``: skip the test without a request
+- ``local``: send it to the local stand-in index of the same model family,
+  which applies the same validation, so no quota is spent
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import pytest
+
+MARENGO_27 = "marengo2.7"
+MARENGO_30 = "marengo3.0"
+
+SEARCH_OPTIONS = ("visual", "audio", "transcription")
+
+# Seconds a probed entry stays valid
+DEFAULT_TTL = 24 * 3600
+
+ROUTES = ("api", "skip", "local")
+
+_session: Optional["CapabilityCache"] = None
+
+
+def add_options(parser):
+    group = parser.getgroup("capabilities", "index capability cache")
+    group.addoption(
+        "--index-capabilities",
+        metavar="PATH",
+        default=".index-capabilities.json",
+        help="Probed index capabilities (default: .index-capabilities.json).",
+    )
+    group.addoption(
+        "--capabilities-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        metavar="SECONDS",
+        help=f"Reuse probed capabilities this long (default: {DEFAULT_TTL}; 0 always probes).",
+    )
+    group.addoption(
+        "--unsupported",
+        choices=ROUTES,
+        default="api",
+        help="Tests expecting an unsupported-option error: call the API (default), skip, or use the local stand-in.",
+    )
+
+
+def register(config):
+    """Create the session's capability cache and report it in the summary."""
+    global _session
+    ttl = config.getoption("--capabilities-ttl")
+    if ttl < 0:
+        raise pytest.UsageError("--capabilities-ttl must be >= 0")
+    _session = CapabilityCache(config.getoption("--index-capabilities"), ttl)
+    config.pluginmanager.register(_session, "capabilities")
+    config.add_cleanup(_clear)
+
+
+def _clear():
+    global _session
+    _session = None
+
+
+def session() -> Optional["CapabilityCache"]:
+    return _session
+
+
+class IndexCapabilities:
+    """Model family and search options of one index."""
+
+    __slots__ = ("index_id", "model_name", "search_options", "probed_at")
+
+    def __init__(
+        self,
+        index_id: str,
+        model_name: str,
+        search_options: Iterable[str],
+        probed_at: float,
+    ):
+        self.index_id = index_id
+        self.model_name = model_name
+        self.search_options = tuple(search_options)
+        self.probed_at = probed_at
+
+    @property
+    def is_marengo30(self) -> bool:
+        return self.model_name == MARENGO_30
+
+    def supports(self, search_options: Iterable[str]) -> bool:
+        return all(option in self.search_options for option in search_options)
+
+    def to_dict(self) -> dict:
+        return {
+            "model_name": self.model_name,
+            "search_options": list(self.search_options),
+            "probed_at": self.probed_at,
+        }
+
+    @classmethod
+    def from_dict(cls, index_id: str, data: dict) -> "IndexCapabilities":
+        return cls(
+            index_id, data["model_name"], data["search_options"], data["probed_at"]
+        )
+
+    @classmethod
+    def from_index(cls, index_id: str, info, probed_at: float) -> "IndexCapabilities":
+        """Capabilities of an ``IndexSchema`` from ``client.indexes.retrieve``.
+
+        ``transcription`` searches the speech in the audio, so a Marengo 3.0
+        index supports it when its model has the ``audio`` option.
+        """
+        models = [
+            m for m in info.models or () if (m.model_name or "").startswith("marengo")
+        ]
+        model = models[0] if models else None
+        model_name = (model.model_name if model else None) or "unknown"
+        model_options = list(model.model_options or ()) if model else []
+        options = [o for o in SEARCH_OPTIONS if o in model_options]
+        if (
+            model_name == MARENGO_30
+            and "audio" in options
+            and "transcription" not in options
+        ):
+            options.append("transcription")
+        return cls(index_id, model_name, options, probed_at)
+
+
+def assumed(index_id: str, marengo30: bool) -> IndexCapabilities:
+    """Capabilities implied by the model family alone (when probing fails)."""
+    if marengo30:
+        return IndexCapabilities(index_id, MARENGO_30, SEARCH_OPTIONS, 0.0)
+    return IndexCapabilities(index_id, MARENGO_27, ("visual", "audio"), 0.0)
+
+
+def load(path: str) -> Dict[str, dict]:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError:
+            return {}
+    return data if isinstance(data, dict) else {}
+
+
+class CapabilityCache:
+    """Capabilities per index ID, probed at most once per TTL."""
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.entries: Dict[str, IndexCapabilities] = {}
+        for index_id, data in load(path).items():
+            try:
+                self.entries[index_id] = IndexCapabilities.from_dict(index_id, data)
+            except (KeyError, TypeError):
+                continue
+        self.names: Dict[str, str] = {}
+        self.probed: Set[str] = set()
+        self.reused: Set[str] = set()
+        self.failed: Set[str] = set()
+
+    def fresh(self, index_id: str, now: Optional[float] = None) -> bool:
+        """True when probed this session or within the TTL."""
+        entry = self.entries.get(index_id)
+        if entry is None:
+            return False
+        now = time.time() if now is None else now
+        return index_id in self.probed or now - entry.probed_at < self.ttl
+
+    def get(self, client, index_id: str, name: Optional[str] = None):
+        """Capabilities of ``index_id``, probing it when the cached entry is stale.
+
+        Returns None when the index cannot be retrieved (not retried this session).
+        """
+        if name:
+            self.names[name] = index_id
+        if index_id in self.failed:
+            return None
+        if self.fresh(index_id):
+            if index_id not in self.probed:
+                self.reused.add(index_id)
+            return self.entries[index_id]
+        from twelvelabs.core.api_error import ApiError
+
+        try:
+            info = client.indexes.retrieve(index_id)
+        except ApiError:
+            self.failed.add(index_id)
+            return None
+        entry = IndexCapabilities.from_index(index_id, info, time.time())
+        self.entries[index_id] = entry
+        self.probed.add(index_id)
+        self.save()
+        return entry
+
+    def lookup(self, index: str) -> Optional[IndexCapabilities]:
+        """Cached capabilities by index ID or by index fixture name."""
+        return self.entries.get(self.names.get(index, index))
+
+    def save(self):
+        """Merge into the file on disk (other workers may have probed other indexes)."""
+        merged = load(self.path)
+        merged.update({i: e.to_dict() for i, e in self.entries.items()})
+        partial = f"{self.path}.{os.getpid()}.tmp"
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(merged.items())), f, indent=1)
+            f.write("\n")
+        os.replace(partial, self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.probed or self.reused:
+            terminalreporter.write_line(
+                f"capabilities: {len(self.probed)} indexes probed, {len(self.reused)} "
+                f"from {self.path} (ttl {self.ttl:.0f} s)"
+            )
+
+
+def route_unsupported(
+    request, client, index_id: str, search_options: Iterable[str]
+) -> Tuple[object, str]:
+    """(client, index_id) to send a search the index does not support to.
+
+    Supported searches, and all searches with ``--unsupported=api`` or without
+    probed capabilities, go to ``client``/``index_id`` unchanged.
+    """
+    search_options = list(search_options)
+    cache = session()
+    capabilities = cache.get(client, index_id) if cache else None
+    route = request.config.getoption("--unsupported")
+    if capabilities is None or capabilities.supports(search_options) or route == "api":
+        return client, index_id
+    if route == "skip":
+        pytest.skip(
+            f"{'+'.join(search_options)} is not supported by {capabilities.model_name} "
+            f"index {index_id} (--unsupported=skip)"
+        )
+    server = request.getfixturevalue("standin_server")
+    for local in server.indexes.values():
+        if local.model_name == capabilities.model_name:
+            return server.make_client(), local.index_id
+    return client, index_id
@@ -0,0 +1,325 @@
+"""
+Sampling CPU profiles per test (``--cpuprofile``)
+
+While each test call runs, a background thread samples the test thread's Python
+stack every ``--cpuprofile-interval`` milliseconds. Each test gets a folded
+stack file (``<dir>/<test>.folded``, one ``frame;frame;... count`` line per
+distinct stack) that flamegraph.pl, speedscope and inferno read directly, and
+``<dir>/all.folded`` holds every test under its node ID. Samples are wall-clock
+samples, so time spent blocked on the network shows up too.
+
+Each sample is attributed to one area:
+
+- the in-process stand-in, if any frame belongs to it
+- network wait, if the innermost frame is in socket/ssl/selectors or the
+  httpcore backends
+- otherwise the innermost frame in a known area: httpx, pydantic, json,
+  twelvelabs SDK, or test validation (the test's own code under tests/,
+  including ``validate_marengo_fields`` and the sorting checks)
+
+Per-test breakdowns are written to ``<dir>/summary.json``, added to the
+pytest-html report and summarized in the terminal.
+"""
+
+import html
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import pytest
+
+from . import sites
+from .sites import short_path
+
+AREAS = (
+    ("httpx", ("httpx", "httpcore", "h11")),
+    ("pydantic", ("pydantic",)),
+    ("json", (os.path.join("json", ""), "orjson")),
+    ("twelvelabs sdk", ("twelvelabs",)),
+    ("search helpers", (os.path.join("search_helpers", ""),)),
+    ("test validation", (os.path.join("tests", ""),)),
+)
+
+NETWORK = (
+    "socket.py",
+    "ssl.py",
+    "selectors.py",
+    os.path.join("httpcore", "_backends", ""),
+)
+
+STANDIN = os.path.join("standin", "")
+
+# Folded-stack frame for samples taken in pytest itself, outside the test function
+PYTEST_FRAME = "[pytest]"
+
+Code = Tuple[str, str, int]  # (filename, function, first line)
+
+
+def add_options(parser):
+    group = parser.getgroup("cpuprofile", "CPU profiling")
+    group.addoption(
+        "--cpuprofile",
+        action="store_true",
+        default=False,
+        help="Sample each test's stack and write flame-graph-ready folded stacks.",
+    )
+    group.addoption(
+        "--cpuprofile-dir",
+        metavar="DIR",
+        default="cpuprofile",
+        help="Directory for the folded stacks and summary.json (default: cpuprofile).",
+    )
+    group.addoption(
+        "--cpuprofile-interval",
+        type=float,
+        default=1.0,
+        metavar="MS",
+        help="Sampling interval in milliseconds (default: 1).",
+    )
+
+
+def register(config):
+    """Register the profiler (and its pytest-html hooks) when --cpuprofile is given."""
+    if not config.getoption("--cpuprofile"):
+        return
+    config.pluginmanager.register(CpuProfiler(config), "cpuprofile")
+    if config.pluginmanager.hasplugin("html"):
+        config.pluginmanager.register(HtmlColumns(), "cpuprofile-html")
+
+
+def area_of_stack(stack: Tuple[Code, ...]) -> str:
+    """Attribute one sampled stack (outermost frame first) to an area."""
+    if any(STANDIN in code[0] for code in stack):
+        return "stand-in"
+    if stack and any(needle in stack[-1][0] for needle in NETWORK):
+        return "network wait"
+    for code in reversed(stack):
+        area = sites.area_of(code[0], AREAS)
+        if area != "other":
+            return area
+    return "other"
+
+
+def frame_label(code: Code) -> str:
+    filename, function, line = code
+    return f"{function} ({short_path(filename)}:{line})"
+
+
+class StackSampler:
+    """Samples the Python stack of one thread from a background thread.
+
+    Args:
+        interval: Seconds between samples
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._codes: Dict[object, Code] = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._target = None
+
+    def start(self, thread_id: int):
+        self._target = thread_id
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="cpuprofile-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _code(self, code) -> Code:
+        entry = self._codes.get(code)
+        if entry is None:
+            entry = (code.co_filename, code.co_name, code.co_firstlineno)
+            self._codes[code] = entry
+        return entry
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None or self._target == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._code(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+
+
+def _trim(stack: Tuple[Code, ...], test_file: str) -> Tuple[Code, ...]:
+    """Drop the pytest frames above the test function (empty when outside it)."""
+    for position, code in enumerate(stack):
+        if code[0] == test_file:
+            return stack[position:]
+    return ()
+
+
+def _file_name(nodeid: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[:180]
+
+
+class CpuProfiler:
+    """Samples every test call and writes folded stacks per test."""
+
+    def __init__(self, config):
+        self.directory = config.getoption("--cpuprofile-dir")
+        self.interval = config.getoption("--cpuprofile-interval") / 1000.0
+        self.records: Dict[str, dict] = {}
+        self._all: List[str] = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        sampler = StackSampler(self.interval)
+        # The sampler only runs when it gets the GIL; shorten the switch interval
+        # so that samples are not limited to one per 5 ms default switch
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval / 2))
+        started = time.perf_counter()
+        sampler.start(threading.get_ident())
+        try:
+            yield
+        finally:
+            stacks = sampler.stop()
+            sys.setswitchinterval(switch_interval)
+            wall = time.perf_counter() - started
+            self.records[item.nodeid] = self._record(item, stacks, wall)
+            item.cpuprofile = self.records[item.nodeid]
+
+    def _record(self, item, stacks: Counter, wall: float) -> dict:
+        test_file = str(item.fspath)
+        total = sum(stacks.values())
+        areas: Counter = Counter()
+        functions: Counter = Counter()
+        folded: Counter = Counter()
+        for stack, count in stacks.items():
+            areas[area_of_stack(stack)] += count
+            trimmed = _trim(stack, test_file)
+            if not trimmed:
+                folded[PYTEST_FRAME] += count
+                continue
+            functions[frame_label(trimmed[-1])] += count
+            folded[";".join(frame_label(code) for code in trimmed)] += count
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, _file_name(item.nodeid) + ".folded")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(folded.items()):
+                f.write(f"{stack} {count}\n")
+                self._all.append(f"{item.nodeid};{stack} {count}")
+
+        seconds_per_sample = wall / total if total else 0.0
+        return {
+            "wall_s": round(wall, 4),
+            "samples": total,
+            "folded": path,
+            "areas_s": {
+                area: round(count * seconds_per_sample, 4)
+                for area, count in areas.most_common()
+            },
+            "areas_pct": {
+                area: round(100.0 * count / total, 1)
+                for area, count in areas.most_common()
+            },
+            "top_functions": [
+                {"function": name, "pct": round(100.0 * count / total, 1)}
+                for name, count in functions.most_common(10)
+            ],
+        }
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        record = getattr(item, "cpuprofile", None)
+        if call.when != "call" or record is None:
+            return
+        report.cpuprofile = record
+        extra = _html_extra(record)
+        if extra is not None:
+            report.extras = getattr(report, "extras", []) + [extra]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with open(
+            os.path.join(self.directory, "all.folded"), "w", encoding="utf-8"
+        ) as f:
+            f.write("\n".join(self._all) + ("\n" if self._all else ""))
+        with open(
+            os.path.join(self.directory, "summary.json"), "w", encoding="utf-8"
+        ) as f:
+            json.dump(self.records, f, indent=2)
+
+        totals: Counter = Counter()
+        for record in self.records.values():
+            totals.update(record["areas_s"])
+        wall = sum(record["wall_s"] for record in self.records.values())
+        terminalreporter.write_sep("-", "cpu profile (sampled wall time by area)")
+        for area, seconds in totals.most_common():
+            share = 100.0 * seconds / wall if wall else 0.0
+            terminalreporter.write_line(f"{seconds:>9.3f} s  {share:5.1f}%  {area}")
+        terminalreporter.write_line(f"Folded stacks written to {self.directory}/")
+
+
+def render_html(record: dict) -> str:
+    """Render a test's CPU record as an HTML fragment."""
+    areas = "".join(
+        f"<tr><td>{html.escape(area)}</td><td>{seconds}</td>"
+        f"<td>{record['areas_pct'][area]}</td></tr>"
+        for area, seconds in record["areas_s"].items()
+    )
+    functions = "".join(
+        f"<tr><td>{entry['pct']}</td><td>{html.escape(entry['function'])}</td></tr>"
+        for entry in record["top_functions"]
+    )
+    return (
+        "<div class='cpuprofile'>"
+        f"<p><b>CPU profile</b>: {record['samples']} samples over {record['wall_s']} s "
+        f"({html.escape(record['folded'])})</p>"
+        "<table><tr><th>Area</th><th>Seconds</th><th>%</th></tr>"
+        f"{areas}</table>"
+        "<table><tr><th>Self %</th><th>Function</th></tr>"
+        f"{functions}</table></div>"
+    )
+
+
+def _html_extra(record: dict):
+    try:
+        from pytest_html import extras
+    except ImportError:
+        return None
+    return extras.html(render_html(record))
+
+
+class HtmlColumns:
+    """pytest-html hooks adding the SDK share of sampled time to the results table."""
+
+    def pytest_html_results_table_header(self, cells):
+        cells.insert(2, "<th class='sortable' data-column-type='sdk'>SDK %</th>")
+
+    def pytest_html_results_table_row(self, report, cells):
+        record = getattr(report, "cpuprofile", None)
+        share = ""
+        if record:
+            share = round(
+                sum(
+                    record["areas_pct"].get(area, 0.0)
+                    for area in ("twelvelabs sdk", "httpx", "pydantic", "json")
+                ),
+                1,
+            )
+        cells.insert(2, f"<td>{share}</td>")
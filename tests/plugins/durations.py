@@ -0,0 +1,229 @@
+"""
+Duration-aware ordering and sharding (``--order-by-duration``, ``--shard-count``)
+
+Per-test durations (setup + call + teardown) from past runs are kept in a JSON
+file (``--test-durations``, default ``.test-durations.json``) as an
+exponentially weighted average per node ID. ``--record-durations`` updates it
+at the end of a run.
+
+With those durations the suite can:
+
+- run the longest tests first (``--order-by-duration``)
+- split into ``--shard-count`` balanced shards by greedy LPT bin-packing
+  (longest test to the least-loaded shard) and run only shard
+  ``--shard-index`` (1-based). Tests without a recorded duration are
+  estimated at the median of the known ones.
+
+Every shard computes the same assignment from the same collected items and
+durations file, so the shards of one CI run cover the suite exactly once.
+Durations files from parallel jobs are combined with::
+
+    python -m tests.plugins.durations merge .test-durations.json durations-*/*.json
+"""
+
+import heapq
+import json
+import os
+import statistics
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+import pytest
+
+from tests.plugins.index_matrix import base_nodeid
+
+# Weight of the latest run in the recorded average
+SMOOTHING = 0.5
+
+# Estimate for every test when nothing is recorded yet
+DEFAULT_SECONDS = 1.0
+
+
+def add_options(parser):
+    group = parser.getgroup("durations", "duration-aware ordering and sharding")
+    group.addoption(
+        "--test-durations",
+        metavar="PATH",
+        default=".test-durations.json",
+        help="Per-test durations from past runs (default: .test-durations.json).",
+    )
+    group.addoption(
+        "--record-durations",
+        action="store_true",
+        default=False,
+        help="Update --test-durations with this run's durations.",
+    )
+    group.addoption(
+        "--order-by-duration",
+        action="store_true",
+        default=False,
+        help="Run the longest tests first.",
+    )
+    group.addoption(
+        "--shard-count",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Split the suite into N shards balanced by recorded duration.",
+    )
+    group.addoption(
+        "--shard-index",
+        type=int,
+        default=1,
+        metavar="I",
+        help="With --shard-count, run shard I (1-based).",
+    )
+
+
+def register(config):
+    """Register the plugin when any of its options is used."""
+    count = config.getoption("--shard-count")
+    index = config.getoption("--shard-index")
+    if count < 1 or not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard-index must be in 1..{count}, got {index}")
+    if not (
+        count > 1
+        or config.getoption("--order-by-duration")
+        or config.getoption("--record-durations")
+    ):
+        return
+    config.pluginmanager.register(DurationPlugin(config), "durations")
+
+
+def load(path: str) -> Dict[str, dict]:
+    """node ID -> {"seconds": average, "runs": count}; empty when missing."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError:
+            return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save(path: str, durations: Dict[str, dict]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(durations.items())), f, indent=1)
+        f.write("\n")
+
+
+def update(durations: Dict[str, dict], measured: Dict[str, float]) -> Dict[str, dict]:
+    """Fold one run's seconds per node ID into the recorded averages."""
+    updated = dict(durations)
+    for nodeid, seconds in measured.items():
+        entry = updated.get(nodeid)
+        if entry is None:
+            updated[nodeid] = {"seconds": round(seconds, 4), "runs": 1}
+            continue
+        average = (1 - SMOOTHING) * entry["seconds"] + SMOOTHING * seconds
+        updated[nodeid] = {"seconds": round(average, 4), "runs": entry["runs"] + 1}
+    return updated
+
+
+def merge(files: Sequence[Dict[str, dict]]) -> Dict[str, dict]:
+    """Combine durations files of parallel jobs that started from the same file.
+
+    Per node ID the entries with the most runs (the jobs that ran the test) are
+    averaged, so a shard's stale copy of tests it did not run is ignored.
+    """
+    merged: Dict[str, dict] = {}
+    for nodeid in sorted({n for data in files for n in data}):
+        entries = [data[nodeid] for data in files if nodeid in data]
+        runs = max(entry["runs"] for entry in entries)
+        latest = [entry["seconds"] for entry in entries if entry["runs"] == runs]
+        merged[nodeid] = {"seconds": round(statistics.mean(latest), 4), "runs": runs}
+    return merged
+
+
+def estimates(nodeids: Sequence[str], durations: Dict[str, dict]) -> Dict[str, float]:
+    """Seconds per node ID; unknown tests get the median of the known ones."""
+    known = [durations[n]["seconds"] for n in nodeids if n in durations]
+    default = statistics.median(known) if known else DEFAULT_SECONDS
+    return {n: durations[n]["seconds"] if n in durations else default for n in nodeids}
+
+
+def longest_first(nodeids: Sequence[str], seconds: Dict[str, float]) -> List[str]:
+    return sorted(nodeids, key=lambda n: (-seconds[n], n))
+
+
+def lpt_shards(
+    nodeids: Sequence[str], seconds: Dict[str, float], count: int
+) -> List[Tuple[float, List[str]]]:
+    """Greedy LPT: longest test first, each to the least-loaded shard.
+
+    Returns (estimated seconds, node IDs) per shard. Ties go to the lowest
+    shard so every job computes the same assignment.
+    """
+    members: List[List[str]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    heap = [(0.0, position) for position in range(count)]
+    for nodeid in longest_first(nodeids, seconds):
+        load, position = heapq.heappop(heap)
+        members[position].append(nodeid)
+        loads[position] = load + seconds[nodeid]
+        heapq.heappush(heap, (loads[position], position))
+    return list(zip(loads, members))
+
+
+class DurationPlugin:
+    """Orders, shards and records test durations."""
+
+    def __init__(self, config):
+        self.path = config.getoption("--test-durations")
+        self.record = config.getoption("--record-durations")
+        self.order = config.getoption("--order-by-duration")
+        self.count = config.getoption("--shard-count")
+        self.index = config.getoption("--shard-index")
+        self.durations = load(self.path)
+        self.measured: Dict[str, float] = {}
+        self.plan: List[Tuple[float, List[str]]] = []
+        self.selected = 0
+
+    def pytest_collection_modifyitems(self, config, items):
+        nodeids = [base_nodeid(item.nodeid) for item in items]
+        seconds = estimates(nodeids, self.durations)
+        if self.count > 1:
+            self.plan = lpt_shards(nodeids, seconds, self.count)
+            keep = set(self.plan[self.index - 1][1])
+            deselected = [i for i in items if base_nodeid(i.nodeid) not in keep]
+            items[:] = [i for i in items if base_nodeid(i.nodeid) in keep]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+        if self.order:
+            position = {n: i for i, n in enumerate(longest_first(nodeids, seconds))}
+            items.sort(key=lambda item: position[base_nodeid(item.nodeid)])
+        self.selected = len(items)
+
+    def pytest_runtest_logreport(self, report):
+        if self.record:
+            nodeid = base_nodeid(report.nodeid)
+            self.measured[nodeid] = self.measured.get(nodeid, 0.0) + report.duration
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.plan:
+            loads = ", ".join(f"{load:.1f}" for load, _ in self.plan)
+            terminalreporter.write_line(
+                f"durations: shard {self.index}/{self.count} ran {self.selected} tests, "
+                f"estimated {self.plan[self.index - 1][0]:.1f} s "
+                f"(shard estimates: {loads} s)"
+            )
+        if self.record and self.measured:
+            save(self.path, update(self.durations, self.measured))
+            terminalreporter.write_line(
+                f"durations: {len(self.measured)} tests recorded in {self.path}"
+            )
+
+
+def main(argv: Sequence[str] = None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    if len(args) < 2 or args[0] != "merge":
+        sys.exit("usage: python -m tests.plugins.durations merge OUTPUT INPUT...")
+    output, inputs = args[1], args[2:]
+    merged = merge([load(path) for path in inputs])
+    save(output, merged)
+    print(f"Merged {len(inputs)} files into {output} ({len(merged)} tests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Configurable index matrix (``@pytest.mark.index_matrix``)
+
+Tests marked ``index_matrix`` run once per configured index; the index fixture
+name is passed to the ``index_id`` fixture. Indexes come from:
+
+- ``TL_INDEX_MARENGO_27`` / ``TL_INDEX_MARENGO_30`` as ``index_marengo27`` /
+  ``index_marengo30`` (listed even when unset, so their tests skip with a hint)
+- ``TL_INDEXES``: comma-separated ``name=index_id`` pairs
+- ``--indexes-file`` (or ``TL_INDEXES_FILE``): a JSON object ``{"name": "index_id"}``
+
+Names get an ``index_`` prefix if they lack one. ``--index NAME`` (repeatable)
+keeps only the named indexes. With ``--standin`` the matrix is the stand-in's
+Marengo 2.7 and Marengo 3.0 indexes.
+
+Each parameter is marked ``marengo27``/``marengo30`` when the model is known
+(legacy names, or an entry in the index capability cache), so ``-m marengo30``
+keeps working. ``@pytest.mark.index_matrix(model="marengo3.0")`` limits a test
+to one model; indexes of unknown model stay in and the test checks at runtime.
+
+With pytest-xdist every parameter is also marked ``xdist_group(<name>)`` and
+``-n N`` schedules with ``--dist loadgroup``: all tests of one index run on the
+same worker (one client, one capability probe, one index's rate limit), and the
+indexes are spread over the workers. Workers tag node IDs with the group
+(``test_x[index_a]@index_a``); ``base_nodeid`` removes the tag.
+
+Tests that build their own ``index_id`` axis from the matrix (the pairwise
+covering array in test_search_pairwise.py) use ``matrix`` and ``marks``.
+
+Every file the suite writes during a run is safe under ``-n``: the capability
+cache merges into the file on disk, and the outcome and call-count files are
+written by the controller from the test reports.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+import pytest
+
+from tests.plugins import capabilities
+
+# (fixture name, environment variable, model)
+LEGACY = (
+    ("index_marengo27", "TL_INDEX_MARENGO_27", capabilities.MARENGO_27),
+    ("index_marengo30", "TL_INDEX_MARENGO_30", capabilities.MARENGO_30),
+)
+
+_MATRIX = pytest.StashKey[list]()
+
+MARKS = {
+    capabilities.MARENGO_27: pytest.mark.marengo27,
+    capabilities.MARENGO_30: pytest.mark.marengo30,
+}
+
+
+def add_options(parser):
+    group = parser.getgroup("index-matrix", "index matrix")
+    group.addoption(
+        "--indexes-file",
+        metavar="PATH",
+        default=None,
+        help='JSON object {"name": "index_id"} of indexes to test (also TL_INDEXES_FILE).',
+    )
+    group.addoption(
+        "--index",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Only test this index (repeatable).",
+    )
+
+
+def register(config):
+    """Schedule tests by index when running under pytest-xdist ``-n``."""
+    if hasattr(config, "workerinput"):
+        # Workers re-parse the command line, so they only learn about the
+        # switch to loadgroup (which makes them tag node IDs with the group)
+        # from the controller's workerinput.
+        if config.workerinput.get("index_matrix_loadgroup"):
+            config.option.loadgroup = True
+        return
+    if (
+        config.pluginmanager.hasplugin("xdist")
+        and config.getoption("numprocesses", None)
+        and config.getoption("dist", None) == "load"
+    ):
+        config.option.dist = "loadgroup"
+        config.pluginmanager.register(LoadGroupWorkers(), "index-matrix-workers")
+
+
+def base_nodeid(nodeid: str) -> str:
+    """Node ID without the ``@<group>`` suffix loadgroup workers add to it.
+
+    Files keyed by node ID (durations, call counts, outcomes) use the plain ID,
+    so they match between runs with and without ``-n``.
+    """
+    head, at, group = nodeid.rpartition("@")
+    if at and not any(c in group for c in "[]:/"):
+        return head
+    return nodeid
+
+
+class LoadGroupWorkers:
+    """Tells each xdist worker that tests are grouped by index."""
+
+    def pytest_configure_node(self, node):
+        node.workerinput["index_matrix_loadgroup"] = True
+
+
+class IndexSpec:
+    """One index of the matrix: fixture name, index ID and model if known."""
+
+    __slots__ = ("name", "index_id", "model_name", "env")
+
+    def __init__(
+        self,
+        name: str,
+        index_id: Optional[str],
+        model_name: Optional[str] = None,
+        env: Optional[str] = None,
+    ):
+        self.name = name
+        self.index_id = index_id
+        self.model_name = model_name
+        self.env = env
+
+
+def _name(name: str) -> str:
+    name = name.strip()
+    return name if name.startswith("index_") else "index_" + name
+
+
+def parse_pairs(text: str) -> Dict[str, str]:
+    """``name=id,name=id`` -> {index_name: index_id}."""
+    indexes = {}
+    for pair in text.split(","):
+        if not pair.strip():
+            continue
+        name, separator, index_id = pair.partition("=")
+        if not separator or not name.strip() or not index_id.strip():
+            raise pytest.UsageError(
+                f"TL_INDEXES entries must be name=index_id: {pair!r}"
+            )
+        indexes[_name(name)] = index_id.strip()
+    return indexes
+
+
+def load_file(path: str) -> Dict[str, str]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not all(isinstance(v, str) for v in data.values()):
+        raise pytest.UsageError(
+            f'{path} must hold a JSON object {{"name": "index_id"}}'
+        )
+    return {_name(name): index_id for name, index_id in data.items()}
+
+
+def configured(config) -> List[IndexSpec]:
+    """The indexes of this run, in configuration order."""
+    if config.getoption("--standin", default=False):
+        from standin import STANDIN_INDEX_MARENGO_27, STANDIN_INDEX_MARENGO_30
+
+        ids = (STANDIN_INDEX_MARENGO_27, STANDIN_INDEX_MARENGO_30)
+        specs = [
+            IndexSpec(name, index_id, model)
+            for (name, _, model), index_id in zip(LEGACY, ids)
+        ]
+    else:
+        specs = [
+            IndexSpec(name, os.getenv(env), model, env) for name, env, model in LEGACY
+        ]
+        extra = parse_pairs(os.getenv("TL_INDEXES", ""))
+        path = config.getoption("--indexes-file") or os.getenv("TL_INDEXES_FILE")
+        if path:
+            extra.update(load_file(path))
+        known = capabilities.load(config.getoption("--index-capabilities"))
+        for name, index_id in extra.items():
+            specs = [spec for spec in specs if spec.name != name]
+            model = known.get(index_id, {}).get("model_name")
+            specs.append(IndexSpec(name, index_id, model))
+
+    only = [_name(name) for name in config.getoption("--index")]
+    if only:
+        unknown = sorted(set(only) - {spec.name for spec in specs})
+        if unknown:
+            raise pytest.UsageError(f"--index: unknown index {', '.join(unknown)}")
+        specs = [spec for spec in specs if spec.name in only]
+    return specs
+
+
+def _matrix(config) -> List[IndexSpec]:
+    if _MATRIX not in config.stash:
+        config.stash[_MATRIX] = configured(config)
+    return config.stash[_MATRIX]
+
+
+def matrix(config) -> List[IndexSpec]:
+    """The indexes of this run (``configured``, computed once per session)."""
+    return _matrix(config)
+
+
+def marks(config, spec: IndexSpec) -> list:
+    """Model and xdist group marks of the parameters that run on ``spec``."""
+    result = [MARKS[spec.model_name]] if spec.model_name in MARKS else []
+    if config.pluginmanager.hasplugin("xdist"):
+        result.append(pytest.mark.xdist_group(spec.name))
+    return result
+
+
+def parametrize(metafunc):
+    """Parametrize ``index_id`` over the matrix for tests marked ``index_matrix``."""
+    marker = metafunc.definition.get_closest_marker("index_matrix")
+    if marker is None:
+        return
+    model = marker.kwargs.get("model")
+    params = []
+    for spec in _matrix(metafunc.config):
+        if model and spec.model_name and spec.model_name != model:
+            continue
+        params.append(
+            pytest.param(spec.name, marks=marks(metafunc.config, spec), id=spec.name)
+        )
+    metafunc.parametrize("index_id", params, indirect=True)
+
+
+def resolve(config, name: str) -> Optional[IndexSpec]:
+    for spec in _matrix(config):
+        if spec.name == name:
+            return spec
+    return None
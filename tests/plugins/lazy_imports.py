@@ -0,0 +1,134 @@
+"""
+Deferred SDK package imports (``--lazy-imports``)
+
+``import twelvelabs`` executes the SDK's package ``__init__`` modules, which
+import every generated type and the pydantic/httpx stack. The test modules only
+need ``twelvelabs.core.api_error.ApiError`` at import time, so collection-only
+and filtered runs (``-k``, ``-m marengo30``) pay for the whole SDK without
+using it.
+
+With ``--lazy-imports`` (or ``TL_LAZY_IMPORTS=1``) a meta path finder defers the
+``__init__`` of every ``twelvelabs`` package until an attribute that it defines
+is first looked up. Plain modules such as ``twelvelabs.core.api_error`` still
+import normally, so ``ApiError`` is the same class the SDK raises once the
+client is in use. The first fixture that builds a client loads the SDK.
+"""
+
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+import threading
+from typing import Sequence
+
+PACKAGES = ("twelvelabs",)
+
+
+def add_options(parser):
+    group = parser.getgroup("lazy-imports", "startup")
+    group.addoption(
+        "--lazy-imports",
+        action="store_true",
+        default=False,
+        help="Defer twelvelabs package imports until first use (also TL_LAZY_IMPORTS=1).",
+    )
+
+
+def enabled(config) -> bool:
+    return config.getoption("--lazy-imports") or os.getenv(
+        "TL_LAZY_IMPORTS", ""
+    ).lower() in ("1", "true", "yes")
+
+
+def register(config):
+    """Install the deferring finder (before collection) when the mode is enabled."""
+    if not enabled(config):
+        return
+    finder = install()
+    config.pluginmanager.register(LazyImportsReport(finder), "lazy-imports")
+    config.add_cleanup(lambda: uninstall(finder))
+
+
+class DeferredLoader(importlib.abc.Loader):
+    """Wraps a package's loader and runs its ``__init__`` on first attribute lookup."""
+
+    def __init__(self, loader, finder: "DeferredPackageFinder"):
+        self.loader = loader
+        self.finder = finder
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        # get_resource_reader, get_source, ... of the wrapped loader
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        loader = self
+        self.finder.deferred.add(module.__name__)
+
+        def __getattr__(name):
+            loader.load(module)
+            return getattr(module, name)
+
+        module.__dict__["__getattr__"] = __getattr__
+
+    def load(self, module):
+        with self._lock:
+            if module.__name__ not in self.finder.deferred:
+                return
+            self.finder.deferred.discard(module.__name__)
+            self.finder.loaded.append(module.__name__)
+            module.__dict__.pop("__getattr__", None)
+            self.loader.exec_module(module)
+
+
+class DeferredPackageFinder(importlib.abc.MetaPathFinder):
+    """Finds packages under ``packages`` and defers their ``__init__`` modules."""
+
+    def __init__(self, packages: Sequence[str] = PACKAGES):
+        self.packages = tuple(packages)
+        self.deferred = set()
+        self.loaded = []
+
+    def find_spec(self, fullname, path, target=None):
+        if not any(
+            fullname == name or fullname.startswith(name + ".")
+            for name in self.packages
+        ):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.submodule_search_locations is None:
+            return spec  # plain modules import normally
+        spec.loader = DeferredLoader(spec.loader, self)
+        return spec
+
+
+def install(packages: Sequence[str] = PACKAGES) -> DeferredPackageFinder:
+    """Put a deferring finder first on ``sys.meta_path``.
+
+    Packages that are already imported are not affected.
+    """
+    finder = DeferredPackageFinder(packages)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def uninstall(finder: DeferredPackageFinder):
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
+
+
+class LazyImportsReport:
+    """Reports which deferred packages the run ended up loading."""
+
+    def __init__(self, finder: DeferredPackageFinder):
+        self.finder = finder
+
+    def pytest_terminal_summary(self, terminalreporter):
+        total = len(self.finder.loaded) + len(self.finder.deferred)
+        terminalreporter.write_line(
+            f"lazy imports: {len(self.finder.loaded)} of {total} deferred "
+            f"{'/'.join(self.finder.packages)} packages loaded"
+        )
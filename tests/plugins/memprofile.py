@@ -0,0 +1,358 @@
+"""
+Memory profiling per test and per page (``--memprofile``)
+
+Every test call runs under tracemalloc. Each ``search.query`` call and each
+``next_page`` request made through the SDK counts as one page. For every page
+the profiler records:
+
+- the peak traced memory while the page was fetched and parsed
+- the memory still held once the page was returned
+- the top allocation sites of the blocks that page left alive (first
+  ``--memprofile-pages`` pages only, since snapshots get slow on long drains)
+
+Per test it records the peak over the whole call and the top sites at the
+test's heaviest page boundary (re-sampled whenever live memory grows by 10%).
+Allocation sites are grouped into SDK areas:
+
+- response buffering (httpx/httpcore)
+- JSON decoding and encoding
+- pydantic models
+- pager chaining (SDK wrapper and ``SyncPager``)
+- test code
+- the in-process stand-in (any allocation made under the stand-in's handler)
+
+Results go into the pytest-html report (an extra column plus a per-test table),
+the terminal summary, and optionally a JSON file (``--memprofile-json``).
+"""
+
+import html
+import json
+import os
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import pytest
+
+from . import sites
+from .sites import short_path
+
+AREAS = (
+    ("response buffering", ("httpx", "httpcore", "h11", "ssl.py", "socket.py")),
+    ("json", (os.path.join("json", ""), "orjson")),
+    ("pydantic models", ("pydantic",)),
+    ("pager chaining", ("pagination.py", "search_client_wrapper.py")),
+    ("twelvelabs sdk", ("twelvelabs",)),
+    ("stand-in", (os.path.join("standin", ""),)),
+    ("test code", (os.path.join("tests", ""),)),
+)
+
+_IGNORED = (tracemalloc.__file__, __file__)
+
+
+def add_options(parser):
+    group = parser.getgroup("memprofile", "memory profiling")
+    group.addoption(
+        "--memprofile",
+        action="store_true",
+        default=False,
+        help="Record tracemalloc peak memory and top allocation sites per test and per page.",
+    )
+    group.addoption(
+        "--memprofile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of allocation sites kept per test and per page (default: 10).",
+    )
+    group.addoption(
+        "--memprofile-pages",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Pages per test that get allocation sites; later pages record peak and retained "
+        "memory only (default: 3).",
+    )
+    group.addoption(
+        "--memprofile-frames",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Traceback frames stored per allocation; sites are attributed to the innermost "
+        "frame of a known SDK area (default: 8).",
+    )
+    group.addoption(
+        "--memprofile-json",
+        metavar="PATH",
+        default=None,
+        help="With --memprofile, also write all records to PATH as JSON.",
+    )
+
+
+def register(config):
+    """Register the profiler (and its pytest-html hooks) when --memprofile is given."""
+    if not config.getoption("--memprofile"):
+        return
+    config.pluginmanager.register(MemoryProfiler(config), "memprofile")
+    if config.pluginmanager.hasplugin("html"):
+        config.pluginmanager.register(HtmlColumns(), "memprofile-html")
+
+
+def area_of(filename: str) -> str:
+    return sites.area_of(filename, AREAS)
+
+
+def _kib(size: int) -> float:
+    return round(size / 1024, 1)
+
+
+def _site(traceback: tracemalloc.Traceback) -> Optional[tracemalloc.Frame]:
+    """Innermost frame that belongs to a known area (innermost frame otherwise).
+
+    Returns None for the profiler's own allocations.
+    """
+    frames = list(reversed(traceback))  # tracebacks are ordered oldest first
+    if frames[0].filename in _IGNORED:
+        return None
+    for frame in frames:
+        if area_of(frame.filename) == "stand-in":
+            return frame
+    for frame in frames:
+        if area_of(frame.filename) != "other":
+            return frame
+    return frames[0]
+
+
+def allocation_sites(
+    after: tracemalloc.Snapshot, before: tracemalloc.Snapshot, top: int
+) -> dict:
+    """Summarize the blocks allocated between two snapshots and still alive."""
+    by_site: Dict[tuple, List[int]] = {}
+    areas: Dict[str, int] = {}
+    for stat in after.compare_to(before, "traceback"):
+        if stat.size_diff <= 0:
+            continue
+        frame = _site(stat.traceback)
+        if frame is None:
+            continue
+        key = (frame.filename, frame.lineno)
+        totals = by_site.setdefault(key, [0, 0])
+        totals[0] += stat.size_diff
+        totals[1] += max(stat.count_diff, 0)
+        area = area_of(frame.filename)
+        areas[area] = areas.get(area, 0) + stat.size_diff
+    ranked = sorted(by_site.items(), key=lambda entry: entry[1][0], reverse=True)
+    return {
+        "areas_kib": {
+            area: _kib(size)
+            for area, size in sorted(areas.items(), key=lambda e: e[1], reverse=True)
+        },
+        "top": [
+            {
+                "site": f"{short_path(filename)}:{lineno}",
+                "area": area_of(filename),
+                "kib": _kib(size),
+                "blocks": count,
+            }
+            for (filename, lineno), (size, count) in ranked[:top]
+        ],
+    }
+
+
+def _reset_peak():
+    # tracemalloc.reset_peak is Python 3.9+; on 3.8 page peaks are cumulative
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+
+
+class MemoryProfiler:
+    """Collects one memory record per test call."""
+
+    def __init__(self, config):
+        self.top = config.getoption("--memprofile-top")
+        self.detailed_pages = config.getoption("--memprofile-pages")
+        self.frames = config.getoption("--memprofile-frames")
+        self.json_path = config.getoption("--memprofile-json")
+        self.records: Dict[str, dict] = {}
+        self._pages: List[dict] = []
+        self._heaviest: Optional[tuple] = None
+        self._peak = 0
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot()
+
+    def _fold_peak(self) -> int:
+        """Fold the current tracemalloc peak into the test's peak; return current."""
+        current, peak = tracemalloc.get_traced_memory()
+        self._peak = max(self._peak, peak)
+        return current
+
+    @contextmanager
+    def _page(self, request: str):
+        self._fold_peak()
+        detailed = len(self._pages) < self.detailed_pages
+        before = self._snapshot() if detailed else None
+        base, _ = tracemalloc.get_traced_memory()
+        _reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self._peak = max(self._peak, peak)
+            page = {
+                "page": len(self._pages) + 1,
+                "request": request,
+                "peak_kib": _kib(peak - base),
+                "retained_kib": _kib(current - base),
+            }
+            after = None
+            if detailed:
+                after = self._snapshot()
+                page.update(allocation_sites(after, before, self.top))
+            self._pages.append(page)
+            if self._heaviest is None or current > self._heaviest[0] * 1.1:
+                self._heaviest = (current, after or self._snapshot())
+
+    @contextmanager
+    def _page_hooks(self):
+        from twelvelabs.wrapper.search_client_wrapper import SearchClientWrapper
+
+        profiler = self
+        query = SearchClientWrapper.query
+        get_next_page = SearchClientWrapper._get_next_page
+
+        def profiled_query(self, *args, **kwargs):
+            with profiler._page("search.query"):
+                return query(self, *args, **kwargs)
+
+        def profiled_next_page(self, *args, **kwargs):
+            with profiler._page("next_page"):
+                return get_next_page(self, *args, **kwargs)
+
+        SearchClientWrapper.query = profiled_query
+        SearchClientWrapper._get_next_page = profiled_next_page
+        try:
+            yield
+        finally:
+            SearchClientWrapper.query = query
+            SearchClientWrapper._get_next_page = get_next_page
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(self.frames)
+        self._pages = []
+        self._heaviest = None
+        before = self._snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        _reset_peak()
+        self._peak = base
+        try:
+            with self._page_hooks():
+                yield
+        finally:
+            current = self._fold_peak()
+            heaviest = self._heaviest[1] if self._heaviest else self._snapshot()
+            record = {
+                "peak_kib": _kib(self._peak - base),
+                "retained_kib": _kib(current - base),
+                "pages": self._pages,
+            }
+            record.update(allocation_sites(heaviest, before, self.top))
+            self.records[item.nodeid] = record
+            item.memprofile = record
+            item.user_properties.append(("memprofile_peak_kib", record["peak_kib"]))
+            self._heaviest = None
+            if started:
+                tracemalloc.stop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        record = getattr(item, "memprofile", None)
+        if call.when != "call" or record is None:
+            return
+        report.memprofile = record
+        extra = _html_extra(record)
+        if extra is not None:
+            report.extras = getattr(report, "extras", []) + [extra]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        terminalreporter.write_sep("-", "memory profile (peak per test)")
+        ranked = sorted(
+            self.records.items(), key=lambda e: e[1]["peak_kib"], reverse=True
+        )
+        for nodeid, record in ranked[: self.top]:
+            areas = ", ".join(
+                f"{area} {kib} KiB"
+                for area, kib in list(record["areas_kib"].items())[:3]
+            )
+            terminalreporter.write_line(
+                f"{record['peak_kib']:>10.1f} KiB  {len(record['pages']):>3} pages  "
+                f"{nodeid}" + (f"  [{areas}]" if areas else "")
+            )
+        if self.json_path:
+            with open(self.json_path, "w", encoding="utf-8") as f:
+                json.dump(self.records, f, indent=2)
+            terminalreporter.write_line(f"Memory profile written to {self.json_path}")
+
+
+def _sites_table(sites: List[dict]) -> str:
+    rows = "".join(
+        f"<tr><td>{site['kib']}</td><td>{site['blocks']}</td>"
+        f"<td>{html.escape(site['area'])}</td><td>{html.escape(site['site'])}</td></tr>"
+        for site in sites
+    )
+    return (
+        "<table><tr><th>KiB</th><th>Blocks</th><th>Area</th><th>Site</th></tr>"
+        f"{rows}</table>"
+    )
+
+
+def render_html(record: dict) -> str:
+    """Render a test's memory record as an HTML fragment."""
+    areas = ", ".join(f"{area}: {kib} KiB" for area, kib in record["areas_kib"].items())
+    parts = [
+        "<div class='memprofile'>",
+        f"<p><b>Peak</b> {record['peak_kib']} KiB, "
+        f"<b>retained</b> {record['retained_kib']} KiB. "
+        f"<b>Live at heaviest page</b>: {html.escape(areas) or 'n/a'}</p>",
+        _sites_table(record["top"]),
+    ]
+    if record["pages"]:
+        rows = "".join(
+            f"<tr><td>{page['page']}</td><td>{page['request']}</td>"
+            f"<td>{page['peak_kib']}</td><td>{page['retained_kib']}</td>"
+            f"<td>{html.escape(', '.join(f'{a}: {k}' for a, k in page.get('areas_kib', {}).items()))}</td></tr>"
+            for page in record["pages"]
+        )
+        parts.append(
+            "<p><b>Per page</b></p><table><tr><th>Page</th><th>Request</th>"
+            "<th>Peak KiB</th><th>Retained KiB</th><th>Retained by area (KiB)</th></tr>"
+            f"{rows}</table>"
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def _html_extra(record: dict):
+    try:
+        from pytest_html import extras
+    except ImportError:
+        return None
+    return extras.html(render_html(record))
+
+
+class HtmlColumns:
+    """pytest-html hooks adding a peak memory column to the results table."""
+
+    def pytest_html_results_table_header(self, cells):
+        cells.insert(2, "<th class='sortable' data-column-type='memory'>Peak KiB</th>")
+
+    def pytest_html_results_table_row(self, report, cells):
+        record = getattr(report, "memprofile", None)
+        cells.insert(2, f"<td>{record['peak_kib'] if record else ''}</td>")
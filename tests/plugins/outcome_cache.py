@@ -0,0 +1,308 @@
+"""
+Incremental runs that reuse unchanged outcomes (``--reuse-outcomes``)
+
+Each test that uses the ``client`` fixture gets a content-addressed key:
+
+- the SHA-256 of its test module and of every ``conftest.py`` from the rootdir
+  down to the test, and of the repo modules these import names from,
+  transitively (``search_helpers``, ``standin``, ``tests/plugins``, ...)
+- the installed ``twelvelabs`` version
+- the run options that change what a test does (``OPTIONS``: where searches
+  go, how unsupported options are routed, hedging)
+- the index IDs the test's fixtures resolved to, and each index's fingerprint
+
+The index fingerprint hashes the index's models, video count, total duration
+and ``updated_at`` from ``client.indexes.retrieve``, fetched once per index per
+session (one API call) and recorded in the cache file. Adding videos to an
+index therefore invalidates every test that searches it.
+
+With ``--reuse-outcomes`` a test whose key has a recorded pass or skip reports
+that outcome without calling the test function, so no search requests are
+sent. Failures are never cached: a failing test runs again on the next run.
+Results are kept in ``--outcome-cache`` (default ``.test-outcomes.json``), one
+entry per test.
+
+Under pytest-xdist ``-n`` the workers compute the keys and attach them to the
+test reports (``outcome_key``, ``outcome_fingerprints`` and ``outcome_reused``
+user properties). The controller records them and is the only process that
+writes the file.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from importlib import metadata
+from typing import Dict, Iterable, Optional, Tuple
+
+import pytest
+
+from tests.plugins.index_matrix import base_nodeid
+
+FORMAT = 1
+
+# Options that change a test's requests or expected outcome
+OPTIONS = ("--standin", "--standin-latency", "--unsupported", "--hedge")
+
+
+def add_options(parser):
+    group = parser.getgroup("outcome-cache", "incremental runs")
+    group.addoption(
+        "--reuse-outcomes",
+        action="store_true",
+        default=False,
+        help="Report the cached outcome of tests whose inputs are unchanged.",
+    )
+    group.addoption(
+        "--outcome-cache",
+        metavar="PATH",
+        default=".test-outcomes.json",
+        help="Outcomes keyed by test inputs (default: .test-outcomes.json).",
+    )
+
+
+def register(config):
+    """Register the plugin when --reuse-outcomes is given."""
+    if not config.getoption("--reuse-outcomes"):
+        return
+    config.pluginmanager.register(OutcomeCache(config), "outcome-cache")
+
+
+def load(path: str) -> dict:
+    empty = {"format": FORMAT, "indexes": {}, "outcomes": {}}
+    if not path or not os.path.exists(path):
+        return empty
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError:
+            return empty
+    if not isinstance(data, dict) or data.get("format") != FORMAT:
+        return empty
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents (read once per session)."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def sdk_version() -> str:
+    try:
+        return metadata.version("twelvelabs")
+    except metadata.PackageNotFoundError:
+        return "not installed"
+
+
+def _is_local(path: Optional[str], rootdir: str) -> bool:
+    return bool(
+        path
+        and os.path.abspath(path).startswith(rootdir + os.sep)
+        and "site-packages" not in path
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def direct_imports(module, rootdir: str) -> Tuple[object, ...]:
+    """Repo modules that ``module`` imports, or imports names from."""
+    found = {}
+    for value in vars(module).values():
+        source = value if inspect.ismodule(value) else inspect.getmodule(value)
+        path = getattr(source, "__file__", None)
+        if source is not module and _is_local(path, rootdir):
+            found[os.path.abspath(path)] = source
+    return tuple(found.values())
+
+
+def local_imports(modules: Iterable, rootdir: str) -> Dict[str, str]:
+    """Repo modules (by path) that ``modules`` import, directly or through each other.
+
+    A test that calls a conftest helper depends on the plugin module the helper
+    calls; a test of ``search_helpers`` depends on the submodules its package
+    ``__init__`` imports.
+    """
+    paths: Dict[str, str] = {}
+    pending = list(modules)
+    while pending:
+        for source in direct_imports(pending.pop(), rootdir):
+            path = os.path.abspath(source.__file__)
+            relpath = os.path.relpath(path, rootdir)
+            if relpath not in paths:
+                paths[relpath] = path
+                pending.append(source)
+    return paths
+
+
+def loaded_module(path: str):
+    """The imported module of a source file (e.g. a conftest.py), or None."""
+    path = os.path.abspath(path)
+    for module in list(sys.modules.values()):
+        source = getattr(module, "__file__", None)
+        if source and os.path.abspath(source) == path:
+            return module
+    return None
+
+
+def conftests(test_path: str, rootdir: str):
+    """conftest.py files from ``rootdir`` down to the test's directory."""
+    directory = os.path.dirname(os.path.abspath(test_path))
+    chain = []
+    while directory.startswith(rootdir):
+        candidate = os.path.join(directory, "conftest.py")
+        if os.path.exists(candidate):
+            chain.append(candidate)
+        if directory == rootdir:
+            break
+        directory = os.path.dirname(directory)
+    return sorted(chain)
+
+
+def fingerprint(info) -> str:
+    """Hash of the index details that change when its contents change."""
+    models = sorted(
+        (model.model_name or "", tuple(model.model_options or ()))
+        for model in info.models or ()
+    )
+    details = [models, info.video_count, info.total_duration, info.updated_at]
+    return hashlib.sha256(json.dumps(details).encode("utf-8")).hexdigest()[:16]
+
+
+def outcome_key(parts: dict) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class OutcomeCache:
+    """Keys tests by their inputs, records passes/skips and replays them."""
+
+    def __init__(self, config):
+        self.path = config.getoption("--outcome-cache")
+        self.rootdir = str(config.rootpath)
+        self.data = load(self.path)
+        self.sdk = sdk_version()
+        self.options = {name: config.getoption(name, default=None) for name in OPTIONS}
+        self.fingerprints: Dict[str, Optional[str]] = {}
+        self.worker = hasattr(config, "workerinput")
+        self.reused: Dict[str, str] = {}
+        self.recorded = 0
+
+    def index_fingerprint(self, client, index_id: str) -> Optional[str]:
+        """Fingerprint of ``index_id``, fetched once per session (None on error)."""
+        if index_id not in self.fingerprints:
+            from twelvelabs.core.api_error import ApiError
+
+            try:
+                value = fingerprint(client.indexes.retrieve(index_id))
+            except ApiError:
+                value = None
+            self.fingerprints[index_id] = value
+        return self.fingerprints[index_id]
+
+    def key(self, item) -> Optional[str]:
+        """Outcome key of a set-up test, or None when it cannot be cached.
+
+        The key and the fingerprints of the test's indexes are added to the
+        test's user properties, so they reach the controller under xdist.
+        """
+        indexes = {
+            name: value
+            for name, value in item.funcargs.items()
+            if (name == "index_id" or name.startswith("index_"))
+            and isinstance(value, str)
+        }
+        fingerprints = {}
+        for index_id in sorted(set(indexes.values())):
+            value = self.index_fingerprint(item.funcargs["client"], index_id)
+            if value is None:
+                return None
+            fingerprints[index_id] = value
+        item.user_properties.append(("outcome_fingerprints", fingerprints))
+        chain = conftests(str(item.path), self.rootdir)
+        roots = [item.module] + [
+            module for module in map(loaded_module, chain) if module is not None
+        ]
+        modules = local_imports(roots, self.rootdir)
+        modules[os.path.relpath(str(item.path), self.rootdir)] = str(item.path)
+        return outcome_key(
+            {
+                "nodeid": base_nodeid(item.nodeid),
+                "sources": {name: file_digest(p) for name, p in modules.items()},
+                "conftest": [file_digest(p) for p in chain],
+                "sdk": self.sdk,
+                "options": self.options,
+                "indexes": indexes,
+                "fingerprints": fingerprints,
+            }
+        )
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        if "client" not in pyfuncitem.funcargs:
+            return None
+        key = self.key(pyfuncitem)
+        if key is None:
+            return None
+        pyfuncitem.user_properties.append(("outcome_key", key))
+        cached = self.data["outcomes"].get(base_nodeid(pyfuncitem.nodeid))
+        if not cached or cached["key"] != key:
+            return None
+        pyfuncitem.user_properties.append(("outcome_reused", cached["outcome"]))
+        if cached["outcome"] == "skipped":
+            pytest.skip(cached.get("reason", "") + " (cached)")
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        properties = dict(report.user_properties)
+        key = properties.get("outcome_key")
+        if self.worker or key is None:
+            return
+        nodeid = base_nodeid(report.nodeid)
+        if "outcome_reused" in properties:
+            self.reused[nodeid] = properties["outcome_reused"]
+            return
+        recorded_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        for index_id, value in properties["outcome_fingerprints"].items():
+            entry = self.data["indexes"].get(index_id)
+            if not entry or entry["fingerprint"] != value:
+                self.data["indexes"][index_id] = {
+                    "fingerprint": value,
+                    "recorded_at": recorded_at,
+                }
+        outcomes = self.data["outcomes"]
+        if report.failed:
+            outcomes.pop(nodeid, None)
+        elif report.when == "call":
+            entry = {"key": key, "outcome": report.outcome}
+            if report.skipped and isinstance(report.longrepr, tuple):
+                entry["reason"] = report.longrepr[2].replace("Skipped: ", "", 1)
+            outcomes[nodeid] = entry
+            self.recorded += 1
+
+    def pytest_report_teststatus(self, report):
+        if (
+            report.when == "call"
+            and report.passed
+            and dict(report.user_properties).get("outcome_reused") == "passed"
+        ):
+            return "passed", "c", ("PASSED (cached)", {"green": True})
+        return None
+
+    def save(self):
+        partial = f"{self.path}.{os.getpid()}.tmp"
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=1, sort_keys=True)
+            f.write("\n")
+        os.replace(partial, self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.worker:
+            return
+        self.save()
+        terminalreporter.write_line(
+            f"outcome cache: {len(self.reused)} tests reused, "
+            f"{self.recorded} recorded in {self.path}"
+        )
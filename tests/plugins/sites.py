@@ -0,0 +1,34 @@
+"""
+Source locations shared by the profiling plugins
+"""
+
+import os
+import sysconfig
+from typing import Sequence, Tuple
+
+Areas = Sequence[Tuple[str, Sequence[str]]]
+
+_PREFIXES = tuple(
+    os.path.join(path, "")
+    for path in (
+        sysconfig.get_paths()["purelib"],
+        sysconfig.get_paths()["stdlib"],
+        os.getcwd(),
+    )
+)
+
+
+def short_path(filename: str) -> str:
+    """Path relative to site-packages, the standard library or the working directory."""
+    for prefix in _PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix) :]
+    return filename
+
+
+def area_of(filename: str, areas: Areas) -> str:
+    """Return the first area with a path fragment contained in filename, else "other"."""
+    for area, needles in areas:
+        if any(needle in filename for needle in needles):
+            return area
+    return "other"
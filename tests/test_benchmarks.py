@@ -0,0 +1,304 @@
+"""
+Benchmark smoke tests
+
+Runs each benchmark in benchmarks/ at a tiny size against the local stand-in so
+that benchmark code stays working; timings themselves are not asserted.
+"""
+
+import json
+
+from benchmarks import (
+    bench_adaptive,
+    bench_client_overhead,
+    bench_fanout,
+    bench_fast_path,
+    bench_filter,
+    bench_hedging,
+    bench_lazy_metadata,
+    bench_startup,
+    bench_streaming,
+    bench_transcription_search,
+    bench_trend,
+    dashboard,
+    perf_gate,
+    python_matrix,
+    report,
+    sdk_compare,
+)
+from benchmarks.common import TimedServer, client_seconds, drain
+from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+
+class TestBenchmarks:
+    """Benchmark smoke tests"""
+
+    def test_transcription_search_benchmark(self):
+        """Test the transcription search benchmark reports every engine and client case"""
+        results = bench_transcription_search.run(videos=50, repeat=5)
+
+        assert set(results["cases"]) == {
+            "engine_lexical",
+            "engine_semantic",
+            "client_lexical",
+            "client_semantic",
+        }
+        assert all(case["count"] > 0 for case in results["cases"].values())
+
+    def test_filter_benchmark(self):
+        """Test the filter benchmark compares linear scan and secondary indexes"""
+        results = bench_filter.run(videos=50, repeat=5)
+
+        assert {"linear_scan", "secondary_index", "search_filtered"} <= set(
+            results["cases"]
+        )
+
+    def test_client_overhead_benchmark(self):
+        """Test the client-overhead benchmark reports per-call, per-page and memory figures"""
+        results = bench_client_overhead.run(repeat=3, videos=50)
+
+        for case in results["cases"].values():
+            assert case["call_client"]["count"] == 3
+            assert case["client_requests_per_core_second"] > 0
+            assert set(case["breakdown_ms_per_call"]) == {
+                "json_decode",
+                "model_construction",
+                "request_transport_pager",
+            }
+            assert case["memory"]["peak_kib_per_call"] > 0
+
+    def test_fast_path_benchmark(self):
+        """Test the fast-path benchmark compares every variant against the SDK path"""
+        results = bench_fast_path.run(repeat=2, videos=50, pages=1)
+
+        assert set(results["cases"]) == {
+            "sdk_models",
+            "fast_rows",
+            "fast_columns",
+            "fast_models_on_demand",
+        }
+        assert results["cases"]["sdk_models"]["speedup_vs_sdk"] == 1.0
+
+    def test_streaming_benchmark(self):
+        """Test the streaming benchmark reports time-to-first-item and peak memory"""
+        results = bench_streaming.run(
+            repeat=1, videos=50, metadata_size=200, transfer_rate=50_000_000
+        )
+
+        for case in results["cases"].values():
+            assert case["time_to_first_item"]["count"] == 1
+            assert case["peak_kib"] > 0
+
+    def test_fanout_benchmark(self):
+        """Test the fan-out benchmark sends fewer requests than sequential searches"""
+        results = bench_fanout.run(
+            repeat=2, indexes=3, k=10, page_limit=5, median_s=0.001, videos=50
+        )
+
+        cases = results["cases"]
+        assert set(cases) == {"sequential", "fanout"}
+        assert cases["fanout"]["latency"]["count"] == 2
+        assert (
+            cases["fanout"]["requests_per_search"]
+            < cases["sequential"]["requests_per_search"]
+        )
+
+    def test_adaptive_benchmark(self):
+        """Test the adaptive benchmark compares static page sizes with the tuned one"""
+        results = bench_adaptive.run(
+            repeat=2,
+            warmup=2,
+            median_s=0.001,
+            transfer_rate=50_000_000,
+            workloads={"interactive": 2, "bulk": 30},
+            page_limits=(5, 50),
+        )
+
+        for workload in results["workloads"].values():
+            cases = workload["cases"]
+            assert set(cases) == {"static_5", "static_50", "adaptive"}
+            assert cases["adaptive"]["time_per_search"]["count"] == 2
+            assert 1 <= cases["adaptive"]["page_limit"] <= 50
+            assert cases["adaptive"]["decisions"]
+        assert (
+            results["workloads"]["bulk"]["cases"]["static_5"]["requests_per_search"]
+            == 6
+        )
+
+    def test_hedging_benchmark(self):
+        """Test the hedging benchmark reports p99 and extra load per setting"""
+        results = bench_hedging.run(repeat=30, median_s=0.001, videos=30)
+
+        cases = results["cases"]
+        assert set(cases) == {"off", "p95_budget5", "p90_budget10"}
+        assert cases["off"]["hedged"] == 0
+        assert cases["off"]["p99_improvement"] == 0
+        for case in cases.values():
+            assert case["query"]["count"] == 30
+            assert case["extra_load"] <= 2 / 60 + case["budget_ratio"]
+
+    def test_lazy_metadata_benchmark(self):
+        """Test the lazy metadata benchmark reports decode time and memory per mode"""
+        results = bench_lazy_metadata.run(repeat=2, videos=50, metadata_size=500)
+
+        assert set(results["cases"]) == {
+            "sdk_metadata_off",
+            "fast_metadata_off",
+            "sdk_metadata_on",
+            "fast_metadata_on",
+            "lazy_metadata_on",
+            "lazy_access_one_metadata_on",
+            "projected_metadata_on",
+        }
+        assert results["page_kib"]["on"] > results["page_kib"]["off"]
+        for case in results["cases"].values():
+            assert case["decode"]["count"] == 2
+            assert case["retained_kib"] > 0
+
+    def test_timed_server_splits_client_and_server_time(self):
+        """Test the shared timing helpers attribute stand-in time to the server"""
+        server = StandinServer.with_default_indexes(num_videos=50)
+        timed = TimedServer(server)
+        client = server.make_client()
+        params = {
+            "index_id": STANDIN_INDEX_MARENGO_30,
+            "query_text": "water",
+            "search_options": ["visual"],
+            "page_limit": 5,
+        }
+
+        pages, total, client_only = client_seconds(
+            timed, lambda: drain(client, 2, **params)
+        )
+
+        assert len(pages) == 2
+        assert timed.seconds > 0 and 0 < client_only < total
+        assert set(timed.bodies) == {"POST", "GET"}
+
+    def test_bootstrap_ratio(self):
+        """Test the bootstrap interval brackets the ratio and separates a 2x shift"""
+        baseline = [1.0 + 0.01 * (i % 10) for i in range(100)]
+
+        same = perf_gate.bootstrap_ratio(baseline, baseline, "p95")
+        doubled = perf_gate.bootstrap_ratio(
+            [2 * v for v in baseline], baseline, "median"
+        )
+
+        assert same[1] <= 1.0 <= same[2]
+        assert doubled[0] == 2.0
+        assert doubled[1] > 1.5
+
+    def test_perf_gate_flags_regressions(self):
+        """Test the perf gate passes against itself and flags an inflated current run"""
+        run = perf_gate.collect(repeat=6, pages=2, videos=50)
+        slower = dict(run)
+        slower["samples"] = dict(run["samples"])
+        slower["samples"]["page_latency"] = [
+            3 * value for value in run["samples"]["page_latency"]
+        ]
+
+        assert {e["verdict"] for e in perf_gate.compare(run, run).values()} == {"ok"}
+        report = perf_gate.compare(slower, run)
+        assert report["page_latency"]["verdict"] == "regression"
+        assert report["drain_peak_kib"]["verdict"] == "ok"
+
+    def test_perf_gate_detects_sdk_mismatch(self):
+        """Test a baseline from another SDK version is reported, the same one is not"""
+        installed = perf_gate.environment()["twelvelabs"]
+
+        assert (
+            perf_gate.sdk_mismatch({"environment": {"twelvelabs": installed}}) is None
+        )
+        assert perf_gate.sdk_mismatch({"environment": {"twelvelabs": "0.0.1"}}) == (
+            "0.0.1"
+        )
+        assert perf_gate.sdk_mismatch({}) is None
+
+    def test_trend_benchmark_and_dashboard(self):
+        """Test trend snapshots append to the history and render one chart per metric"""
+        snapshot = bench_trend.run(repeat=2, pages=2, videos=50, import_repeat=1)
+        snapshot["environment"] = {"python": "3.11.7", "twelvelabs": "1.3.6"}
+        assert set(snapshot["indexes"]) == {"marengo2.7", "marengo3.0"}
+
+        history = dashboard.append_run([], [snapshot], "a" * 40)
+        slower = {**snapshot, "indexes": {}}
+        for index, entry in snapshot["indexes"].items():
+            slower["indexes"][index] = {**entry, "peak_kib": entry["peak_kib"] * 2}
+        history = dashboard.append_run(history, [slower], "b" * 40)
+        history = dashboard.append_run(history, [slower], "b" * 40)
+
+        assert [run["commit"][0] for run in history] == ["a", "b"]
+        creeping = {
+            (row["metric"], row["index"])
+            for row in dashboard.creep_rows(history)
+            if row["creep"]
+        }
+        assert creeping == {
+            ("Peak memory per drain", "marengo2.7"),
+            ("Peak memory per drain", "marengo3.0"),
+        }
+        page = dashboard.render_html(history)
+        assert page.count("<svg") == 2 * len(dashboard.METRICS)
+
+    def test_sdk_compare_side_by_side(self, tmp_path):
+        """Test the SDK comparison runs the workload and reports changes vs the first version"""
+        assert sdk_compare.requirement("1.3.5") == "twelvelabs==1.3.5"
+        assert sdk_compare.requirement("git+https://x/y@main") == "git+https://x/y@main"
+
+        current = sdk_compare.run_workload(
+            sdk_compare.ensure_env("current", str(tmp_path)),
+            str(tmp_path / "current"),
+            ["--repeat=2", "--pages=2", "--videos=50", "--import-repeat=1"],
+        )
+        slower = {**current, "indexes": {}}
+        for index, entry in current["indexes"].items():
+            slower["indexes"][index] = {**entry, "peak_kib": entry["peak_kib"] * 2}
+        results = {"current": current, "next": slower, "broken": {"error": "boom"}}
+
+        rows = report.side_by_side(results)
+        markdown = report.render_markdown(results, rows)
+
+        assert len(rows) == len(report.STARTUP_METRICS) + 2 * len(report.METRICS)
+        peak = next(row for row in rows if row["metric"] == "peak memory (KiB)")
+        assert peak["versions"]["next"]["change"] == 1.0
+        assert peak["versions"]["broken"]["value"] is None
+        assert "(+100.0%)" in markdown
+        assert "- broken: boom" in markdown
+
+    def test_python_matrix_orders_versions(self, tmp_path):
+        """Test the Python matrix puts the oldest interpreter first unless a reference is set"""
+        for version in ("3.12.1", "3.8.18", "3.10.4"):
+            folder = tmp_path / version
+            folder.mkdir()
+            (folder / "bench_trend.json").write_text(
+                json.dumps(
+                    {
+                        "environment": {"python": version},
+                        "startup": {"import_twelvelabs": {"p50_ms": 100.0}},
+                        "indexes": {"marengo3.0": {"pages_per_sec": 10.0}},
+                    }
+                )
+            )
+        paths = sorted(str(path) for path in tmp_path.glob("*/bench_trend.json"))
+
+        assert list(python_matrix.load_snapshots(paths)) == ["3.8", "3.10", "3.12"]
+        results = python_matrix.load_snapshots(paths, reference="3.12")
+        assert list(results) == ["3.12", "3.8", "3.10"]
+        rows = report.side_by_side(results)
+        assert [row["metric"] for row in rows] == [
+            "import twelvelabs p50 (ms)",
+            "pages/sec",
+        ]
+        assert "Python 3.12" in python_matrix.render_page(results, rows)
+
+    def test_startup_import_breakdown(self):
+        """Test the startup benchmark groups import time of the SDK and its dependencies"""
+        assert bench_startup.group_of("twelvelabs.types.search_item") == (
+            "twelvelabs types"
+        )
+        assert bench_startup.group_of("httpcore._sync") == "httpx"
+        assert bench_startup.group_of("json.decoder") == "stdlib/other"
+
+        breakdown = bench_startup.import_breakdown(repeat=1, top=3)
+
+        assert breakdown["groups_ms"]["twelvelabs types"] > 0
+        assert len(breakdown["slowest_modules_ms"]) == 3
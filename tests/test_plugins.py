@@ -0,0 +1,664 @@
+"""
+Suite plugin tests
+
+Tests the profiling plugins under tests/plugins by running the suite's own
+pagination tests against the stand-in in a pytest subprocess.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import tracemalloc
+
+import pytest
+
+from tests.plugins import (
+    call_budget,
+    capabilities,
+    cpuprofile,
+    durations,
+    index_matrix,
+    lazy_imports,
+    memprofile,
+    outcome_cache,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_pytest(*args: str, env: dict = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=600,
+        env=dict(os.environ, **(env or {})),
+    )
+
+
+class TestMemprofile:
+    """--memprofile tests"""
+
+    def test_area_of(self):
+        """Test allocation sites are attributed to SDK areas by file path"""
+        assert memprofile.area_of("/x/site-packages/httpx/_models.py") == (
+            "response buffering"
+        )
+        assert memprofile.area_of("/x/site-packages/pydantic/main.py") == (
+            "pydantic models"
+        )
+        assert memprofile.area_of("/x/twelvelabs/core/pagination.py") == (
+            "pager chaining"
+        )
+        assert memprofile.area_of("/x/twelvelabs/types/search_item.py") == (
+            "twelvelabs sdk"
+        )
+        assert memprofile.area_of("/usr/lib/python3.11/json/decoder.py") == "json"
+        assert memprofile.area_of("/usr/lib/python3.11/random.py") == "other"
+
+    def test_allocation_sites_reports_live_blocks(self):
+        """Test blocks allocated between snapshots are summed per site and area"""
+        tracemalloc.start(4)
+        try:
+            before = tracemalloc.take_snapshot()
+            kept = [bytearray(64 * 1024) for _ in range(4)]
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        summary = memprofile.allocation_sites(after, before, top=3)
+
+        assert summary["top"][0]["kib"] >= 256
+        assert summary["top"][0]["site"].startswith("tests/test_plugins.py:")
+        assert summary["areas_kib"]["test code"] >= 256
+        del kept
+
+    def test_memprofile_records_pages(self, tmp_path):
+        """Test --memprofile writes per-test and per-page records for pagination tests"""
+        output = tmp_path / "memprofile.json"
+
+        result = run_pytest(
+            "--standin",
+            "--memprofile",
+            f"--memprofile-json={output}",
+            "tests/test_search_page_limit.py",
+            "-k",
+            "test_pagination_iter_pages",
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "memory profile (peak per test)" in result.stdout
+        records = json.loads(output.read_text())
+        assert len(records) == 2
+        for record in records.values():
+            assert record["peak_kib"] > 0
+            assert [page["request"] for page in record["pages"]] == [
+                "search.query",
+                "next_page",
+                "next_page",
+            ]
+            assert all(page["top"] for page in record["pages"])
+            assert record["areas_kib"]
+
+
+class TestCpuprofile:
+    """--cpuprofile tests"""
+
+    def test_area_of_stack(self):
+        """Test samples are attributed to the stand-in, network wait or innermost known area"""
+        test = ("/repo/tests/test_search_query_text.py", "test_x", 10)
+        sdk = ("/x/site-packages/twelvelabs/core/http_client.py", "request", 1)
+        httpx_send = ("/x/site-packages/httpx/_client.py", "send", 1)
+        standin = ("/repo/standin/server.py", "handle", 1)
+        recv = ("/usr/lib/python3.11/ssl.py", "recv_into", 1)
+        typing_hints = ("/usr/lib/python3.11/typing.py", "get_type_hints", 1)
+
+        assert cpuprofile.area_of_stack((test, sdk, httpx_send, standin)) == "stand-in"
+        assert cpuprofile.area_of_stack((test, sdk, httpx_send, recv)) == (
+            "network wait"
+        )
+        assert cpuprofile.area_of_stack((test, sdk, typing_hints)) == "twelvelabs sdk"
+        assert cpuprofile.area_of_stack((test,)) == "test validation"
+
+    def test_cpuprofile_writes_folded_stacks(self, tmp_path):
+        """Test --cpuprofile writes folded stacks per test, all.folded and summary.json"""
+        output = tmp_path / "cpuprofile"
+
+        result = run_pytest(
+            "--standin",
+            "--cpuprofile",
+            f"--cpuprofile-dir={output}",
+            "tests/test_search_page_limit.py",
+            "-k",
+            "test_page_limit_minimal",
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "cpu profile (sampled wall time by area)" in result.stdout
+        summary = json.loads((output / "summary.json").read_text())
+        assert len(summary) == 2
+        for record in summary.values():
+            assert record["samples"] > 0
+            assert "twelvelabs sdk" in record["areas_s"]
+            lines = open(record["folded"], encoding="utf-8").read().splitlines()
+            for line in lines:
+                stack, count = line.rsplit(" ", 1)
+                assert stack == "[pytest]" or stack.startswith(
+                    "test_page_limit_minimal (tests/"
+                )
+                assert int(count) > 0
+        assert (output / "all.folded").read_text().startswith("tests/")
+
+
+class TestLazyImports:
+    """--lazy-imports tests"""
+
+    def test_package_init_runs_on_first_attribute(self, tmp_path, monkeypatch):
+        """Test a deferred package's __init__ runs only when one of its names is used"""
+        package = tmp_path / "lazy_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text(textwrap.dedent("""
+                import os
+                os.environ["LAZY_PKG_LOADED"] = "1"
+                from .errors import Error
+                VALUE = 42
+                """))
+        (package / "errors.py").write_text("class Error(Exception):\n    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delenv("LAZY_PKG_LOADED", raising=False)
+        finder = lazy_imports.install(("lazy_pkg",))
+        try:
+            from lazy_pkg.errors import Error
+
+            assert "LAZY_PKG_LOADED" not in os.environ
+            import lazy_pkg
+
+            assert lazy_pkg.VALUE == 42
+            assert os.environ["LAZY_PKG_LOADED"] == "1"
+            assert lazy_pkg.Error is Error
+            assert finder.loaded == ["lazy_pkg"]
+        finally:
+            lazy_imports.uninstall(finder)
+            for name in ("lazy_pkg", "lazy_pkg.errors"):
+                sys.modules.pop(name, None)
+
+    def test_collection_does_not_load_sdk(self):
+        """Test --lazy-imports collects the suite without running twelvelabs __init__ modules"""
+        result = run_pytest("--lazy-imports", "--collect-only", "tests")
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "lazy imports: 0 of" in result.stdout
+
+    def test_sdk_errors_are_caught_in_lazy_mode(self):
+        """Test ApiError imported before the SDK loads still catches the SDK's errors"""
+        result = run_pytest(
+            "--standin",
+            "--lazy-imports",
+            "tests/test_search_error_handling.py",
+            "-k",
+            "invalid_index_id or invalid_page_limit",
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "lazy imports: 0 of" not in result.stdout
+
+
+class TestDurations:
+    """--shard-count / --order-by-duration / --record-durations tests"""
+
+    def test_lpt_shards_balance_long_tests(self):
+        """Test LPT puts the longest tests on different shards and covers each test once"""
+        seconds = {"a": 9.0, "b": 8.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+
+        shards = durations.lpt_shards(list(seconds), seconds, 2)
+
+        assert [load for load, _ in shards] == [13.0, 13.0]
+        assert sorted(n for _, members in shards for n in members) == sorted(seconds)
+        assert shards[0][1][0] == "a" and shards[1][1][0] == "b"
+
+    def test_unknown_tests_get_median_estimate(self):
+        """Test tests without a recorded duration are estimated at the known median"""
+        recorded = {"a": {"seconds": 1.0, "runs": 1}, "b": {"seconds": 3.0, "runs": 2}}
+
+        assert durations.estimates(["a", "b", "new"], recorded)["new"] == 2.0
+        assert durations.estimates(["new"], {})["new"] == durations.DEFAULT_SECONDS
+
+    def test_merge_prefers_jobs_that_ran_the_test(self):
+        """Test merging shard files keeps the freshly updated entry of each test"""
+        start = {"a": {"seconds": 1.0, "runs": 1}, "b": {"seconds": 1.0, "runs": 1}}
+        shard1 = durations.update(start, {"a": 3.0})
+        shard2 = durations.update(start, {"b": 5.0})
+
+        merged = durations.merge([shard1, shard2])
+
+        assert merged == {
+            "a": {"seconds": 2.0, "runs": 2},
+            "b": {"seconds": 3.0, "runs": 2},
+        }
+
+    def test_shards_partition_the_collection(self, tmp_path):
+        """Test every collected test lands in exactly one shard"""
+        path = tmp_path / "durations.json"
+        recorded = run_pytest(
+            "--standin",
+            "--record-durations",
+            f"--test-durations={path}",
+            "tests/test_search_page_limit.py",
+        )
+        assert recorded.returncode == 0, recorded.stdout + recorded.stderr
+        assert json.loads(path.read_text())
+
+        shards = []
+        for index in (1, 2, 3):
+            result = run_pytest(
+                "--collect-only",
+                "-q",  # node IDs only (pytest.ini adds -v)
+                "--shard-count=3",
+                f"--shard-index={index}",
+                f"--test-durations={path}",
+                "tests/test_search_page_limit.py",
+            )
+            assert result.returncode == 0, result.stdout + result.stderr
+            shards.append({line for line in result.stdout.splitlines() if "::" in line})
+        everything = run_pytest(
+            "--collect-only", "-q", "tests/test_search_page_limit.py"
+        )
+
+        assert all(shards)
+        assert sum(len(shard) for shard in shards) == len(set.union(*shards))
+        assert set.union(*shards) == {
+            line for line in everything.stdout.splitlines() if "::" in line
+        }
+
+
+class TestCallBudget:
+    """--call-budget / --record-calls tests"""
+
+    def test_select_stays_within_budget(self):
+        """Test selection maximizes new features per call and keeps free tests"""
+        costs = {"free": 0, "broad": 4, "a": 1, "b": 1, "overlap": 2}
+        coverage = {
+            "free": frozenset(),
+            "broad": frozenset({("f", "1"), ("f", "2"), ("f", "3")}),
+            "a": frozenset({("f", "1")}),
+            "b": frozenset({("f", "2")}),
+            "overlap": frozenset({("f", "1"), ("f", "2")}),
+        }
+
+        selected = call_budget.select(costs, coverage, 2)
+
+        assert selected == ["free", "a", "b"]
+        assert call_budget.select(costs, coverage, 0) == ["free"]
+
+    def test_select_prefers_best_single_test(self):
+        """Test one broad test wins over cheap tests that cover less"""
+        costs = {"cheap": 1, "broad": 5}
+        coverage = {
+            "cheap": frozenset({("f", "1")}),
+            "broad": frozenset({("f", str(i)) for i in range(4)}),
+        }
+
+        assert call_budget.select(costs, coverage, 5) == ["broad"]
+
+    def test_analyze_reads_parameters_from_source(self):
+        """Test keyword and dict-literal search parameters become features"""
+
+        def sample(client, index_id, page_limit):
+            params = {"group_by": "video"}
+            client.search.query(
+                index_id=index_id,
+                query_text="water",
+                search_options=["visual", "audio"],
+                page_limit=page_limit,
+                **params,
+            )
+            client.search.next_page(page_token="token")
+
+        pairs, call_sites = call_budget.analyze(sample, {"page_limit": 5})
+
+        assert pairs == {
+            ("query_text", "text"),
+            ("search_options", "audio+visual"),
+            ("page_limit", "5"),
+            ("group_by", "video"),
+        }
+        assert call_sites == 2
+
+    def test_record_then_budget(self, tmp_path):
+        """Test recorded call counts drive a budgeted selection"""
+        path = tmp_path / "calls.json"
+        recorded = run_pytest(
+            "--standin",
+            "--record-calls",
+            f"--test-calls={path}",
+            "tests/test_search_operator.py",
+        )
+        assert recorded.returncode == 0, recorded.stdout + recorded.stderr
+        calls = json.loads(path.read_text())
+        assert calls and all(count > 0 for count in calls.values())
+
+        result = run_pytest(
+            "--collect-only",
+            "-q",  # node IDs only (pytest.ini adds -v)
+            "--call-budget=4",
+            f"--test-calls={path}",
+            "tests/test_search_operator.py",
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        selected = [line for line in result.stdout.splitlines() if "::" in line]
+        assert 0 < len(selected) < len(calls)
+        assert sum(calls[n] for n in selected) <= 4
+        assert "call budget:" in result.stdout
+
+    def test_workers_record_calls_together(self, tmp_path):
+        """Test -n records the calls of every worker's tests, not the last worker's"""
+        pytest.importorskip("xdist")
+        serial, parallel = tmp_path / "serial.json", tmp_path / "parallel.json"
+
+        for path, extra in ((serial, ()), (parallel, ("-n", "2"))):
+            result = run_pytest(
+                "--standin",
+                "--record-calls",
+                f"--test-calls={path}",
+                *extra,
+                "tests/test_search_operator.py",
+            )
+            assert result.returncode == 0, result.stdout + result.stderr
+
+        calls = json.loads(parallel.read_text())
+        assert len(calls) == 8
+        assert calls == json.loads(serial.read_text())
+
+
+OUTCOME_CONFTEST = """
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, {root!r})
+from tests.plugins import outcome_cache
+
+
+def pytest_addoption(parser):
+    outcome_cache.add_options(parser)
+
+
+def pytest_configure(config):
+    outcome_cache.register(config)
+
+
+@pytest.fixture
+def client():
+    from standin import StandinServer
+
+    videos = int(os.environ.get("STANDIN_VIDEOS", "20"))
+    return StandinServer.with_default_indexes(num_videos=videos).make_client()
+
+
+@pytest.fixture
+def index_id():
+    return "standin-marengo30"
+"""
+
+OUTCOME_TEST = """
+def test_search(client, index_id):
+    client.search.query(index_id=index_id, query_text="water", search_options=["visual"])
+"""
+
+
+class TestOutcomeCache:
+    """--reuse-outcomes tests"""
+
+    def test_fingerprint_follows_index_contents(self):
+        """Test the index fingerprint changes when the index gains videos"""
+        from standin import STANDIN_INDEX_MARENGO_30, StandinServer
+
+        def index_fingerprint(videos):
+            client = StandinServer.with_default_indexes(num_videos=videos).make_client()
+            return outcome_cache.fingerprint(
+                client.indexes.retrieve(STANDIN_INDEX_MARENGO_30)
+            )
+
+        assert index_fingerprint(20) == index_fingerprint(20)
+        assert index_fingerprint(20) != index_fingerprint(21)
+
+    def test_conftest_chain(self):
+        """Test the conftest files above a test module are part of its key"""
+        chain = outcome_cache.conftests(
+            os.path.join(ROOT, "tests", "test_search_operator.py"), ROOT
+        )
+
+        assert chain == [os.path.join(ROOT, "tests", "conftest.py")]
+
+    def test_sources_are_followed_transitively(self):
+        """Test the key covers modules reached through conftest and package imports"""
+        from tests import test_search_fast_path, test_search_options
+
+        conftest = outcome_cache.loaded_module(
+            os.path.join(ROOT, "tests", "conftest.py")
+        )
+        options = outcome_cache.local_imports([test_search_options, conftest], ROOT)
+        fast_path = outcome_cache.local_imports([test_search_fast_path], ROOT)
+
+        assert os.path.join("tests", "plugins", "capabilities.py") in options
+        assert os.path.join("search_helpers", "raw.py") in fast_path
+
+    def test_reuse_until_inputs_change(self, tmp_path):
+        """Test outcomes are reused until the test source or index changes"""
+        (tmp_path / "conftest.py").write_text(OUTCOME_CONFTEST.format(root=ROOT))
+        (tmp_path / "test_sample.py").write_text(OUTCOME_TEST)
+
+        def run(videos="20"):
+            result = subprocess.run(
+                [sys.executable, "-m", "pytest", "-v", "-p", "no:cacheprovider"]
+                + ["--reuse-outcomes", "test_sample.py"],
+                cwd=tmp_path,
+                capture_output=True,
+                text=True,
+                timeout=300,
+                env=dict(os.environ, STANDIN_VIDEOS=videos),
+            )
+            assert result.returncode == 0, result.stdout + result.stderr
+            return result.stdout
+
+        assert "0 tests reused, 1 recorded" in run()
+        assert "PASSED (cached)" in run()
+        assert "0 tests reused" in run(videos="21")
+        (tmp_path / "test_sample.py").write_text(OUTCOME_TEST + "\n# edited\n")
+        assert "0 tests reused" in run(videos="21")
+        assert "1 tests reused" in run(videos="21")
+        assert json.loads((tmp_path / ".test-outcomes.json").read_text())["indexes"]
+
+    def test_outcome_options_are_part_of_key(self, tmp_path):
+        """Test a skip recorded with --unsupported=skip is not replayed without it"""
+        args = (
+            "--standin",
+            "--reuse-outcomes",
+            f"--outcome-cache={tmp_path / 'outcomes.json'}",
+            "tests/test_search_options.py",
+            "-k",
+            "transcription",
+        )
+
+        skipped = run_pytest("--unsupported=skip", *args)
+        default = run_pytest(*args)
+
+        assert skipped.returncode == 0, skipped.stdout + skipped.stderr
+        assert "2 skipped" in skipped.stdout
+        assert "0 tests reused" in default.stdout
+        assert "skipped" not in default.stdout.splitlines()[-1]
+
+    def test_workers_report_outcomes_to_controller(self, tmp_path):
+        """Test -n records the workers' outcomes and reuses them on the next run"""
+        pytest.importorskip("xdist")
+        path = tmp_path / "outcomes.json"
+        args = (
+            "--standin",
+            "-n",
+            "2",
+            "--reuse-outcomes",
+            f"--outcome-cache={path}",
+            "tests/test_search_operator.py",
+        )
+
+        first = run_pytest(*args)
+        second = run_pytest(*args)
+
+        assert first.returncode == 0, first.stdout + first.stderr
+        assert "0 tests reused, 8 recorded" in first.stdout
+        assert "8 tests reused, 0 recorded" in second.stdout
+        data = json.loads(path.read_text())
+        assert len(data["outcomes"]) == 8 and len(data["indexes"]) == 2
+
+
+class TestCapabilities:
+    """Index capability cache tests"""
+
+    def test_probe_once_per_ttl(self, tmp_path):
+        """Test a fresh cache file answers without probing and a stale one re-probes"""
+        from standin import STANDIN_INDEX_MARENGO_27, StandinServer
+
+        server = StandinServer.with_default_indexes(num_videos=20)
+        client = server.make_client()
+        path = str(tmp_path / "capabilities.json")
+
+        first = capabilities.CapabilityCache(path).get(client, STANDIN_INDEX_MARENGO_27)
+        second = capabilities.CapabilityCache(path).get(
+            client, STANDIN_INDEX_MARENGO_27
+        )
+        stale = capabilities.CapabilityCache(path, ttl=0)
+        stale.get(client, STANDIN_INDEX_MARENGO_27)
+        stale.get(client, STANDIN_INDEX_MARENGO_27)
+
+        assert first.model_name == second.model_name == capabilities.MARENGO_27
+        assert not second.supports(["transcription"])
+        assert server.request_counts["index"] == 2
+
+    def test_transcription_follows_marengo30_audio(self):
+        """Test Marengo 3.0 indexes with audio support transcription search"""
+        from types import SimpleNamespace
+
+        def index(model_name, options):
+            model = SimpleNamespace(model_name=model_name, model_options=options)
+            return SimpleNamespace(models=[model])
+
+        marengo30 = capabilities.IndexCapabilities.from_index(
+            "a", index("marengo3.0", ["visual", "audio"]), 0.0
+        )
+        visual_only = capabilities.IndexCapabilities.from_index(
+            "b", index("marengo3.0", ["visual"]), 0.0
+        )
+        marengo27 = capabilities.IndexCapabilities.from_index(
+            "c", index("marengo2.7", ["visual", "audio"]), 0.0
+        )
+
+        assert marengo30.is_marengo30 and marengo30.supports(["transcription"])
+        assert not visual_only.supports(["transcription"])
+        assert not marengo27.is_marengo30 and not marengo27.supports(["transcription"])
+
+    def test_unsupported_skip_and_local(self, tmp_path):
+        """Test --unsupported=skip skips expected-error searches and local still checks them"""
+        path = tmp_path / "capabilities.json"
+        args = [
+            "--standin",
+            f"--index-capabilities={path}",
+            "-m",
+            "marengo27",
+            "tests/test_search_options.py",
+        ]
+
+        skipped = run_pytest("--unsupported=skip", *args)
+        local = run_pytest("--unsupported=local", *args)
+
+        assert skipped.returncode == 0, skipped.stdout + skipped.stderr
+        assert "3 skipped" in skipped.stdout
+        assert local.returncode == 0, local.stdout + local.stderr
+        assert "skipped" not in local.stdout.splitlines()[-1]
+        assert "from " in local.stdout and "0 indexes probed" in local.stdout
+
+
+class TestIndexMatrix:
+    """@pytest.mark.index_matrix tests"""
+
+    def test_parse_pairs(self):
+        """Test TL_INDEXES pairs get the index_ prefix and bad entries are rejected"""
+        assert index_matrix.parse_pairs("prod_a=abc, index_b = def,") == {
+            "index_prod_a": "abc",
+            "index_b": "def",
+        }
+        with pytest.raises(pytest.UsageError):
+            index_matrix.parse_pairs("prod_a")
+
+    def test_configured_indexes_are_collected(self, tmp_path):
+        """Test TL_INDEXES adds indexes, marked by the model the capability cache knows"""
+        path = tmp_path / "capabilities.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "id-a": {
+                        "model_name": "marengo3.0",
+                        "search_options": ["visual", "audio", "transcription"],
+                        "probed_at": 0,
+                    }
+                }
+            )
+        )
+        env = {"TL_INDEXES": "prod_a=id-a,prod_b=id-b"}
+        args = [
+            "--collect-only",
+            "-q",  # node IDs only (pytest.ini adds -v)
+            f"--index-capabilities={path}",
+            "tests/test_search_operator.py",
+        ]
+
+        everything = run_pytest(*args, env=env)
+        marengo30 = run_pytest("-m", "marengo30", *args, env=env)
+        only_b = run_pytest("--index", "prod_b", *args, env=env)
+
+        def ids(result):
+            assert result.returncode == 0, result.stdout + result.stderr
+            return {
+                line.split("[")[1].rstrip("]")
+                for line in result.stdout.splitlines()
+                if "::" in line
+            }
+
+        assert ids(everything) == {
+            "index_marengo27",
+            "index_marengo30",
+            "index_prod_a",
+            "index_prod_b",
+        }
+        assert ids(marengo30) == {"index_marengo30", "index_prod_a"}
+        assert ids(only_b) == {"index_prod_b"}
+
+    def test_base_nodeid_drops_group_suffix(self):
+        """Test the loadgroup @group suffix is removed and @ in parameters is kept"""
+        nodeid = "tests/test_x.py::T::test_y[index_a]"
+
+        assert index_matrix.base_nodeid(nodeid + "@index_a") == nodeid
+        assert index_matrix.base_nodeid(nodeid) == nodeid
+        assert index_matrix.base_nodeid("t.py::test[a@b]") == "t.py::test[a@b]"
+
+    def test_workers_keep_index_affinity(self):
+        """Test -n runs every test of one index on the same worker"""
+        pytest.importorskip("xdist")
+
+        result = run_pytest(
+            "--standin", "-n", "2", "-v", "tests/test_search_operator.py"
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        workers = {}
+        for line in result.stdout.splitlines():
+            if line.startswith("[gw") and "PASSED" in line:
+                worker = line.split("]")[0]
+                index = line.split("[")[-1].split("]")[0]
+                workers.setdefault(index, set()).add(worker)
+        assert set(workers) == {"index_marengo27", "index_marengo30"}
+        assert all(len(used) == 1 for used in workers.values())
@@ -0,0 +1,115 @@
+"""
+Adaptive page_limit tests
+
+Tests that search_helpers.PageSizeTuner picks small pages for searches whose
+first few results are read and 50 for drains, and that AdaptivePager measures
+consumption, applies the tuned page_limit to later searches and logs decisions.
+"""
+
+import itertools
+import logging
+
+import pytest
+
+from search_helpers import AdaptivePager, PageSizeTuner
+from standin import STANDIN_INDEX_MARENGO_27, StandinServer
+
+PARAMS = dict(
+    index_id=STANDIN_INDEX_MARENGO_27,
+    query_text="water",
+    search_options=["visual", "audio"],
+)
+
+
+def _pages(consumed: int, page_limit: int, base: float, per_item: float):
+    """Page observations of a search that read ``consumed`` items."""
+    count = -(-max(consumed, 1) // page_limit)
+    return [(page_limit, base + per_item * page_limit)] * count
+
+
+def _tune(tuner: PageSizeTuner, consumed: int, searches: int = 5):
+    for _ in range(searches):
+        limit = tuner.page_limit
+        tuner.record(limit, consumed, _pages(consumed, limit, 0.1, 0.002))
+
+
+class TestSearchAdaptive:
+    """Adaptive page_limit tests"""
+
+    def test_tuner_fits_page_latency(self):
+        """Test base and per-item latency are recovered from pages of different sizes"""
+        tuner = PageSizeTuner()
+        tuner.pages.extend((n, 0.05 + 0.001 * n) for n in (1, 10, 25, 50))
+
+        base, per_item = tuner.page_cost()
+
+        assert base == pytest.approx(0.05)
+        assert per_item == pytest.approx(0.001)
+
+    @pytest.mark.parametrize(
+        "consumed,expected", [(1, 1), (3, 3), (200, 50), (1000, 50)]
+    )
+    def test_tuner_matches_page_size_to_consumption(self, consumed, expected):
+        """Test interactive reads get small pages and drains get 50"""
+        tuner = PageSizeTuner(initial=10)
+        tuner.pages.extend((n, 0.1 + 0.002 * n) for n in (5, 50))
+
+        _tune(tuner, consumed)
+
+        assert tuner.page_limit == expected
+        assert tuner.decisions[-1].page_limit == expected
+
+    def test_tuner_follows_workload_changes(self):
+        """Test the page size moves from 50 back to small once reads become short"""
+        tuner = PageSizeTuner(initial=10, window=5)
+        tuner.pages.extend((n, 0.1 + 0.002 * n) for n in (5, 50))
+
+        _tune(tuner, 500)
+        assert tuner.page_limit == 50
+        _tune(tuner, 2, searches=5)
+        assert tuner.page_limit == 2
+
+    def test_adaptive_pager_applies_tuned_page_limit(self, caplog):
+        """Test consumption is measured and later searches use the tuned page_limit"""
+        server = StandinServer.with_default_indexes()
+        pager = AdaptivePager(server.make_client(), PageSizeTuner(initial=10))
+
+        with caplog.at_level(logging.DEBUG, logger="search_helpers.adaptive"):
+            for _ in range(3):
+                search = pager.query(**PARAMS)
+                items = list(itertools.islice(search, 60))
+                search.finish()
+                assert len(items) == 60
+                assert search.consumed == 60
+                assert len(search.pages) == -(-60 // search.page_limit)
+
+        decisions = pager.tuner.decisions
+        assert [d.previous for d in decisions[1:]] == [
+            d.page_limit for d in decisions[:-1]
+        ]
+        assert pager.query(**PARAMS).page_limit == decisions[-1].page_limit
+        assert "page_limit 10 ->" in caplog.records[0].getMessage()
+
+    def test_abandoned_search_is_recorded_on_next_query(self):
+        """Test a search read partly and never closed still feeds the tuner"""
+        server = StandinServer.with_default_indexes()
+        pager = AdaptivePager(server.make_client())
+
+        search = pager.query(**PARAMS)
+        iterator = iter(search)
+        next(iterator)
+        next(iterator)
+        pager.query(**PARAMS)
+
+        assert list(pager.tuner.consumed) == [2]
+        assert pager.tuner.searches == 1
+
+    def test_explicit_page_limit_is_kept(self):
+        """Test a page_limit given by the caller overrides the tuned one"""
+        server = StandinServer.with_default_indexes()
+        pager = AdaptivePager(server.make_client(), PageSizeTuner(initial=10))
+
+        search = pager.query(page_limit=7, **PARAMS)
+
+        assert search.page_limit == 7
+        assert len(search.pages) == 1 and search.pages[0][0] == 7
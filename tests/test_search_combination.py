@@ -22,14 +22,7 @@ from conftest import (
 class TestSearchCombination:
     """Combination tests for all major parameters"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_all_parameters_combined(self, client, index_id, request):
         """Test all major parameters used together"""
         index_name = get_index_name(request)
@@ -72,14 +65,7 @@ class TestSearchCombination:
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_parameters_with_clip_count_sort(self, client, index_id, request):
         """Test combination with sort_option='clip_count'"""
         try:
@@ -128,14 +114,7 @@ class TestSearchCombination:
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_parameters_with_pagination(self, client, index_id, request):
         """Test combination with pagination"""
         search_pager = client.search.query(
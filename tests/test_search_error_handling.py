@@ -24,14 +24,7 @@ class TestSearchErrorHandling:
     as behavior may differ depending on Marengo version.
     """
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_index_id(self, client, index_id, request):
         """Test invalid index_id
 
@@ -71,14 +64,7 @@ class TestSearchErrorHandling:
                 f"  Note: Expected error code ({expected_code}) differs. Actual: {error_code}"
             )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_empty_search_options(self, client, index_id, request):
         """Test empty search_options"""
         with pytest.raises((ApiError, ValueError, TypeError)) as exc_info:
@@ -96,14 +82,7 @@ class TestSearchErrorHandling:
                 error_code != ""
             ), f"Error code could not be extracted. Error: {exc_info.value}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_search_option(self, client, index_id, request):
         """Test invalid search_option
 
@@ -127,14 +106,7 @@ class TestSearchErrorHandling:
                 error_code == expected_code
             ), f"Expected error code: {expected_code}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_sort_option(self, client, index_id, request):
         """Test invalid sort_option"""
         with pytest.raises((ApiError, ValueError, TypeError)) as exc_info:
@@ -157,14 +129,7 @@ class TestSearchErrorHandling:
                 error_code != ""
             ), f"Error code could not be extracted. Error: {exc_info.value}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_group_by(self, client, index_id, request):
         """Test invalid group_by"""
         with pytest.raises((ApiError, ValueError, TypeError)) as exc_info:
@@ -187,14 +152,7 @@ class TestSearchErrorHandling:
                 error_code != ""
             ), f"Error code could not be extracted. Error: {exc_info.value}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_operator(self, client, index_id, request):
         """Test invalid operator"""
         with pytest.raises((ApiError, ValueError, TypeError)) as exc_info:
@@ -217,14 +175,7 @@ class TestSearchErrorHandling:
                 error_code != ""
             ), f"Error code could not be extracted. Error: {exc_info.value}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_page_limit(self, client, index_id, request):
         """Test invalid page_limit (negative value)"""
         with pytest.raises((ApiError, ValueError, TypeError)) as exc_info:
@@ -247,14 +198,7 @@ class TestSearchErrorHandling:
                 error_code != ""
             ), f"Error code could not be extracted. Error: {exc_info.value}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_excessive_page_limit(self, client, index_id):
         """Test page_limit exceeding maximum value"""
         try:
@@ -274,14 +218,7 @@ class TestSearchErrorHandling:
             else:
                 raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_filter_syntax(self, client, index_id, request):
         """Test invalid filter syntax
 
@@ -312,14 +249,7 @@ class TestSearchErrorHandling:
                 f"  Note: Expected error code ({expected_code}) differs. Actual: {error_code}"
             )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_unsupported_option_combination(
         self, client, index_id, request
     ):
@@ -338,14 +268,7 @@ class TestSearchErrorHandling:
         )
         pytest.skip("Cannot trigger search_option_combination_not_supported")
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_expired_page_token(self, client, index_id):
         """Test expired page token
 
@@ -394,14 +317,7 @@ class TestSearchErrorHandling:
         # Currently only verify that pagination works correctly
         assert next_page_pager is not None, "Pagination should work correctly"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_empty_filter_string(self, client, index_id, request):
         """Test filter with empty string
 
@@ -428,14 +344,7 @@ class TestSearchErrorHandling:
             )
             assert error_code != "", f"Error code could not be extracted. Error: {e}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_empty_json_filter(self, client, index_id, request):
         """Test filter with empty JSON object"""
         try:
@@ -460,14 +369,7 @@ class TestSearchErrorHandling:
             else:
                 raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_page_limit_zero(self, client, index_id, request):
         """Test page_limit=0 error handling
 
@@ -0,0 +1,171 @@
+"""
+Fan-out search tests
+
+Tests that search_helpers.query_many merges the results of several indexes in
+rank (or score) order, yields results found in several indexes once, and stops
+requesting pages as soon as the top-k is settled.
+"""
+
+import os
+import sys
+import threading
+
+import httpx
+import pytest
+from twelvelabs.core.api_error import ApiError
+
+sys.path.insert(0, os.path.dirname(__file__))
+from conftest import get_error_code
+
+from search_helpers import by_rank, by_score, query_many
+from standin import MARENGO_27, SearchIndex, StandinServer, build_corpus
+
+PARAMS = dict(query_text="water", search_options=["visual", "audio"])
+
+
+class FirstPageBarrier:
+    """Transport wrapper that holds each search request until ``parties`` are in flight.
+
+    Requests sent one after another never reach the barrier together, so it
+    times out and the request fails instead of hanging.
+    """
+
+    def __init__(self, inner, parties: int, timeout: float = 10.0):
+        self.inner = inner
+        self.barrier = threading.Barrier(parties, timeout=timeout)
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def handle_request(self, request):
+        if request.method != "POST":
+            return self.inner.handle_request(request)
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            self.barrier.wait()
+            return self.inner.handle_request(request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def close(self):
+        self.inner.close()
+
+
+def _scored_server(indexes: int = 2, **kwargs) -> StandinServer:
+    return StandinServer(
+        [
+            SearchIndex(f"standin-scored-{i}", MARENGO_27, build_corpus(60, seed=i))
+            for i in range(indexes)
+        ],
+        **kwargs,
+    )
+
+
+class TestSearchFanout:
+    """Fan-out search tests"""
+
+    def test_fanout_merges_indexes_by_rank(
+        self, client, index_marengo27, index_marengo30
+    ):
+        """Test merged results keep each index's order and never decrease in rank"""
+        indexes = [index_marengo27, index_marengo30]
+        expected = {
+            index_id: [
+                item.dict()
+                for item in client.search.query(
+                    index_id=index_id, page_limit=10, **PARAMS
+                )
+            ]
+            for index_id in indexes
+        }
+
+        hits = query_many(client, indexes, page_limit=10, **PARAMS).top()
+
+        for index_id in indexes:
+            items = [hit.item.dict() for hit in hits if hit.index_id == index_id]
+            assert items == expected[index_id]
+        merged = []
+        positions = {index_id: 0 for index_id in indexes}
+        for hit in hits:
+            positions[hit.index_id] += 1
+            merged.append(by_rank(hit.item, positions[hit.index_id]))
+        assert merged == sorted(merged)
+
+    def test_fanout_error_matches_sdk(self, client, index_marengo27, index_marengo30):
+        """Test a failing search raises the SDK's error (no query)"""
+        with pytest.raises(ApiError) as exc_info:
+            query_many(
+                client, [index_marengo27, index_marengo30], search_options=["visual"]
+            )
+
+        assert get_error_code(exc_info.value) == "parameter_not_provided"
+
+    def test_top_k_stops_fetching_pages(self):
+        """Test the merge requests no page beyond the settled top-k"""
+        server = _scored_server()
+        client = server.make_client()
+        indexes = list(server.indexes)
+
+        search = query_many(client, indexes, k=8, page_limit=5, **PARAMS)
+        hits = search.top()
+
+        assert len(hits) == 8
+        assert server.request_counts["search"] == 2
+        assert server.request_counts["search_page"] == 0
+        assert search.pages_fetched == {index_id: 1 for index_id in indexes}
+
+        search = query_many(client, indexes, k=12, page_limit=5, **PARAMS)
+        assert len(search.top()) == 12
+        assert search.pages_fetched == {index_id: 2 for index_id in indexes}
+        assert server.request_counts["search_page"] == 2
+
+    def test_duplicates_are_yielded_once(self):
+        """Test results of an index searched twice are yielded once, in order"""
+        server = _scored_server(indexes=1)
+        client = server.make_client()
+        index_id = next(iter(server.indexes))
+        expected = [
+            item.dict()
+            for item in client.search.query(index_id=index_id, page_limit=10, **PARAMS)
+        ]
+
+        search = query_many(client, [index_id, index_id], page_limit=10, **PARAMS)
+        hits = search.top()
+
+        assert [hit.item.dict() for hit in hits] == expected
+        assert search.duplicates == len(expected)
+
+    def test_fanout_merges_by_score(self):
+        """Test by_score yields scored results in descending score order"""
+        server = _scored_server(indexes=3)
+        client = server.make_client()
+
+        hits = query_many(
+            client, list(server.indexes), k=25, key=by_score, page_limit=5, **PARAMS
+        ).top()
+        scores = [hit.item.score for hit in hits]
+
+        assert len(hits) == 25
+        assert scores == sorted(scores, reverse=True)
+        assert len({hit.index_id for hit in hits}) > 1
+
+    def test_first_pages_are_requested_concurrently(self):
+        """Test the four first-page requests are all in flight at the same time"""
+        server = _scored_server(indexes=4)
+        barrier = FirstPageBarrier(server.transport(), parties=4)
+        client = server.make_client(httpx_client=httpx.Client(transport=barrier))
+
+        query_many(client, list(server.indexes), k=5, **PARAMS)
+
+        assert server.request_counts["search"] == 4
+        assert barrier.peak == 4
+
+    def test_invalid_arguments(self, client, index_marengo27):
+        """Test k below 1 and a single index_id are rejected before any request"""
+        with pytest.raises(ValueError):
+            query_many(client, [index_marengo27], k=0, **PARAMS)
+        with pytest.raises(TypeError):
+            query_many(client, [], index_id=index_marengo27, **PARAMS)
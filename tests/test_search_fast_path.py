@@ -0,0 +1,217 @@
+"""
+Raw-response fast path tests
+
+Tests that search_helpers.query_fast returns the same results as
+client.search.query without building pydantic models up front, and that
+user_metadata can be kept undecoded or projected.
+"""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from twelvelabs.core.api_error import ApiError
+
+sys.path.insert(0, os.path.dirname(__file__))
+from conftest import get_error_code, get_index_name
+
+from search_helpers import LazyMetadata, UnsupportedSDKError, decode_page, query_fast
+from search_helpers.raw import TESTED_SDK_VERSIONS, http_client
+
+TRICKY_BODY = json.dumps(
+    {
+        "data": [
+            {
+                "id": "v1",
+                "clips": [{"start": 1.5, "end": 2.0}],
+                "user_metadata": {
+                    "note": '"user_metadata": {',
+                    "user_metadata": {"a": [1, {"b": "}]"}]},
+                    "views": 10,
+                },
+            },
+            {"id": "v2", "text": "ends with \\", "user_metadata": None},
+            {"id": "v3", "user_metadata": {"views": 3}},
+        ],
+        "page_info": {"next_page_token": "abc-1"},
+    }
+).encode("utf-8")
+
+
+def _sdk_rows(items):
+    rows = []
+    for item in items:
+        if item.clips is None:
+            rows.append((item.video_id, item.start, item.end, item.rank))
+            continue
+        for clip in item.clips:
+            rows.append((clip.video_id or item.id, clip.start, clip.end, clip.rank))
+    return rows
+
+
+class TestSearchFastPath:
+    """Raw-response fast path tests"""
+
+    def test_decode_page_keeps_user_metadata_raw(self):
+        """Test user_metadata is cut out undecoded and decodes to the original"""
+        expected = json.loads(TRICKY_BODY)
+
+        page = decode_page(TRICKY_BODY)
+        metadata = [item["user_metadata"] for item in page["data"]]
+
+        assert isinstance(metadata[0], LazyMetadata) and not metadata[0].decoded
+        assert metadata[1] is None
+        assert metadata[0].project(["views", "missing"]) == {"views": 10}
+        assert not metadata[0].decoded, "Projection should not decode the whole object"
+        assert dict(metadata[0]) == expected["data"][0]["user_metadata"]
+        assert dict(metadata[2]) == expected["data"][2]["user_metadata"]
+        assert page["page_info"] == expected["page_info"]
+        assert page["data"][0]["clips"] == expected["data"][0]["clips"]
+
+        projected = decode_page(TRICKY_BODY, fields=["user_metadata"])
+        assert projected["data"][0]["user_metadata"] == {
+            "user_metadata": {"a": [1, {"b": "}]"}]}
+        }
+        assert projected["data"][2]["user_metadata"] == {}
+
+    def test_moved_http_client_names_tested_sdks(self, client):
+        """Test a client without the SDK's internal HTTP client raises a clear error"""
+        assert http_client(client) is not None
+
+        moved = SimpleNamespace(search=SimpleNamespace(_raw_client=SimpleNamespace()))
+        with pytest.raises(UnsupportedSDKError) as e:
+            http_client(moved)
+        assert all(version in str(e.value) for version in TESTED_SDK_VERSIONS)
+
+        stripped = SimpleNamespace(httpx_client=SimpleNamespace(request=None))
+        moved.search._raw_client._client_wrapper = stripped
+        with pytest.raises(UnsupportedSDKError, match="stream, httpx_client"):
+            http_client(moved)
+
+    @pytest.mark.index_matrix
+    def test_fast_path_rows_match_sdk_clips(self, client, index_id, request):
+        """Test fast-path rows equal the SDK results across pages (group_by='clip')"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual", "audio"],
+            page_limit=5,
+        )
+
+        expected = _sdk_rows(client.search.query(**params))
+        rows = list(query_fast(client, **params).rows())
+
+        assert rows == expected
+
+    @pytest.mark.index_matrix
+    def test_fast_path_rows_match_sdk_videos(self, client, index_id, request):
+        """Test grouped results are flattened to one row per clip (group_by='video')"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual", "audio"],
+            group_by="video",
+            page_limit=10,
+        )
+
+        expected = _sdk_rows(client.search.query(**params).items)
+        page = next(query_fast(client, **params).iter_pages())
+
+        assert page.rows() == expected
+        columns = page.columns()
+        assert len(columns["video_id"]) == len(expected)
+        assert columns["start"].dtype == np.float64
+        assert columns["rank"].dtype == np.int64
+
+    @pytest.mark.index_matrix
+    def test_fast_path_models_on_demand(self, client, index_id, request):
+        """Test models built on demand equal the SDK's models"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual"],
+            group_by="video",
+            include_user_metadata=True,
+            page_limit=5,
+        )
+
+        expected = client.search.query(**params).items
+        page = next(query_fast(client, **params).iter_pages())
+        items = page.items()
+
+        assert [item.dict() for item in items] == [item.dict() for item in expected]
+        assert page.items() is items, "Models should be built only once per page"
+
+    @pytest.mark.index_matrix
+    def test_fast_path_error_matches_sdk(self, client, index_id, request):
+        """Test the fast path raises the SDK's error type and code (error case)"""
+        index_name = get_index_name(request)
+
+        with pytest.raises(ApiError) as exc_info:
+            query_fast(client, index_id=index_id, search_options=["visual"])
+
+        error_code = get_error_code(exc_info.value)
+        print(
+            f"\n[ERROR CODE] test_fast_path_error_matches_sdk (index: {index_name}): {error_code}"
+        )
+
+        expected_code = "parameter_not_provided"
+        assert (
+            error_code == expected_code
+        ), f"Expected error code: {expected_code}, actual error code: {error_code}"
+
+    @pytest.mark.index_matrix
+    def test_fast_path_lazy_metadata(self, client, index_id, request):
+        """Test lazily decoded user_metadata equals the SDK's (group_by='video')"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual"],
+            group_by="video",
+            include_user_metadata=True,
+            page_limit=5,
+        )
+
+        expected = client.search.query(**params).items
+        page = next(query_fast(client, lazy_metadata=True, **params).iter_pages())
+        lazy = [item.get("user_metadata") for item in page.data]
+
+        assert all(
+            metadata is None or isinstance(metadata, LazyMetadata) for metadata in lazy
+        )
+        assert not any(metadata is not None and metadata.decoded for metadata in lazy)
+        assert [None if metadata is None else dict(metadata) for metadata in lazy] == [
+            item.user_metadata for item in expected
+        ]
+        assert [item.dict() for item in page.items()] == [
+            item.dict() for item in expected
+        ]
+
+    @pytest.mark.index_matrix
+    def test_fast_path_metadata_projection(self, client, index_id, request):
+        """Test metadata_fields keeps only the listed user_metadata fields"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual"],
+            group_by="video",
+            include_user_metadata=True,
+            page_limit=5,
+        )
+
+        expected = client.search.query(**params).items
+        pager = query_fast(client, metadata_fields=["category"], **params)
+        page = next(pager.iter_pages())
+
+        for item, model in zip(page.data, expected):
+            if model.user_metadata is None:
+                assert item.get("user_metadata") is None
+                continue
+            assert item["user_metadata"] == {
+                name: value
+                for name, value in model.user_metadata.items()
+                if name == "category"
+            }
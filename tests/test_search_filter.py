@@ -17,14 +17,7 @@ from conftest import get_error_code, get_index_name, validate_marengo_fields
 class TestSearchFilter:
     """filter parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_filter(self, client, index_id, request):
         """Test filter parameter"""
         try:
@@ -48,14 +41,7 @@ class TestSearchFilter:
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_filter_various_formats(self, client, index_id, request):
         """Test various filter formats"""
         filter_formats = [
@@ -93,14 +79,7 @@ class TestSearchFilter:
                     continue
                 raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_filter_with_operator_and(self, client, index_id, request):
         """Test combination of filter and operator='and'"""
         try:
@@ -129,14 +108,7 @@ class TestSearchFilter:
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_filter_with_operator_or(self, client, index_id, request):
         """Test combination of filter and operator='or'"""
         try:
@@ -164,3 +136,57 @@ class TestSearchFilter:
             ):
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
+
+    @pytest.mark.index_matrix
+    def test_filter_results_match_metadata(self, client, index_id, request):
+        """Test every filtered result carries the filtered user metadata value"""
+        try:
+            search_pager = client.search.query(
+                index_id=index_id,
+                query_text="water",
+                search_options=["visual", "audio"],
+                filter='{"category": "nature"}',
+                include_user_metadata=True,
+                group_by="video",
+            )
+
+            results = list(search_pager)
+            assert len(results) >= 0
+
+            for item in results:
+                if item.user_metadata:
+                    assert (
+                        item.user_metadata.get("category") == "nature"
+                    ), f"Filtered result has other metadata: {item.user_metadata}"
+        except ApiError as e:
+            error_code = get_error_code(e)
+            if (
+                "invalid" in str(e).lower()
+                or "not supported" in str(e).lower()
+                or error_code == "search_filter_invalid"
+            ):
+                pytest.skip(f"Filter is not supported or invalid: {e}")
+            raise
+
+    @pytest.mark.index_matrix
+    def test_filter_invalid_syntax(self, client, index_id, request):
+        """Test filter that is not a valid JSON object (error case)"""
+        index_name = get_index_name(request)
+
+        with pytest.raises(ApiError) as exc_info:
+            client.search.query(
+                index_id=index_id,
+                query_text="test",
+                search_options=["visual", "audio"],
+                filter='{"category": "nature"',
+            )
+
+        error_code = get_error_code(exc_info.value)
+        print(
+            f"\n[ERROR CODE] test_filter_invalid_syntax (index: {index_name}): {error_code}"
+        )
+
+        expected_code = "search_filter_invalid"
+        assert (
+            error_code == expected_code
+        ), f"Expected error code: {expected_code}, actual error code: {error_code}"
@@ -22,14 +22,7 @@ from conftest import (
 class TestSearchGroupBy:
     """group_by parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_video(self, client, index_id, request):
         """Test group_by='video'"""
         search_pager = client.search.query(
@@ -54,14 +47,7 @@ class TestSearchGroupBy:
                     index_name = get_index_name(request)
                     validate_marengo_fields(item.clips[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_clip(self, client, index_id, request):
         """Test group_by='clip' (default value)"""
         search_pager = client.search.query(
@@ -79,14 +65,7 @@ class TestSearchGroupBy:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_video_with_operator_and(self, client, index_id, request):
         """Test combination of group_by='video' and operator='and'"""
         search_pager = client.search.query(
@@ -112,14 +91,7 @@ class TestSearchGroupBy:
                     index_name = get_index_name(request)
                     validate_marengo_fields(item.clips[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_video_with_operator_or(self, client, index_id, request):
         """Test combination of group_by='video' and operator='or'"""
         search_pager = client.search.query(
@@ -145,14 +117,7 @@ class TestSearchGroupBy:
                     index_name = get_index_name(request)
                     validate_marengo_fields(item.clips[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_clip_with_operator_and(self, client, index_id, request):
         """Test combination of group_by='clip' and operator='and'"""
         search_pager = client.search.query(
@@ -171,14 +136,7 @@ class TestSearchGroupBy:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_clip_with_operator_or(self, client, index_id, request):
         """Test combination of group_by='clip' and operator='or' (default value)"""
         search_pager = client.search.query(
@@ -197,14 +155,7 @@ class TestSearchGroupBy:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_video_with_page_limit(self, client, index_id, request):
         """Test combination of group_by='video' and page_limit"""
         page_limit = 3
@@ -233,14 +184,7 @@ class TestSearchGroupBy:
                         first_page_items[0].clips[0], index_name, request
                     )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_clip_with_page_limit(self, client, index_id, request):
         """Test combination of group_by='clip' and page_limit"""
         page_limit = 5
@@ -263,14 +207,7 @@ class TestSearchGroupBy:
                 index_name = get_index_name(request)
                 validate_marengo_fields(first_page_items[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_video_with_filter(self, client, index_id, request):
         """Test combination of group_by='video' and filter"""
         try:
@@ -304,14 +241,7 @@ class TestSearchGroupBy:
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_group_by_clip_with_filter(self, client, index_id, request):
         """Test combination of group_by='clip' and filter"""
         try:
@@ -0,0 +1,200 @@
+"""
+Hedged request tests
+
+Tests that search_helpers.hedging sends a second copy of slow search requests
+after a percentile-based delay, returns the first response, stays within its
+hedge budget and cuts the tail latency of a stand-in with heavy-tailed
+latencies.
+"""
+
+import threading
+import time
+
+import httpx
+import numpy as np
+import pytest
+
+from search_helpers.hedging import (
+    ENDPOINT_SEARCH,
+    ENDPOINT_SEARCH_PAGE,
+    HedgeBudget,
+    HedgingTransport,
+    endpoint_of,
+    hedge,
+)
+from standin import STANDIN_INDEX_MARENGO_27, LatencyModel, StandinServer
+
+PARAMS = dict(
+    index_id=STANDIN_INDEX_MARENGO_27,
+    query_text="water",
+    search_options=["visual", "audio"],
+    page_limit=5,
+)
+
+
+class SlowFirstAttempt:
+    """Transport wrapper that delays the first copy of every request."""
+
+    def __init__(self, inner, delay: float):
+        self.inner = inner
+        self.delay = delay
+        self.seen = set()
+        self.closed = []
+        self._lock = threading.Lock()
+
+    def handle_request(self, request):
+        key = (request.method, str(request.url), request.read())
+        with self._lock:
+            first = key not in self.seen
+            self.seen.add(key)
+        if first:
+            time.sleep(self.delay)
+        response = self.inner.handle_request(request)
+        if first:
+            self.closed.append(response)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class StreamingTransport:
+    """Transport whose responses are streamed (httpx.MockTransport reads them)."""
+
+    def handle_request(self, request):
+        return httpx.Response(200, content=iter([b'{"data": ', b"[]}"]))
+
+    def close(self):
+        pass
+
+
+def _heavy_tailed_server(**kwargs) -> StandinServer:
+    return StandinServer.with_default_indexes(
+        num_videos=50,
+        latency_model=LatencyModel.synthetic(
+            median_s=0.005, tail_fraction=0.05, seed=3
+        ),
+        **kwargs,
+    )
+
+
+def _latencies(client, searches: int):
+    samples = []
+    for _ in range(searches):
+        start = time.perf_counter()
+        client.search.query(**PARAMS)
+        samples.append(time.perf_counter() - start)
+    return np.asarray(samples)
+
+
+class TestSearchHedging:
+    """Hedged request tests"""
+
+    @pytest.mark.parametrize(
+        "method,path,expected",
+        [
+            ("POST", "/v1.3/search", ENDPOINT_SEARCH),
+            ("GET", "/v1.3/search/abc-1", ENDPOINT_SEARCH_PAGE),
+            ("GET", "/v1.3/indexes/abc", None),
+            ("GET", "/v1.3/search", None),
+        ],
+    )
+    def test_endpoint_of_search_requests(self, method, path, expected):
+        """Test only search and page requests are hedged"""
+        request = httpx.Request(method, "https://api.example" + path)
+
+        assert endpoint_of(request) == expected
+
+    def test_budget_caps_hedges(self):
+        """Test the budget grants at most burst + ratio * requests hedges"""
+        budget = HedgeBudget(ratio=0.1, burst=1.0)
+
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        for _ in range(10):
+            budget.earn()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        assert (budget.granted, budget.denied) == (2, 2)
+
+    def test_first_response_wins(self):
+        """Test a slow first attempt is answered by its hedge and then closed"""
+        server = StandinServer.with_default_indexes(num_videos=50)
+        slow = SlowFirstAttempt(server.transport(), delay=0.5)
+        client = server.make_client(httpx_client=httpx.Client(transport=slow))
+        transport = hedge(client, initial_delay=0.05)
+
+        start = time.perf_counter()
+        items = client.search.query(**PARAMS).items
+        elapsed = time.perf_counter() - start
+
+        assert len(items) == 5
+        assert elapsed < 0.3
+        assert (transport.hedged, transport.hedge_wins) == (1, 1)
+        time.sleep(0.7)
+        assert slow.closed and slow.closed[0].is_closed
+
+    @pytest.mark.parametrize("initial_delay", [None, 0.0])
+    def test_response_body_is_returned_unread(self, initial_delay):
+        """Test direct and hedged responses keep their body stream for incremental reads"""
+        transport = HedgingTransport(
+            StreamingTransport(),
+            initial_delay=initial_delay,
+            budget=HedgeBudget(ratio=1.0, burst=10),
+        )
+        request = httpx.Request("POST", "https://api.example/v1.3/search")
+
+        response = transport.handle_request(request)
+
+        assert not response.is_stream_consumed
+        assert b"".join(response.iter_raw()) == b'{"data": []}'
+        assert transport.hedged == (0 if initial_delay is None else 1)
+
+    def test_hedged_results_match_sdk(self):
+        """Test every request hedged at once still returns the same pages"""
+        server = StandinServer.with_default_indexes(num_videos=50)
+        expected = [item.dict() for item in server.make_client().search.query(**PARAMS)]
+        sent = sum(server.request_counts.values())
+        client = server.make_client()
+        transport = hedge(
+            client,
+            initial_delay=0.0,
+            min_samples=10_000,
+            budget=HedgeBudget(ratio=1.0, burst=1000),
+        )
+
+        items = [item.dict() for item in client.search.query(**PARAMS)]
+
+        assert items == expected
+        assert transport.hedged == sent
+        # a duplicate still queued when its primary answers is cancelled unsent
+        assert 2 * sent <= sum(server.request_counts.values()) <= 3 * sent
+
+    def test_delay_follows_latency_percentile(self):
+        """Test the hedge delay is the configured percentile of recent latencies"""
+        server = _heavy_tailed_server()
+        client = server.make_client()
+        transport = hedge(client, percentile=90.0, min_samples=20)
+
+        assert transport.delay(ENDPOINT_SEARCH) is None
+        _latencies(client, 30)
+
+        samples = list(transport.latencies[ENDPOINT_SEARCH])
+        assert len(samples) == 30
+        assert transport.delay(ENDPOINT_SEARCH) == pytest.approx(
+            np.percentile(samples, 90.0)
+        )
+        assert transport.hedged <= transport.budget.burst + 0.05 * 30
+
+    def test_hedging_cuts_tail_latency(self):
+        """Test p99 of a heavy-tailed stand-in drops while extra load stays in budget"""
+        plain = _latencies(_heavy_tailed_server().make_client(), 300)
+        server = _heavy_tailed_server()
+        client = server.make_client()
+        transport = hedge(client, budget=HedgeBudget(ratio=0.2, burst=2.0))
+
+        hedged = _latencies(client, 300)
+
+        assert np.percentile(hedged, 99) < np.percentile(plain, 99)
+        assert 0 < transport.hedged <= 2 + 0.2 * 300
+        assert 300 <= server.request_counts["search"] <= 300 + transport.hedged
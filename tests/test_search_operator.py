@@ -11,20 +11,13 @@ import pytest
 from twelvelabs.core.api_error import ApiError
 
 sys.path.insert(0, os.path.dirname(__file__))
-from conftest import get_index_name, validate_marengo_fields
+from conftest import get_index_name, is_marengo30, validate_marengo_fields
 
 
 class TestSearchOperator:
     """operator parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_operator_or(self, client, index_id, request):
         """Test operator='or' (default)"""
         search_pager = client.search.query(
@@ -42,14 +35,7 @@ class TestSearchOperator:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_operator_and(self, client, index_id, request):
         """Test operator='and'"""
         search_pager = client.search.query(
@@ -66,3 +52,63 @@ class TestSearchOperator:
         if len(results) > 0:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
+
+    @pytest.mark.index_matrix
+    def test_operator_and_narrows_or(self, client, index_id, request):
+        """Test that operator='and' returns a subset of operator='or'
+
+        Documentation: 'and' finds segments matching all search options,
+        'or' finds segments matching any search option.
+        """
+        results_by_operator = {}
+        for operator in ["or", "and"]:
+            search_pager = client.search.query(
+                index_id=index_id,
+                query_text="water",
+                search_options=["visual", "audio"],
+                operator=operator,
+                page_limit=50,
+            )
+            results_by_operator[operator] = [
+                (item.video_id, item.start, item.end) for item in search_pager
+            ]
+
+        or_clips = set(results_by_operator["or"])
+        and_clips = set(results_by_operator["and"])
+        assert len(and_clips) <= len(
+            or_clips
+        ), f"'and' should not return more clips than 'or' (and: {len(and_clips)}, or: {len(or_clips)})"
+        assert and_clips <= or_clips, (
+            f"Every clip matched with 'and' should also match with 'or'. "
+            f"Missing from 'or': {sorted(and_clips - or_clips)[:5]}"
+        )
+
+    @pytest.mark.index_matrix
+    def test_operator_results_ranked_across_pages(self, client, index_id, request):
+        """Test that merged results stay in relevance order across pages"""
+        search_pager = client.search.query(
+            index_id=index_id,
+            query_text="swimming",
+            search_options=["visual", "audio"],
+            operator="or",
+            page_limit=5,
+        )
+
+        results = []
+        for page in search_pager.iter_pages():
+            results.extend(page.items or [])
+            if len(results) >= 20:
+                break
+
+        if len(results) > 1:
+            index_name = get_index_name(request)
+            validate_marengo_fields(results[0], index_name, request)
+            if is_marengo30(index_name):
+                ranks = [r.rank for r in results]
+                assert ranks == sorted(ranks), f"Ranks should ascend: {ranks}"
+                assert len(set(ranks)) == len(ranks), f"Ranks should be unique: {ranks}"
+            else:
+                scores = [r.score for r in results]
+                assert scores == sorted(
+                    scores, reverse=True
+                ), f"Scores should descend: {scores}"
@@ -15,6 +15,7 @@ from conftest import (
     get_error_code,
     get_index_name,
     is_marengo30,
+    route_unsupported,
     validate_marengo_fields,
 )
 
@@ -22,14 +23,7 @@ from conftest import (
 class TestSearchOptions:
     """search_options parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_options_visual_and_audio(self, client, index_id, request):
         """Test visual and audio options combination"""
         search_pager = client.search.query(
@@ -44,15 +38,10 @@ class TestSearchOptions:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
-    def test_search_options_transcription(self, client, index_id, request):
+    @pytest.mark.index_matrix
+    def test_search_options_transcription(
+        self, client, index_id, index_capabilities, request
+    ):
         """Test transcription option
 
         Marengo 2.7: search_option_not_supported error expected
@@ -60,7 +49,7 @@ class TestSearchOptions:
         """
         index_name = get_index_name(request)
 
-        if is_marengo30(index_name):
+        if index_capabilities.supports(["transcription"]):
             # Marengo 3.0: should work normally
             search_pager = client.search.query(
                 index_id=index_id, query_text="hello", search_options=["transcription"]
@@ -74,9 +63,12 @@ class TestSearchOptions:
                 validate_marengo_fields(results[0], index_name, request)
         else:
             # Marengo 2.7: search_option_not_supported error expected
+            search_client, search_index_id = route_unsupported(
+                request, client, index_id, ["transcription"]
+            )
             with pytest.raises(ApiError) as exc_info:
-                client.search.query(
-                    index_id=index_id,
+                search_client.search.query(
+                    index_id=search_index_id,
                     query_text="hello",
                     search_options=["transcription"],
                 )
@@ -93,15 +85,10 @@ class TestSearchOptions:
                 error_code == expected_code
             ), f"Expected error code: {expected_code}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
-    def test_search_options_all_combined(self, client, index_id, request):
+    @pytest.mark.index_matrix
+    def test_search_options_all_combined(
+        self, client, index_id, index_capabilities, request
+    ):
         """Test all options combination
 
         Marengo 2.7: search_option_not_supported error expected
@@ -109,7 +96,7 @@ class TestSearchOptions:
         """
         index_name = get_index_name(request)
 
-        if is_marengo30(index_name):
+        if index_capabilities.supports(["visual", "audio", "transcription"]):
             # Marengo 3.0: should work normally
             search_pager = client.search.query(
                 index_id=index_id,
@@ -125,9 +112,12 @@ class TestSearchOptions:
                 validate_marengo_fields(results[0], index_name, request)
         else:
             # Marengo 2.7: search_option_not_supported error expected
+            search_client, search_index_id = route_unsupported(
+                request, client, index_id, ["visual", "audio", "transcription"]
+            )
             with pytest.raises(ApiError) as exc_info:
-                client.search.query(
-                    index_id=index_id,
+                search_client.search.query(
+                    index_id=search_index_id,
                     query_text="test",
                     search_options=["visual", "audio", "transcription"],
                 )
@@ -144,14 +134,7 @@ class TestSearchOptions:
                 error_code == expected_code
             ), f"Expected error code: {expected_code}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_options_visual_only(self, client, index_id, request):
         """Test search with visual option only"""
         search_pager = client.search.query(
@@ -166,14 +149,7 @@ class TestSearchOptions:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_options_audio_only(self, client, index_id, request):
         """Test search with audio option only"""
         search_pager = client.search.query(
@@ -187,3 +163,105 @@ class TestSearchOptions:
         if len(results) > 0:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
+
+    @pytest.mark.index_matrix
+    def test_search_options_combined_covers_single(self, client, index_id, request):
+        """Test that visual+audio (operator='or') includes every visual-only match"""
+        clips_by_options = {}
+        for options in [("visual",), ("visual", "audio")]:
+            search_pager = client.search.query(
+                index_id=index_id,
+                query_text="animal",
+                search_options=list(options),
+                operator="or",
+                page_limit=50,
+            )
+            clips_by_options[options] = {
+                (item.video_id, item.start, item.end) for item in search_pager
+            }
+
+        visual_only = clips_by_options[("visual",)]
+        combined = clips_by_options[("visual", "audio")]
+        assert visual_only <= combined, (
+            f"Adding a search option with operator='or' should not drop matches. "
+            f"Dropped: {sorted(visual_only - combined)[:5]}"
+        )
+
+    @pytest.mark.index_matrix
+    def test_search_options_ranking_order(self, client, index_id, request):
+        """Test that each search option combination returns results in relevance order"""
+        index_name = get_index_name(request)
+
+        for options in [["visual"], ["audio"], ["visual", "audio"]]:
+            search_pager = client.search.query(
+                index_id=index_id,
+                query_text="water",
+                search_options=options,
+                page_limit=10,
+            )
+            results = list(search_pager.items or [])
+            if len(results) < 2:
+                continue
+
+            validate_marengo_fields(results[0], index_name, request)
+            if is_marengo30(index_name):
+                ranks = [r.rank for r in results]
+                assert ranks == sorted(
+                    ranks
+                ), f"Ranks should ascend for {options}: {ranks}"
+            else:
+                scores = [r.score for r in results]
+                assert scores == sorted(
+                    scores, reverse=True
+                ), f"Scores should descend for {options}: {scores}"
+
+    @pytest.mark.index_matrix
+    def test_search_options_transcription_lexical(
+        self, client, index_id, index_capabilities, request
+    ):
+        """Test transcription option with transcription_options=['lexical']
+
+        Marengo 2.7: search_option_not_supported error expected
+        Marengo 3.0: every result's transcription contains the query word (exact word matching)
+        """
+        index_name = get_index_name(request)
+
+        if index_capabilities.supports(["transcription"]):
+            search_pager = client.search.query(
+                index_id=index_id,
+                query_text="hello",
+                search_options=["transcription"],
+                transcription_options=["lexical"],
+            )
+
+            results = list(search_pager)
+            assert len(results) >= 0
+
+            if len(results) > 0:
+                validate_marengo_fields(results[0], index_name, request)
+            for item in results:
+                if item.transcription is not None:
+                    assert (
+                        "hello" in item.transcription.lower()
+                    ), f"Lexical match should contain the query word: {item.transcription}"
+        else:
+            search_client, search_index_id = route_unsupported(
+                request, client, index_id, ["transcription"]
+            )
+            with pytest.raises(ApiError) as exc_info:
+                search_client.search.query(
+                    index_id=search_index_id,
+                    query_text="hello",
+                    search_options=["transcription"],
+                    transcription_options=["lexical"],
+                )
+
+            error_code = get_error_code(exc_info.value)
+            print(
+                f"\n[ERROR CODE] test_search_options_transcription_lexical (index: {index_name}): {error_code}"
+            )
+
+            expected_code = "search_option_not_supported"
+            assert (
+                error_code == expected_code
+            ), f"Expected error code: {expected_code}, actual error code: {error_code}"
@@ -17,14 +17,7 @@ from conftest import get_error_code, get_index_name, validate_marengo_fields
 class TestSearchPageLimit:
     """page_limit parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_page_limit(self, client, index_id, request):
         """Test page_limit parameter"""
         page_limit = 5
@@ -45,14 +38,7 @@ class TestSearchPageLimit:
             index_name = get_index_name(request)
             validate_marengo_fields(first_page_items[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_page_limit_max(self, client, index_id, request):
         """Test page_limit maximum value (50)"""
         search_pager = client.search.query(
@@ -69,14 +55,7 @@ class TestSearchPageLimit:
             index_name = get_index_name(request)
             validate_marengo_fields(first_page_items[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_page_limit_minimal(self, client, index_id, request):
         """Test minimum page_limit"""
         search_pager = client.search.query(
@@ -94,14 +73,7 @@ class TestSearchPageLimit:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_page_limit_various_values(self, client, index_id, request):
         """Test various page_limit values"""
         for page_limit in [1, 5, 10, 25, 50]:
@@ -123,14 +95,7 @@ class TestSearchPageLimit:
                     index_name = get_index_name(request)
                     validate_marengo_fields(first_page_items[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_pagination(self, client, index_id, request):
         """Test pagination"""
         search_pager = client.search.query(
@@ -160,14 +125,7 @@ class TestSearchPageLimit:
                     index_name = get_index_name(request)
                     validate_marengo_fields(next_page[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_page_limit_zero(self, client, index_id, request):
         """Test page_limit=0 (edge case)
 
@@ -198,14 +156,7 @@ class TestSearchPageLimit:
                     error_code != ""
                 ), f"Error code could not be extracted. Error: {e}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_page_limit_above_max(self, client, index_id, request):
         """Test page_limit=51 (just above maximum value)"""
         try:
@@ -225,14 +176,7 @@ class TestSearchPageLimit:
             else:
                 raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_pagination_multiple_pages(self, client, index_id, request):
         """Test pagination with multiple pages (3+ pages)"""
         search_pager = client.search.query(
@@ -267,14 +211,7 @@ class TestSearchPageLimit:
         assert pages_visited >= 1, "At least one page should be visited"
         assert total_items >= 0, "Total items should be non-negative"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_pagination_iter_pages(self, client, index_id, request):
         """Test iter_pages() method"""
         search_pager = client.search.query(
@@ -0,0 +1,158 @@
+"""
+Pairwise combination tests
+
+Runs search.query over a pairwise covering array of its parameters and the
+run's index matrix (tests/covering_array.py, tests/plugins/index_matrix.py):
+every pair of parameter values is exercised by at least one test, in a few
+dozen calls instead of the full product. ``transcription`` is only combined
+with Marengo 3.0 indexes.
+"""
+
+import os
+import sys
+
+import pytest
+from twelvelabs.core.api_error import ApiError
+
+sys.path.insert(0, os.path.dirname(__file__))
+from conftest import get_error_code, validate_marengo_fields
+
+from tests import covering_array
+from tests.plugins import index_matrix
+from tests.plugins.capabilities import MARENGO_27, MARENGO_30
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the pairwise test over the covering array of the index matrix."""
+    if metafunc.definition.name != "test_search_parameter_pairs":
+        return
+    specs = {spec.name: spec for spec in index_matrix.matrix(metafunc.config)}
+    rows = covering_array.search_rows(
+        strength=2,
+        indexes={name: spec.model_name for name, spec in specs.items()},
+    )
+    metafunc.parametrize(
+        "index_id,case",
+        [
+            pytest.param(
+                row["index_id"],
+                row,
+                marks=index_matrix.marks(metafunc.config, specs[row["index_id"]]),
+                id=f"{row['index_id']}-{covering_array.row_id(row)}",
+            )
+            for row in rows
+        ],
+        indirect=["index_id"],
+    )
+
+
+def query_kwargs(case: dict) -> dict:
+    """search.query keyword arguments for a covering array row (without index_id)."""
+    return {
+        name: list(value) if isinstance(value, tuple) else value
+        for name, value in case.items()
+        if name != "index_id" and value is not None
+    }
+
+
+class TestCoveringArray:
+    """Covering array generator tests"""
+
+    @pytest.mark.parametrize("strength", [2, 3])
+    def test_search_rows_cover_every_combination(self, strength):
+        """Test the array covers every valid t-way combination of search parameters"""
+        rows = covering_array.search_rows(strength)
+        total = sum(
+            1
+            for _ in covering_array.product(
+                covering_array.SEARCH_PARAMETERS, covering_array.SEARCH_CONSTRAINTS
+            )
+        )
+
+        assert not covering_array.uncovered(
+            rows,
+            covering_array.SEARCH_PARAMETERS,
+            strength,
+            covering_array.SEARCH_CONSTRAINTS,
+        )
+        assert len(rows) < total / 10
+
+    def test_search_rows_respect_constraints(self):
+        """Test no row sorts clips by clip_count or asks Marengo 2.7 for transcription"""
+        for row in covering_array.search_rows(strength=3):
+            assert not (
+                row["sort_option"] == "clip_count" and row["group_by"] == "clip"
+            )
+            assert not (
+                "transcription" in row["search_options"]
+                and row["index_id"] == "index_marengo27"
+            )
+
+    def test_search_space_follows_index_models(self):
+        """Test every configured index is covered and only Marengo 3.0 gets transcription"""
+        indexes = {
+            "index_a": MARENGO_27,
+            "index_b": MARENGO_30,
+            "index_c": MARENGO_30,
+            "index_d": None,
+        }
+
+        rows = covering_array.search_rows(strength=2, indexes=indexes)
+
+        assert {row["index_id"] for row in rows} == set(indexes)
+        transcription = {
+            row["index_id"] for row in rows if "transcription" in row["search_options"]
+        }
+        assert transcription == {"index_b", "index_c"}
+        parameters, constraints = covering_array.search_space(indexes)
+        assert not covering_array.uncovered(rows, parameters, 2, constraints)
+
+    def test_pairwise_is_smaller_than_product(self):
+        """Test the pairwise array of 3 binary parameters needs 4 rows, not 8"""
+        parameters = {"a": (0, 1), "b": (0, 1), "c": (0, 1)}
+
+        rows = covering_array.covering_array(parameters, strength=2)
+
+        assert len(rows) == 4
+        assert not covering_array.uncovered(rows, parameters, 2)
+
+    def test_uncoverable_tuples_are_not_required(self):
+        """Test value pairs excluded by a constraint need no row"""
+        parameters = {"a": (0, 1), "b": (0, 1)}
+
+        def no_double_one(row):
+            return not (row.get("a") == 1 and row.get("b") == 1)
+
+        rows = covering_array.covering_array(parameters, 2, [no_double_one])
+
+        assert len(rows) == 3
+        assert all(no_double_one(row) for row in rows)
+
+
+class TestSearchPairwise:
+    """search.query over the pairwise covering array"""
+
+    def test_search_parameter_pairs(self, client, index_id, case):
+        """Test one covering array row returns a well-formed first page"""
+        try:
+            search_pager = client.search.query(index_id=index_id, **query_kwargs(case))
+        except ApiError as e:
+            if case["filter"] and (
+                "not supported" in str(e).lower()
+                or get_error_code(e) == "search_filter_invalid"
+            ):
+                pytest.skip(f"Filter is not supported or invalid: {e}")
+            raise
+
+        items = search_pager.items or []
+        assert len(items) <= case["page_limit"]
+        for item in items:
+            if case["group_by"] == "video":
+                assert item.id is not None, "id should exist when grouped by video"
+                assert (
+                    item.clips is not None
+                ), "clips should exist when grouped by video"
+                if item.clips:
+                    validate_marengo_fields(item.clips[0], case["index_id"])
+            else:
+                validate_marengo_fields(item, case["index_id"])
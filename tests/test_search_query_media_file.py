@@ -39,14 +39,7 @@ def get_rhino_image_path():
 class TestSearchQueryMediaFile:
     """query_media_file parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file(self, client, index_id, request):
         """Test successful search with image file"""
         image_path = get_rhino_image_path()
@@ -68,14 +61,7 @@ class TestSearchQueryMediaFile:
                 index_name = get_index_name(request)
                 validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_visual_only(self, client, index_id, request):
         """Test image file search with visual option only"""
         image_path = get_rhino_image_path()
@@ -95,14 +81,7 @@ class TestSearchQueryMediaFile:
                 index_name = get_index_name(request)
                 validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_audio_only(self, client, index_id, request):
         """Test image file search with audio option only
 
@@ -116,14 +95,7 @@ class TestSearchQueryMediaFile:
             f"This constraint is not documented in search.md (index: {index_name})"
         )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_and_group_by_video(self, client, index_id, request):
         """Test image file search with group_by='video'"""
         image_path = get_rhino_image_path()
@@ -152,14 +124,7 @@ class TestSearchQueryMediaFile:
                         index_name = get_index_name(request)
                         validate_marengo_fields(item.clips[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_and_page_limit(self, client, index_id, request):
         """Test image file search with page_limit"""
         image_path = get_rhino_image_path()
@@ -185,14 +150,7 @@ class TestSearchQueryMediaFile:
                     index_name = get_index_name(request)
                     validate_marengo_fields(first_page_items[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_and_filter(self, client, index_id, request):
         """Test image file search with filter"""
         image_path = get_rhino_image_path()
@@ -223,14 +181,7 @@ class TestSearchQueryMediaFile:
                 pytest.skip(f"Filter is not supported or invalid: {e}")
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_and_sort_option(self, client, index_id, request):
         """Test image file search with sort_option"""
         image_path = get_rhino_image_path()
@@ -251,14 +202,7 @@ class TestSearchQueryMediaFile:
                 index_name = get_index_name(request)
                 validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_image_file_and_operator(self, client, index_id, request):
         """Test image file search with operator"""
         image_path = get_rhino_image_path()
@@ -279,13 +223,7 @@ class TestSearchQueryMediaFile:
                 index_name = get_index_name(request)
                 validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix(model="marengo3.0")
     def test_search_with_image_file_and_text_composed(self, client, index_id, request):
         """Test composed search with image file and text query (Marengo 3.0 only)
 
@@ -312,14 +250,7 @@ class TestSearchQueryMediaFile:
             if len(results) > 0:
                 validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_without_query_media_type(self, client, index_id, request):
         """Test error when query_media_file is provided without query_media_type"""
         image_path = get_rhino_image_path()
@@ -345,14 +276,7 @@ class TestSearchQueryMediaFile:
             error_code in expected_codes
         ), f"Expected error code: {expected_codes}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_without_query_media_file_or_text(self, client, index_id, request):
         """Test error when query_media_type is provided without query_media_file or query_text"""
         with pytest.raises((ApiError, BadRequestError)) as exc_info:
@@ -375,14 +299,7 @@ class TestSearchQueryMediaFile:
             error_code == expected_code
         ), f"Expected error code: {expected_code}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_invalid_image_file(self, client, index_id, request):
         """Test error when invalid file is provided"""
         # Create a temporary invalid file (text file instead of image)
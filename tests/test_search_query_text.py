@@ -26,14 +26,7 @@ from conftest import (
 class TestSearchQueryText:
     """query_text parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_text_query(self, client, index_id, request):
         """Test successful search with basic text query"""
         search_pager = client.search.query(
@@ -51,14 +44,7 @@ class TestSearchQueryText:
         index_name = get_index_name(request)
         validate_marengo_fields(first_result, index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_different_query_text(self, client, index_id, request):
         """Test search with different text query"""
         search_pager = client.search.query(
@@ -75,14 +61,7 @@ class TestSearchQueryText:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_empty_query_text(self, client, index_id, request):
         """Test empty query text
 
@@ -108,14 +87,7 @@ class TestSearchQueryText:
             error_code in expected_codes
         ), f"Expected error code: {expected_codes}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_very_long_query_text(self, client, index_id, request):
         """Test very long query text
 
@@ -161,14 +133,7 @@ class TestSearchQueryText:
                 error_code == expected_code
             ), f"Expected error code: {expected_code}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_without_query_text_or_media(self, client, index_id, request):
         """Test when both query text and media are missing
 
@@ -192,14 +157,7 @@ class TestSearchQueryText:
             error_code == expected_code
         ), f"Expected error code: {expected_code}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_whitespace_only_query_text(self, client, index_id, request):
         """Test query text with only whitespace characters"""
         with pytest.raises((ApiError, BadRequestError)) as exc_info:
@@ -221,14 +179,7 @@ class TestSearchQueryText:
             error_code in expected_codes
         ), f"Expected error code: {expected_codes}, actual error code: {error_code}"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_special_characters_query_text(self, client, index_id, request):
         """Test query text with special characters"""
         search_pager = client.search.query(
@@ -244,14 +195,7 @@ class TestSearchQueryText:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_unicode_emoji_query_text(self, client, index_id, request):
         """Test query text with unicode and emoji characters"""
         search_pager = client.search.query(
@@ -267,14 +211,7 @@ class TestSearchQueryText:
             index_name = get_index_name(request)
             validate_marengo_fields(results[0], index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_with_very_short_query_text(self, client, index_id, request):
         """Test query text with very short query (1-2 words)"""
         search_pager = client.search.query(
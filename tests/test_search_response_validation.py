@@ -16,14 +16,7 @@ from conftest import get_index_name, is_marengo30, validate_marengo_fields
 class TestSearchResponseValidation:
     """Response validation tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_structure(self, client, index_id, request):
         """Validate search response structure"""
         search_pager = client.search.query(
@@ -38,14 +31,7 @@ class TestSearchResponseValidation:
             # Validate fields by Marengo version
             validate_marengo_fields(item, index_name, request)
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_with_rank(self, client, index_id, request):
         """Validate rank field (Marengo 3.0)"""
         search_pager = client.search.query(
@@ -65,14 +51,7 @@ class TestSearchResponseValidation:
                     r > 0 for r in ranks
                 ), "rank must be greater than or equal to 1"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_with_thumbnail_url(self, client, index_id, request):
         """Validate thumbnail_url field"""
         search_pager = client.search.query(
@@ -93,14 +72,7 @@ class TestSearchResponseValidation:
                         "http"
                     ), "thumbnail_url must be in URL format"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_time_range(self, client, index_id, request):
         """Validate time range validity"""
         search_pager = client.search.query(
@@ -117,14 +89,7 @@ class TestSearchResponseValidation:
                 assert item.start >= 0, "start must be greater than or equal to 0"
                 assert item.end > item.start, "end must be greater than start"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_video_id_format(self, client, index_id, request):
         """Validate video_id field format"""
         search_pager = client.search.query(
@@ -141,14 +106,7 @@ class TestSearchResponseValidation:
                     assert isinstance(item.video_id, str), "video_id must be a string"
                     assert len(item.video_id) > 0, "video_id must not be empty"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_transcription_field(self, client, index_id, request):
         """Validate transcription field type"""
         search_pager = client.search.query(
@@ -166,14 +124,7 @@ class TestSearchResponseValidation:
                         item.transcription, str
                     ), "transcription must be a string or None"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_user_metadata(self, client, index_id, request):
         """Validate user_metadata field when group_by='video'"""
         search_pager = client.search.query(
@@ -200,14 +151,7 @@ class TestSearchResponseValidation:
                             item.user_metadata, dict
                         ), "user_metadata must be a dictionary or None"
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_search_response_clips_structure(self, client, index_id, request):
         """Validate clips array structure when group_by='video'"""
         search_pager = client.search.query(
@@ -22,14 +22,7 @@ from conftest import (
 class TestSearchSortOption:
     """sort_option parameter tests"""
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_sort_option_score(self, client, index_id, request):
         """Test sort_option='score'
 
@@ -69,14 +62,7 @@ class TestSearchSortOption:
                         f"Actual order: {scores}, expected order: {sorted_scores}"
                     )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_sort_option_score_with_group_by_video(self, client, index_id, request):
         """Test sort_option='score' with group_by='video' combination
 
@@ -135,14 +121,7 @@ class TestSearchSortOption:
                                     f"Actual order: {scores}, expected order: {sorted_scores}"
                                 )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_sort_option_clip_count_with_group_by_video(
         self, client, index_id, request
     ):
@@ -208,14 +187,7 @@ class TestSearchSortOption:
                                     f"Actual order: {scores}, expected order: {sorted_scores}"
                                 )
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_sort_option_score_with_filter(self, client, index_id, request):
         """Test sort_option='score' with filter combination
 
@@ -266,14 +238,7 @@ class TestSearchSortOption:
                 pass
             raise
 
-    @pytest.mark.parametrize(
-        "index_id",
-        [
-            pytest.param("index_marengo27", marks=pytest.mark.marengo27),
-            pytest.param("index_marengo30", marks=pytest.mark.marengo30),
-        ],
-        indirect=True,
-    )
+    @pytest.mark.index_matrix
     def test_sort_option_clip_count_with_filter(self, client, index_id, request):
         """Test sort_option='clip_count' with filter combination (group_by='video' required)
 
@@ -0,0 +1,113 @@
+"""
+Streaming decode tests
+
+Tests that search_helpers.query_streaming yields the same SearchItems as
+client.search.query, and that items are decoded before the body is complete.
+"""
+
+import json
+import os
+import random
+import sys
+
+import pytest
+from twelvelabs.core.api_error import ApiError
+
+sys.path.insert(0, os.path.dirname(__file__))
+from conftest import get_error_code, get_index_name
+
+from search_helpers.streaming import ItemStreamDecoder, query_streaming
+
+TRICKY_PAGE = {
+    "page_info": {"next_page_token": "abc-1", "note": 'a "data" [field]'},
+    "data": [
+        {"id": "v1", "clips": [{"start": 1.5, "text": '}{][\\"'}]},
+        {"id": "v2", "user_metadata": {"data": [1, {"data": "x"}]}},
+        {"id": "v3"},
+    ],
+    "search_pool": {"data": "not items"},
+}
+
+
+class TestSearchStreaming:
+    """Streaming decode tests"""
+
+    def test_decoder_splits_items_across_any_chunking(self):
+        """Test items and envelope are recovered whatever the chunk boundaries"""
+        body = json.dumps(TRICKY_PAGE).encode("utf-8")
+        rng = random.Random(0)
+
+        for _ in range(200):
+            decoder = ItemStreamDecoder()
+            items = []
+            offset = 0
+            while offset < len(body):
+                size = rng.randint(1, 9)
+                items.extend(decoder.feed(body[offset : offset + size]))
+                offset += size
+
+            assert [json.loads(item) for item in items] == TRICKY_PAGE["data"]
+            assert decoder.envelope() == dict(TRICKY_PAGE, data=[])
+
+    def test_decoder_yields_items_before_body_completes(self):
+        """Test each item is available as soon as its closing brace arrives"""
+        body = json.dumps(TRICKY_PAGE).encode("utf-8")
+        first_item_end = body.index(b'"v2"')
+
+        decoder = ItemStreamDecoder()
+        early = decoder.feed(body[:first_item_end])
+
+        assert [json.loads(item)["id"] for item in early] == ["v1"]
+
+    @pytest.mark.index_matrix
+    def test_streaming_matches_sdk_across_pages(self, client, index_id, request):
+        """Test streamed items equal the SDK's items across pages (group_by='clip')"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual", "audio"],
+            page_limit=5,
+        )
+
+        expected = [item.dict() for item in client.search.query(**params)]
+        streamed = [item.dict() for item in query_streaming(client, **params)]
+
+        assert streamed == expected
+
+    @pytest.mark.index_matrix
+    def test_streaming_grouped_with_metadata(self, client, index_id, request):
+        """Test streamed grouped items with user_metadata equal the SDK's first page"""
+        params = dict(
+            index_id=index_id,
+            query_text="water",
+            search_options=["visual", "audio"],
+            group_by="video",
+            include_user_metadata=True,
+            page_limit=10,
+        )
+
+        expected = [item.dict() for item in client.search.query(**params).items]
+        pager = query_streaming(client, **params)
+        first_page = [item.dict() for item in next(pager.iter_pages())]
+
+        assert first_page == expected
+        assert pager.page_info.get("limit_per_page") == 10
+
+    @pytest.mark.index_matrix
+    def test_streaming_error_matches_sdk(self, client, index_id, request):
+        """Test streaming raises the SDK's error type and code on iteration (error case)"""
+        index_name = get_index_name(request)
+        pager = query_streaming(client, index_id=index_id, search_options=["visual"])
+
+        with pytest.raises(ApiError) as exc_info:
+            list(pager)
+
+        error_code = get_error_code(exc_info.value)
+        print(
+            f"\n[ERROR CODE] test_streaming_error_matches_sdk (index: {index_name}): {error_code}"
+        )
+
+        expected_code = "parameter_not_provided"
+        assert (
+            error_code == expected_code
+        ), f"Expected error code: {expected_code}, actual error code: {error_code}"
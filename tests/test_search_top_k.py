@@ -0,0 +1,106 @@
+"""
+Top-k early termination tests
+
+Tests that search_helpers.top_k and query_top_k return the same first k items
+as iterating client.search.query, size pages from k, and never request a page
+beyond the one that completes k.
+"""
+
+import itertools
+
+import pytest
+
+from search_helpers import page_limit_for, query_top_k, top_k
+from standin import STANDIN_INDEX_MARENGO_27, StandinServer
+
+PARAMS = dict(query_text="water", search_options=["visual", "audio"])
+
+
+@pytest.fixture
+def server():
+    """A fresh stand-in, so request counts start at zero."""
+    return StandinServer.with_default_indexes()
+
+
+def _pages(server) -> int:
+    return server.request_counts["search"] + server.request_counts["search_page"]
+
+
+class TestSearchTopK:
+    """Top-k early termination tests"""
+
+    @pytest.mark.parametrize(
+        "k,expected",
+        [(1, 1), (10, 10), (50, 50), (51, 26), (60, 30), (100, 50), (101, 34)],
+    )
+    def test_page_limit_for_k(self, k, expected):
+        """Test k is split evenly over the fewest pages of at most 50"""
+        assert page_limit_for(k) == expected
+
+    @pytest.mark.index_matrix
+    def test_top_k_matches_sdk(self, client, index_id, request):
+        """Test query_top_k returns the SDK's first k items"""
+        expected = [
+            item.dict()
+            for item in itertools.islice(
+                client.search.query(index_id=index_id, page_limit=5, **PARAMS), 12
+            )
+        ]
+
+        result = query_top_k(client, 12, index_id=index_id, **PARAMS)
+
+        assert [item.dict() for item in result] == expected
+        assert result.page_limit == 12
+        assert result.requests == 1
+
+    @pytest.mark.parametrize("k", [4, 5, 6, 10, 11])
+    def test_top_k_never_fetches_past_k(self, server, k):
+        """Test only the pages holding the first k items are requested (page_limit=5)"""
+        pager = server.make_client().search.query(
+            index_id=STANDIN_INDEX_MARENGO_27, page_limit=5, **PARAMS
+        )
+
+        result = top_k(pager, k)
+
+        assert len(result) == k
+        assert result.requests == -(-k // 5)
+        assert _pages(server) == result.requests
+        assert result.has_more
+
+    def test_query_top_k_reports_requests_saved(self, server):
+        """Test the requests saved are those a full drain at the same page size needs"""
+        client = server.make_client()
+
+        result = query_top_k(client, 60, index_id=STANDIN_INDEX_MARENGO_27, **PARAMS)
+
+        assert result.page_limit == 30
+        assert result.requests == 2 == _pages(server)
+        assert result.total_results > 60
+        assert result.drain_requests == -(-result.total_results // 30)
+        assert result.requests_saved == result.drain_requests - 2
+
+    def test_top_k_beyond_total_reads_everything(self, server):
+        """Test a k above total_results returns every item and saves nothing"""
+        client = server.make_client()
+        total = len(
+            list(
+                client.search.query(
+                    index_id=STANDIN_INDEX_MARENGO_27, page_limit=50, **PARAMS
+                )
+            )
+        )
+
+        result = query_top_k(
+            client, total + 10, index_id=STANDIN_INDEX_MARENGO_27, **PARAMS
+        )
+
+        assert len(result) == total
+        assert not result.has_more
+        assert result.requests_saved == 0
+
+    def test_k_must_be_positive(self, server):
+        """Test k below 1 is rejected before any request"""
+        with pytest.raises(ValueError):
+            query_top_k(server.make_client(), 0, index_id=STANDIN_INDEX_MARENGO_27)
+
+        assert _pages(server) == 0
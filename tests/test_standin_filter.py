@@ -0,0 +1,113 @@
+"""
+Local stand-in metadata filter tests
+
+Validates filter compilation and evaluation against per-field secondary indexes,
+and that filtered searches only ever return clips of matching videos.
+"""
+
+import numpy as np
+import pytest
+from twelvelabs.core.api_error import ApiError
+
+from standin import STANDIN_INDEX_MARENGO_30
+from standin.filters import (
+    FilterCache,
+    FilterSyntaxError,
+    MetadataIndex,
+    compile_filter,
+)
+
+VIDEOS = [
+    {"id": "a", "duration": 10.0, "user_metadata": {"category": "nature", "views": 5}},
+    {"id": "b", "duration": 30.0, "user_metadata": {"category": "city", "views": 1}},
+    {"id": "c", "duration": 20.0, "user_metadata": {"category": "nature", "views": 0}},
+    {"id": "d", "duration": 40.0, "user_metadata": {"flag": True, "views": 12}},
+    {"id": "e", "duration": 50.0, "user_metadata": {"flag": 1}},
+]
+
+
+def _matching_ids(filter_text):
+    mask = MetadataIndex(VIDEOS).evaluate(compile_filter(filter_text))
+    return [VIDEOS[i]["id"] for i in np.flatnonzero(mask)]
+
+
+class TestStandinFilter:
+    """Stand-in metadata filter tests"""
+
+    @pytest.mark.parametrize(
+        "filter_text, expected",
+        [
+            ('{"category": "nature"}', ["a", "c"]),
+            ('{"category": "nature", "views": 0}', ["c"]),
+            ('{"id": ["b", "d", "zzz"]}', ["b", "d"]),
+            ('{"duration": {"gte": 20, "lt": 50}}', ["b", "c", "d"]),
+            ('{"views": {"gt": 1}}', ["a", "d"]),
+            ('{"flag": true}', ["d"]),
+            ('{"flag": 1}', ["e"]),
+            ('{"missing": "x"}', []),
+            ("{}", ["a", "b", "c", "d", "e"]),
+        ],
+    )
+    def test_filter_evaluation(self, filter_text, expected):
+        """Test equality, any-of, range and boolean conditions"""
+        assert _matching_ids(filter_text) == expected
+
+    @pytest.mark.parametrize(
+        "filter_text",
+        [
+            '{"category": "nature"',
+            '["category"]',
+            '"nature"',
+            '{"views": {"between": [1, 2]}}',
+            '{"views": {"gte": "1"}}',
+            '{"views": {}}',
+            '{"category": null}',
+            '{"category": [["nature"]]}',
+        ],
+    )
+    def test_invalid_filter_syntax(self, filter_text):
+        """Test malformed filters raise FilterSyntaxError"""
+        with pytest.raises(FilterSyntaxError):
+            compile_filter(filter_text)
+
+    def test_filter_cache_compiles_once(self):
+        """Test the cache returns the same compiled filter for repeated text"""
+        cache = FilterCache(max_size=2)
+        first = cache.compile('{"category": "nature"}')
+
+        assert cache.compile('{"category": "nature"}') is first
+        cache.compile('{"a": 1}')
+        cache.compile('{"b": 2}')
+        assert len(cache) == 2
+        assert cache.compile('{"category": "nature"}') is not first
+
+    def test_selective_filter_returns_only_matching_video(self, standin_server):
+        """Test a single-video filter returns that video's clips even for unrelated queries"""
+        video_id = standin_server.indexes[STANDIN_INDEX_MARENGO_30].corpus.videos[7][
+            "id"
+        ]
+        client = standin_server.make_client()
+        search_pager = client.search.query(
+            index_id=STANDIN_INDEX_MARENGO_30,
+            query_text="water",
+            search_options=["visual", "audio"],
+            filter=f'{{"id": ["{video_id}"]}}',
+            page_limit=50,
+        )
+
+        results = list(search_pager)
+        assert len(results) > 0
+        assert {item.video_id for item in results} == {video_id}
+
+    def test_invalid_filter_error_code(self, standin_server):
+        """Test the server maps bad filter syntax to search_filter_invalid"""
+        client = standin_server.make_client()
+        with pytest.raises(ApiError) as exc_info:
+            client.search.query(
+                index_id=STANDIN_INDEX_MARENGO_30,
+                query_text="water",
+                search_options=["visual"],
+                filter='{"views": {"near": 3}}',
+            )
+
+        assert exc_info.value.body["code"] == "search_filter_invalid"
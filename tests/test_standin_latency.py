@@ -0,0 +1,152 @@
+"""
+Local stand-in latency replay tests
+
+Validates recording live request latencies, fitting per-shape distributions with
+backoff, and delaying stand-in responses by sampled latencies.
+"""
+
+import json
+import time
+
+import httpx
+import numpy as np
+
+from standin import (
+    MARENGO_30,
+    STANDIN_BASE_URL,
+    STANDIN_INDEX_MARENGO_30,
+    LatencyModel,
+    RecordingTransport,
+    StandinServer,
+)
+from standin.latency import ENDPOINT_SEARCH, ENDPOINT_SEARCH_PAGE, request_shape
+
+
+def _records(endpoint, model, page_limit, group_by, latencies):
+    return [
+        {
+            "endpoint": endpoint,
+            "model": model,
+            "page_limit": page_limit,
+            "group_by": group_by,
+            "query_kind": "text",
+            "status": 200,
+            "latency_s": latency,
+        }
+        for latency in latencies
+    ]
+
+
+class TestStandinLatency:
+    """Stand-in latency replay tests"""
+
+    def test_specific_shape_used_when_enough_samples(self):
+        """Test a shape with enough samples uses its own distribution, others back off"""
+        records = _records("search", MARENGO_30, 50, "video", [1.0] * 30) + _records(
+            "search", MARENGO_30, 10, "clip", [0.1] * 30
+        )
+        model = LatencyModel.from_records(records, min_samples=20)
+
+        assert model.sample(request_shape("search", MARENGO_30, 50, "video")) == 1.0
+        assert model.sample(request_shape("search", MARENGO_30, 10, "clip")) == 0.1
+        # Unseen page_limit backs off to the group_by-level distribution
+        assert model.sample(request_shape("search", MARENGO_30, 25, "video")) == 1.0
+        # Unseen model backs off to the endpoint-wide distribution
+        pooled = model.distribution(request_shape("search", "marengo2.7", 10, "clip"))
+        assert len(pooled) == 60
+        assert model.sample(request_shape("search_page", MARENGO_30)) == 0.0
+
+    def test_samples_follow_recorded_distribution(self):
+        """Test sampled delays stay in the recorded range and match its median"""
+        rng = np.random.default_rng(0)
+        latencies = rng.lognormal(np.log(0.2), 0.5, 500).tolist()
+        model = LatencyModel.from_records(
+            _records("search", MARENGO_30, 10, "clip", latencies), seed=1
+        )
+        shape = request_shape("search", MARENGO_30, 10, "clip")
+
+        draws = np.array([model.sample(shape) for _ in range(2000)])
+
+        assert draws.min() >= min(latencies) and draws.max() <= max(latencies)
+        assert abs(np.median(draws) - np.median(latencies)) < 0.03
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test a model loads back from its saved form and from raw recordings"""
+        records = _records("search", MARENGO_30, 10, "clip", [0.1, 0.2, 0.3])
+        recordings = tmp_path / "latency.jsonl"
+        recordings.write_text("".join(json.dumps(r) + "\n" for r in records))
+        fitted = LatencyModel.load(str(recordings))
+        saved = tmp_path / "model.json"
+        fitted.save(str(saved))
+
+        loaded = LatencyModel.load(str(saved))
+        shape = request_shape("search", MARENGO_30, 10, "clip")
+        assert loaded.distribution(shape).tolist() == [0.1, 0.2, 0.3]
+        assert loaded.samples.keys() == fitted.samples.keys()
+
+    def test_recording_transport_tags_pages_with_search_shape(self, tmp_path):
+        """Test recorded page requests inherit the model and shape of their search"""
+        from twelvelabs import TwelveLabs
+
+        server = StandinServer.with_default_indexes()
+        path = tmp_path / "latency.jsonl"
+        transport = RecordingTransport(
+            server.transport(), str(path), {STANDIN_INDEX_MARENGO_30: MARENGO_30}
+        )
+        client = TwelveLabs(
+            api_key="standin",
+            base_url=STANDIN_BASE_URL,
+            httpx_client=httpx.Client(transport=transport),
+        )
+
+        pager = client.search.query(
+            index_id=STANDIN_INDEX_MARENGO_30,
+            query_text="water",
+            search_options=["visual"],
+            group_by="video",
+            page_limit=5,
+        )
+        pages = list(pager.iter_pages())
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(records) == len(pages) > 1
+        assert records[0]["endpoint"] == ENDPOINT_SEARCH
+        assert {r["endpoint"] for r in records[1:]} == {ENDPOINT_SEARCH_PAGE}
+        for record in records:
+            assert record["model"] == MARENGO_30
+            assert record["page_limit"] == 5
+            assert record["group_by"] == "video"
+            assert record["latency_s"] >= 0
+
+    def test_server_delays_responses(self):
+        """Test the stand-in delays each response by the sampled latency of its shape"""
+        model = LatencyModel(
+            {
+                (ENDPOINT_SEARCH, "*", "*", "*", "*"): [0.08],
+                (ENDPOINT_SEARCH_PAGE, "*", "*", "*", "*"): [0.02],
+            }
+        )
+        client = StandinServer.with_default_indexes(latency_model=model).make_client()
+
+        start = time.perf_counter()
+        pager = client.search.query(
+            index_id=STANDIN_INDEX_MARENGO_30,
+            query_text="water",
+            search_options=["visual"],
+            page_limit=5,
+        )
+        search_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        pager.next_page()
+        page_seconds = time.perf_counter() - start
+
+        assert search_seconds >= 0.08
+        assert 0.02 <= page_seconds < 0.08
+
+    def test_synthetic_model_is_heavy_tailed(self):
+        """Test the synthetic model's p99 is far above its median"""
+        model = LatencyModel.synthetic(median_s=0.1, tail_fraction=0.03)
+        shape = request_shape("search", MARENGO_30)
+
+        assert abs(model.percentile(shape, 50) - 0.1) < 0.02
+        assert model.percentile(shape, 99) > 4 * model.percentile(shape, 50)
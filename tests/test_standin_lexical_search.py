@@ -0,0 +1,79 @@
+"""
+Local stand-in lexical transcription search tests
+
+Validates the positional inverted index and BM25 scoring behind
+transcription_options=["lexical"].
+"""
+
+import numpy as np
+
+from standin import STANDIN_INDEX_MARENGO_30
+from standin.lexical import InvertedIndex
+
+DOCUMENTS = [
+    "the otter is swimming in the river",
+    "hello hello hello from the city",
+    "hello from the kitchen",
+    "the cat is swimming",
+    "a river otter and a cat",
+]
+
+
+class TestStandinLexicalSearch:
+    """Stand-in lexical transcription search tests"""
+
+    def test_postings_keep_positions(self):
+        """Test postings list documents and word positions for each term"""
+        index = InvertedIndex(DOCUMENTS)
+        postings = index.postings["otter"]
+
+        assert postings.doc_ids.tolist() == [0, 4]
+        assert postings.positions_of(0).tolist() == [1]
+        assert postings.positions_of(1).tolist() == [2]
+        assert index.postings["hello"].term_freqs.tolist() == [3, 1]
+
+    def test_bm25_prefers_frequent_and_rare_terms(self):
+        """Test BM25 ranks higher term frequency first and weighs rare terms more"""
+        index = InvertedIndex(DOCUMENTS)
+
+        scores = index.bm25(["hello"])
+        assert scores[1] > scores[2] > 0
+        assert scores[0] == 0
+        assert index.idf("kitchen") > index.idf("the")
+
+    def test_phrase_requires_consecutive_words(self):
+        """Test quoted phrases only match consecutive words"""
+        index = InvertedIndex(DOCUMENTS)
+
+        assert index.phrase_docs(["otter", "is"]).tolist() == [0]
+        assert index.phrase_docs(["river", "otter"]).tolist() == [4]
+        assert index.phrase_docs(["otter", "river"]).tolist() == []
+
+        ids, _ = index.search('"river otter"', 10)
+        assert ids.tolist() == [4]
+
+    def test_search_scores_are_normalized(self):
+        """Test lexical scores are in [0, 1), descending, and only for matching documents"""
+        index = InvertedIndex(DOCUMENTS)
+        ids, scores = index.search("swimming cat", 10)
+
+        assert set(ids.tolist()) == {0, 3, 4}
+        assert ids[0] == 3, "Document matching both words should rank first"
+        assert np.all((scores > 0) & (scores < 1))
+        assert np.all(np.diff(scores) <= 0)
+
+    def test_lexical_search_fills_transcription(self, standin_server):
+        """Test lexical transcription search returns matching transcriptions via the SDK"""
+        client = standin_server.make_client()
+        search_pager = client.search.query(
+            index_id=STANDIN_INDEX_MARENGO_30,
+            query_text="kitchen",
+            search_options=["transcription"],
+            transcription_options=["lexical"],
+            page_limit=50,
+        )
+
+        results = list(search_pager)
+        assert len(results) > 0
+        assert all("kitchen" in item.transcription.lower() for item in results)
+        assert [item.rank for item in results] == list(range(1, len(results) + 1))
@@ -0,0 +1,117 @@
+"""
+Local stand-in vector search tests
+
+Validates the stand-in's top-k engines and modality merging, so that offline runs
+(pytest --standin) exercise real ranking behavior instead of canned results.
+"""
+
+import numpy as np
+import pytest
+
+from standin import (
+    STANDIN_INDEX_MARENGO_30,
+    VectorIndex,
+    build_corpus,
+    merge_modalities,
+)
+from standin.vector import top_k
+
+
+def _random_unit_vectors(count, dim, seed):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestStandinVectorSearch:
+    """Stand-in vector search tests"""
+
+    def test_top_k_orders_best_first(self):
+        """Test top_k returns the k best indices in descending score order"""
+        scores = np.array([0.1, 0.9, 0.5, 0.9, 0.3], dtype=np.float32)
+
+        assert top_k(scores, 3).tolist() == [1, 3, 2]
+        assert top_k(scores, 10).tolist() == [1, 3, 2, 4, 0]
+        assert top_k(scores, 0).tolist() == []
+
+    def test_brute_force_matches_exhaustive_sort(self):
+        """Test brute-force search returns exactly the exhaustive top-k"""
+        vectors = _random_unit_vectors(2000, 32, seed=1)
+        query = vectors[42]
+        index = VectorIndex(vectors)
+
+        ids, scores = index.search(query, 10)
+
+        expected = np.argsort(-(vectors @ query), kind="stable")[:10]
+        assert not index.is_ivf
+        assert ids.tolist() == expected.tolist()
+        assert ids[0] == 42
+        assert np.all(np.diff(scores) <= 0), "Scores should descend"
+
+    def test_ivf_recall_against_brute_force(self):
+        """Test IVF search finds most of the exact top-k on clustered data"""
+        corpus = build_corpus(num_videos=1500, dim=32, seed=3, transcripts=False)
+        vectors = corpus.vectors["visual"]
+        brute = VectorIndex(vectors)
+        ivf = VectorIndex(vectors, nlist=64, nprobe=8)
+        assert ivf.is_ivf
+
+        recalls = []
+        for text in ["water", "otter swimming", "cat", "man fall", "music crowd"]:
+            query = corpus.embedder.embed_text(text)
+            exact, _ = brute.search(query, 20)
+            approx, _ = ivf.search(query, 20)
+            recalls.append(len(set(exact.tolist()) & set(approx.tolist())) / 20)
+
+        assert np.mean(recalls) >= 0.8, f"IVF recall too low: {np.mean(recalls):.2f}"
+
+    def test_min_score_drops_weak_hits(self):
+        """Test min_score removes hits below the similarity threshold"""
+        vectors = _random_unit_vectors(500, 16, seed=5)
+        ids, scores = VectorIndex(vectors).search(vectors[0], 500, min_score=0.3)
+
+        assert len(ids) < 500
+        assert np.all(scores >= 0.3)
+
+    def test_merge_modalities_operator(self):
+        """Test 'or' unions modalities by best score and 'and' intersects them"""
+        visual = (np.array([1, 2, 3]), np.array([0.9, 0.5, 0.4], dtype=np.float32))
+        audio = (np.array([3, 4]), np.array([0.8, 0.6], dtype=np.float32))
+
+        or_ids, or_scores = merge_modalities([visual, audio], "or")
+        and_ids, and_scores = merge_modalities([visual, audio], "and")
+
+        assert or_ids.tolist() == [1, 3, 4, 2]
+        assert or_scores.tolist() == pytest.approx([0.9, 0.8, 0.6, 0.5])
+        assert and_ids.tolist() == [3]
+        assert and_scores.tolist() == pytest.approx([0.6])
+
+    def test_query_ranks_matching_topic_first(self, standin_server):
+        """Test a topical query ranks clips of that topic at the top"""
+        client = standin_server.make_client()
+        search_pager = client.search.query(
+            index_id=STANDIN_INDEX_MARENGO_30,
+            query_text="otter swimming in the river",
+            search_options=["visual"],
+            group_by="video",
+            include_user_metadata=True,
+            page_limit=5,
+        )
+
+        categories = [item.user_metadata["category"] for item in search_pager.items]
+        assert categories.count("nature") >= 4, f"Top videos: {categories}"
+
+    def test_ranks_are_contiguous_across_pages(self, standin_server):
+        """Test Marengo 3.0 ranks continue from page to page without gaps"""
+        client = standin_server.make_client()
+        search_pager = client.search.query(
+            index_id=STANDIN_INDEX_MARENGO_30,
+            query_text="water",
+            search_options=["visual", "audio"],
+            page_limit=7,
+        )
+
+        ranks = [item.rank for item in search_pager]
+
+        assert len(ranks) > 7, "Query should span several pages"
+        assert ranks == list(range(1, len(ranks) + 1))